@@ -0,0 +1,60 @@
+"""
+Release benchmark run for input-monitor.
+
+Runs every input_monitor.bench scenario against the headless stub UI, and
+against the real Tk widget when a display is available, then writes the
+results to benchmarks/results-<version>.json. Pass the results file of the
+previously released version with --baseline to fail on throughput
+regressions.
+
+Usage (from the repo root):
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --baseline benchmarks/results-1.0.0.json
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from input_monitor import bench  # noqa: E402
+from input_monitor.version import VERSION  # noqa: E402
+
+
+def have_display():
+    if sys.platform == 'win32':
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the release benchmark suite.')
+    parser.add_argument('-n', '--events', type=int, default=50000, help='events per scenario')
+    parser.add_argument('--baseline', metavar='FILE', help='results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed throughput drop against --baseline (default: 0.2)')
+    args = parser.parse_args()
+
+    uis = ['stub', 'tk'] if have_display() else ['stub']
+    results = [bench.run_scenario(name, args.events, ui) for ui in uis for name in bench.SCENARIOS]
+    print(bench.format_table(results))
+
+    output = os.path.join(ROOT, 'benchmarks', f'results-{VERSION}.json')
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nWrote {output}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = bench.compare(results, json.load(f), args.tolerance)
+        for message in failures:
+            print(f'REGRESSION: {message}', file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,6 +4,14 @@ This package exposes a simple API and a command line entry point.
 """
 
 from .version import VERSION as __version__  # reexport for consumers
-from . import app as app  # re-export the app module for convenience
 
-__all__ = ["__version__", "app"]
+__all__ = ["__version__", "app", "engine"]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access so headless users (e.g. of
+    # input_monitor.engine) don't need the GUI and hook libraries installed
+    if name in ("app", "engine"):
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
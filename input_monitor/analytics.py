@@ -0,0 +1,275 @@
+"""Streaming session statistics in constant memory.
+
+``SessionAnalytics`` subscribes to the input engine and keeps:
+
+    counters        key presses, autorepeats, clicks and double clicks per
+                    button, scroll notches, selections, lock-key toggles
+    modifiers       how often each modifier was part of a shortcut
+    top shortcuts   a Space-Saving sketch of the most used shortcuts
+    rates           key presses and clicks over the last minute, and the
+                    busiest minute so far
+
+Each intent is handled in O(1) and nothing grows with the session, so the
+statistics can run for days and be read at any time with ``summary()``.
+Rates follow event timestamps, so a replayed session at any speed reports
+the rates it was recorded with.
+"""
+import array
+import json
+
+from . import engine
+from .chord import PARTIAL_SUFFIX
+from .shortcuts import MODIFIER_ORDER
+
+
+class TopK:
+    """Approximate most frequent items of a stream (Space-Saving).
+
+    At most ``capacity`` items are tracked. An untracked item takes the
+    place of one with the lowest count and inherits that count, which is
+    kept as its possible overestimate; any item making up more than
+    1/``capacity`` of the stream is guaranteed to be tracked. Items with the
+    same count share a bucket, so every update is O(1).
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.total = 0
+        self._counts = {}
+        self._errors = {}
+        # count -> items with that count, oldest first
+        self._buckets = {}
+        self._min = 0
+
+    def __len__(self):
+        return len(self._counts)
+
+    def add(self, item):
+        self.total += 1
+        counts = self._counts
+        count = counts.get(item)
+        if count is not None:
+            self._unbucket(item, count)
+        elif len(counts) < self.capacity:
+            count = 0
+            self._errors[item] = 0
+            self._min = 1
+        else:
+            count = self._min
+            evicted = next(iter(self._buckets[count]))
+            self._unbucket(evicted, count)
+            del counts[evicted]
+            del self._errors[evicted]
+            self._errors[item] = count
+        count += 1
+        counts[item] = count
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            bucket = self._buckets[count] = {}
+        bucket[item] = None
+
+    def _unbucket(self, item, count):
+        bucket = self._buckets[count]
+        del bucket[item]
+        if not bucket:
+            del self._buckets[count]
+            if count == self._min:
+                # The item moves to count + 1, so that is the new minimum
+                self._min = count + 1
+
+    def most_common(self, n=10):
+        """Up to ``n`` (item, count, overestimate) tuples, most frequent first."""
+        ranked = sorted(self._counts.items(), key=lambda entry: -entry[1])[:n]
+        return [(item, count, self._errors[item]) for item, count in ranked]
+
+
+class WindowRate:
+    """Events per minute over a sliding window of one-second slots."""
+
+    def __init__(self, window_s=60):
+        self.window = window_s
+        self.total = 0
+        # Most events in one window so far
+        self.peak = 0
+        self._slots = array.array('L', [0]) * window_s
+        self._second = None
+        self._in_window = 0
+
+    def add(self, t, n=1):
+        self._advance(int(t))
+        self._slots[self._second % self.window] += n
+        self._in_window += n
+        self.total += n
+        if self._in_window > self.peak:
+            self.peak = self._in_window
+
+    def _advance(self, second):
+        last = self._second
+        if last is None:
+            self._second = second
+            return
+        if second <= last:
+            # Out of order by less than a slot; counted in the current one
+            return
+        slots = self._slots
+        window = self.window
+        # Clear the slots that fell out of the window, at most all of them
+        for s in range(last + 1, last + 1 + min(second - last, window)):
+            self._in_window -= slots[s % window]
+            slots[s % window] = 0
+        self._second = second
+
+    def per_minute(self, t=None):
+        """Rate over the window ending at ``t`` (default: the latest event)."""
+        if t is not None:
+            self._advance(int(t))
+        return self._in_window * 60 / self.window
+
+    def peak_per_minute(self):
+        return self.peak * 60 / self.window
+
+
+class SessionAnalytics:
+    """Usage statistics of one session, updated from engine intents."""
+
+    TOP_CAPACITY = 64
+    BUTTONS = ('left', 'middle', 'right')
+
+    def __init__(self, top_capacity=None):
+        self.keys = 0
+        self.autorepeats = 0
+        self.clicks = dict.fromkeys(self.BUTTONS, 0)
+        self.double_clicks = dict.fromkeys(self.BUTTONS, 0)
+        self.scroll_notches = 0
+        self.selections = 0
+        self.lock_toggles = 0
+        self.modifiers = dict.fromkeys(MODIFIER_ORDER, 0)
+        self.shortcuts = TopK(top_capacity or self.TOP_CAPACITY)
+        self.key_rate = WindowRate()
+        self.click_rate = WindowRate()
+        self.first_time = None
+        self.last_time = None
+        self._engine = None
+        # SHOW intents right after CLICK or SELECTED describe those, not keys
+        self._skip_show = False
+        self._repeat_count = 1
+        self._scroll = (None, 0)
+
+    def attach(self, input_engine):
+        """Subscribe to ``input_engine`` intents."""
+        self._engine = input_engine
+        input_engine.subscribe(self.on_intent)
+        return self
+
+    def on_intent(self, intent):
+        kind = intent[0]
+        if kind == engine.MOUSE or kind == engine.SELECTION:
+            return
+        if kind == engine.SHOW:
+            if self._skip_show:
+                self._skip_show = False
+            elif not intent[1].endswith(PARTIAL_SUFFIX):
+                self._key(intent[1], None)
+        elif kind == engine.SHORTCUT:
+            self._key(intent[1], intent[3])
+        elif kind == engine.REPEAT:
+            # Counts restart with each press; only the new repeats are added
+            self.autorepeats += max(0, intent[3] - self._repeat_count)
+            self._repeat_count = intent[3]
+        elif kind == engine.CLICK:
+            self._skip_show = True
+            t = self._time()
+            button = intent[3]
+            if button in self.clicks:
+                self.clicks[button] += 1
+                if intent[4]:
+                    self.double_clicks[button] += 1
+            self.click_rate.add(t)
+        elif kind == engine.SCROLL:
+            self._time()
+            text, count = intent[1], intent[2]
+            previous_text, previous_count = self._scroll
+            if text == previous_text and count >= previous_count:
+                # Each intent carries the notches of its run so far
+                count -= previous_count
+            self.scroll_notches += count
+            self._scroll = (text, intent[2])
+        elif kind == engine.SELECTED:
+            self._skip_show = True
+            self.selections += 1
+        elif kind == engine.LED:
+            self.lock_toggles += 1
+
+    def _time(self):
+        t = self._engine.event_time if self._engine is not None else 0
+        if self.first_time is None:
+            self.first_time = t
+        self.last_time = t
+        return t
+
+    def _key(self, text, action):
+        t = self._time()
+        self.keys += 1
+        self._repeat_count = 1
+        self.key_rate.add(t)
+        if self._engine is None:
+            return
+        held = self._engine.chord.held_modifiers
+        if not held:
+            if action is not None:
+                self.shortcuts.add((text, action))
+            return
+        if action is None and len(held) == 1 and 'Shift' in held and len(text.rsplit(' + ', 1)[1]) == 1:
+            # A capital letter or symbol, not a shortcut
+            return
+        for modifier in held:
+            self.modifiers[modifier] += 1
+        self.shortcuts.add((text, action))
+
+    def summary(self, now=None, top=10):
+        """Current statistics as a JSON-serializable dict."""
+        duration = (self.last_time - self.first_time) if self.first_time is not None else 0
+        return {
+            'duration_s': duration,
+            'keys': self.keys,
+            'autorepeats': self.autorepeats,
+            'keys_per_min': self.key_rate.per_minute(now),
+            'peak_keys_per_min': self.key_rate.peak_per_minute(),
+            'clicks': dict(self.clicks),
+            'double_clicks': dict(self.double_clicks),
+            'clicks_per_min': self.click_rate.per_minute(now),
+            'peak_clicks_per_min': self.click_rate.peak_per_minute(),
+            'scroll_notches': self.scroll_notches,
+            'selections': self.selections,
+            'lock_toggles': self.lock_toggles,
+            'modifiers': dict(self.modifiers),
+            'shortcuts_total': self.shortcuts.total,
+            'top_shortcuts': [{'keys': text, 'action': action, 'count': count, 'overestimate': error}
+                              for (text, action), count, error in self.shortcuts.most_common(top)],
+        }
+
+    def format_report(self, top=10):
+        """Plain text report of the session."""
+        s = self.summary(top=top)
+        lines = [
+            f"session {s['duration_s'] / 60:.1f} min",
+            f"keys {s['keys']}  autorepeats {s['autorepeats']}  "
+            f"{s['keys_per_min']:.0f}/min (peak {s['peak_keys_per_min']:.0f}/min)",
+            "clicks " + '  '.join(f"{button} {count}" for button, count in s['clicks'].items()) +
+            f"  double {sum(s['double_clicks'].values())}  "
+            f"{s['clicks_per_min']:.0f}/min (peak {s['peak_clicks_per_min']:.0f}/min)",
+            f"scroll notches {s['scroll_notches']}  selections {s['selections']}  "
+            f"lock toggles {s['lock_toggles']}",
+            "modifiers " + '  '.join(f"{modifier} {count}" for modifier, count in s['modifiers'].items()),
+        ]
+        if s['top_shortcuts']:
+            lines.append(f"top shortcuts (of {s['shortcuts_total']})")
+            for entry in s['top_shortcuts']:
+                action = f"  {entry['action']}" if entry['action'] else ''
+                lines.append(f"  {entry['count']:>7}  {entry['keys']}{action}")
+        return '\n'.join(lines)
+
+    def dump(self, path, top=50):
+        """Write ``summary()`` as JSON to ``path``."""
+        with open(path, 'w') as f:
+            json.dump(self.summary(top=top), f, indent=2)
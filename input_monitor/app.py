@@ -6,15 +6,25 @@ License : GPL-3.0-or-later (GNU General Public License v3)
 Date    : 09-Sep-2025
 
 """
+# Imported first so --profile-startup measures from here
+from . import startup
+import argparse
+import sys
 import tkinter as tk
 import tkinter.font as tkfont
-import os
 import time
-import sys
-from pynput import mouse
-import keyboard as kb
 import threading
-import re
+from . import events
+from .render import RenderScheduler
+from .scheduler import Scheduler
+from . import engine
+from .engine import InputEngine
+from .display import CanvasDisplay
+from .icons import ICON_FILES, IconCache, display_scale
+from .replay import parse_speed
+# The hook libraries (pynput, keyboard), LED access (ctypes/X11) and the
+# modules behind optional features are imported where they are first used,
+# so the window can appear before they load
 
 class InputMonitorWidget:
     # UI Configuration
@@ -34,12 +44,31 @@ class InputMonitorWidget:
     
     # Timing
     RESET_DELAY_MS = 2000
-    DOUBLE_CLICK_THRESHOLD = 0.5
-    DOUBLE_CLICK_POSITION_TOLERANCE = 5
     
-    # Mouse tracking
-    MOUSE_UPDATE_THRESHOLD = 5
-    SELECTION_MIN_SIZE = 5
+    # Event hand-off from listener threads; while no input arrives the poll
+    # stops where listener threads can wake the Tk loop, and elsewhere slows
+    # down to EVENT_IDLE_POLL_MS, the most the first input after a pause waits
+    EVENT_POLL_MS = 15
+    EVENT_IDLE_POLL_MS = 120
+    EVENT_QUEUE_SIZE = 4096
+    
+    # Rendering of high-rate fields (mouse, selection, window drag)
+    RENDER_FPS = 60
+    
+    # Redraw the mouse line this long after the pointer stops, to clear its speed
+    MOTION_IDLE_MS = 150
+    
+    # Main display area
+    DISPLAY_HEIGHT = 64
+    
+    # Recent input list (--history)
+    HISTORY_COLOR = '#00cc00'
+    
+    # Latency and usage stats panel (toggled with a right click)
+    STATS_REFRESH_MS = 500
+    
+    # Input sources start after the first paint, or after this long at the latest
+    STARTUP_FALLBACK_MS = 500
     
     # Icon sizes
     WIN_ICON_SIZE = 26
@@ -50,14 +79,15 @@ class InputMonitorWidget:
     LED_COLOR_OFF = '#1a1a1a'
     LED_COLOR_ON = '#00ff00'
     
-    # Linux scan codes for Win/Meta keys
-    WIN_SCAN_CODES = {125, 126}
-    
-    # Modifier keys
-    MODIFIERS = {'Ctrl', 'Alt', 'Shift', 'Win'}
-    
-    def __init__(self, root):
+    def __init__(self, root, listen=True, recorder=None, latency=None, backend='hooks', profile=None,
+                 history=0, analytics=None):
         self.root = root
+        self.listen = listen
+        self.input_backend = backend
+        self.profile = profile
+        self.recorder = recorder
+        self.latency = latency
+        self.analytics = analytics
         self.root.title("Input Monitor")
         
         # Make window borderless and topmost
@@ -77,6 +107,19 @@ class InputMonitorWidget:
         # Initialize state variables
         self._init_state_variables()
         
+        # Display reset and other deadlines share one timer; polls back off while idle
+        self.scheduler = Scheduler(self.root)
+        
+        # Headless input state; this widget only renders its display intents
+        self.engine = InputEngine()
+        self.engine.subscribe(self._on_intent)
+        if self.recorder is not None:
+            self.engine.subscribe(self._record_intent)
+        
+        # Frame-capped renderer for fields updated at input rate
+        self.renderer = RenderScheduler(self.root, self.RENDER_FPS)
+        self.renderer.register('window_pos', self._render_window_pos)
+        
         # Create UI elements
         self.frame = tk.Frame(root, bg=self.BG_COLOR, highlightbackground=self.BORDER_COLOR, highlightthickness=1)
         self.frame.pack(fill=tk.BOTH, expand=True)
@@ -84,45 +127,45 @@ class InputMonitorWidget:
         # Setup UI components
         self._setup_title()
         self._setup_input_display()
+        self.history = None
+        if history:
+            self._setup_history_display(history)
         self._setup_mouse_display()
         self._setup_selection_display()
         self._setup_led_display()
         self._setup_close_button()
-        
-        # Setup event listeners
-        self._setup_listeners()
+        if self.latency is not None or self.analytics is not None:
+            self._setup_stats_display()
         
         # Load icons
         self._load_icons()
+        
+        # Hooks, LEDs and icon images are brought up once the window is on screen
+        self.frame.bind('<Expose>', self._on_first_expose)
+        self.scheduler.at('startup', self.STARTUP_FALLBACK_MS, self._start_input)
+        if self.profile is not None:
+            self.profile.mark('window built')
     
     def _init_state_variables(self):
         """Initialize all state tracking variables."""
         # Dragging
         self._drag_start_x = 0
         self._drag_start_y = 0
-        
-        # Keyboard state
-        self.current_keys = set()
-        self.key_press_order = []
-        
-        # Click tracking
-        self.last_click_time = 0
-        self.last_click_pos = (0, 0)
-        self.last_click_button = None
-        self.reset_job = None
-        
-        # Mouse tracking
-        self.last_mouse_x = 0
-        self.last_mouse_y = 0
-        self.mouse_update_counter = 0
-        
-        # Selection tracking
-        self.selection_start = None
-        self.selection_end = None
-        self.is_selecting = False
-        
-        # Inline UI children
-        self._inline_children = []
+        self._drag_origin_x = 0
+        self._drag_origin_y = 0
+        
+        # Display reset
+        self._displayed = None
+        
+        # Events queued by listener threads, drained on the Tk thread
+        self.event_queue = events.EventQueue(self.EVENT_QUEUE_SIZE)
+        self.mouse_listener = None
+        self.evdev = None
+        self.hook_process = None
+        self.led_monitor = None
+        self._led_backend = None
+        self._loader = None
+        self._load_error = None
     
     def _setup_title(self):
         """Create the title label."""
@@ -137,39 +180,54 @@ class InputMonitorWidget:
     
     def _setup_input_display(self):
         """Create the input and icon display area."""
-        self.display_frame = tk.Frame(self.frame, bg=self.BG_COLOR)
-        self.display_frame.pack(pady=2, padx=10, fill=tk.X)
-        
-        # Use a center_frame gridded into a 3-column layout to center contents
-        self.display_frame.columnconfigure(0, weight=1)
-        self.display_frame.columnconfigure(1, weight=0)
-        self.display_frame.columnconfigure(2, weight=1)
-        self.center_frame = tk.Frame(self.display_frame, bg=self.BG_COLOR)
-        self.center_frame.grid(row=0, column=1)
-
         # Named fonts for consistent usage across labels
         self.font_input = tkfont.Font(family='Consolas', size=20)
         self.font_mouse = tkfont.Font(family='Consolas', size=10)
         self.font_selection = tkfont.Font(family='Consolas', size=14)
+        self.font_caption = tkfont.Font(family='Consolas', size=11)
+        self.font_history = tkfont.Font(family='Consolas', size=11)
         self.font_time = tkfont.Font(family='Arial', size=8)
-
-        # Icon label for event/keys
-        self.icon_label = tk.Label(self.center_frame, bg=self.BG_COLOR)
-        self.icon_label.pack(side=tk.LEFT, padx=(0, 6))
-
-        # Input display
-        self.input_label = tk.Label(
-            self.center_frame,
-            text="", 
-            bg=self.BG_COLOR, 
-            fg=self.INPUT_COLOR,
+        
+        # Icons come in DPI variants; the display area grows with them
+        self.icon_scale = display_scale(self.root)
+        
+        # Text and icons are drawn as reusable items on a single canvas
+        self.display_canvas = tk.Canvas(
+            self.frame,
+            width=self.width-22,
+            height=int(self.DISPLAY_HEIGHT * self.icon_scale),
+            bg=self.BG_COLOR,
+            highlightthickness=0
+        )
+        self.display_canvas.pack(pady=2, padx=10, fill=tk.X)
+        self.display = CanvasDisplay(
+            self.display_canvas,
             font=self.font_input,
-            wraplength=self.width-20
+            color=self.INPUT_COLOR,
+            wraplength=self.width-22,
+            caption_font=self.font_caption,
+            caption_color=self.TEXT_COLOR
         )
-        self.input_label.pack(side=tk.LEFT, pady=2)
-        
-        # Inline composition frame allows placing icons inline with text
-        self.inline_frame = tk.Frame(self.center_frame, bg=self.BG_COLOR)
+        self.renderer.register('repeat', self._render_repeat)
+        self.renderer.register('scroll', self._render_scroll)
+    
+    def _setup_history_display(self, size):
+        """Create the list of the last ``size`` inputs under the main display."""
+        from .history import HistoryStrip
+        height = size * self.font_history.metrics('linespace')
+        self.history_canvas = tk.Canvas(
+            self.frame,
+            width=self.width-22,
+            height=height,
+            bg=self.BG_COLOR,
+            highlightthickness=0
+        )
+        self.history_canvas.pack(pady=2, padx=10, fill=tk.X)
+        self.history = HistoryStrip(self.history_canvas, size, self.font_history,
+                                    self.HISTORY_COLOR, self.BG_COLOR)
+        # The window grows to fit the list
+        self.height += height + 4
+        self.root.geometry(f"{self.width}x{self.height}")
     
     def _setup_mouse_display(self):
         """Create the mouse position display."""
@@ -178,12 +236,13 @@ class InputMonitorWidget:
         
         self.mouse_label = tk.Label(
             self.mouse_frame,
-            text="X: 0, Y: 0 | ΔX: 0, ΔY: 0",
+            text="X: 0, Y: 0 | ΔX: 0, ΔY: 0 | 0 px/s",
             bg=self.BG_COLOR,
             fg=self.MOUSE_COLOR,
             font=self.font_mouse
         )
         self.mouse_label.pack(side=tk.LEFT)
+        self.renderer.register('mouse', self._render_mouse)
     
     def _setup_selection_display(self):
         """Create the selection area display."""
@@ -198,6 +257,7 @@ class InputMonitorWidget:
             font=self.font_mouse
         )
         self.selection_label.pack(side=tk.LEFT)
+        self.renderer.register('selection', self._render_selection)
     
     def _setup_led_display(self):
         """Create the LED status indicators for keyboard locks."""
@@ -245,75 +305,12 @@ class InputMonitorWidget:
                 font=('Arial', 10)
             )
             label.pack()
-        
-        # Start monitoring LED states
-        self._update_led_states()
     
-    def _update_led_states(self):
-        """Update LED indicators based on keyboard lock states."""
-        try:
-            import ctypes
-            import ctypes.util
-            
-            # Windows implementation
-            if sys.platform == 'win32':
-                try:
-                    # Virtual key codes for lock keys
-                    VK_CAPITAL = 0x14  # Caps Lock
-                    VK_NUMLOCK = 0x90  # Num Lock
-                    VK_SCROLL = 0x91   # Scroll Lock
-                    
-                    # GetKeyState returns the status of the specified virtual key
-                    # The low-order bit indicates whether the key is toggled (on/off)
-                    user32 = ctypes.windll.user32
-                    
-                    caps_on = bool(user32.GetKeyState(VK_CAPITAL) & 0x0001)
-                    num_on = bool(user32.GetKeyState(VK_NUMLOCK) & 0x0001)
-                    scroll_on = bool(user32.GetKeyState(VK_SCROLL) & 0x0001)
-                    
-                    # Update LEDs
-                    self._set_led_state('caps_lock', caps_on)
-                    self._set_led_state('num_lock', num_on)
-                    self._set_led_state('scroll_lock', scroll_on)
-                except Exception:
-                    pass
-            
-            # Linux implementation using X11
-            elif sys.platform.startswith('linux'):
-                try:
-                    # Load X11 library
-                    x11 = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11'))
-                    display = x11.XOpenDisplay(None)
-                    
-                    if display:
-                        # Get keyboard state
-                        keys = (ctypes.c_char * 32)()
-                        x11.XQueryKeymap(display, keys)
-                        
-                        # XkbGetIndicatorState for LED states
-                        xkb = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11'))
-                        state = ctypes.c_uint()
-                        xkb.XkbGetIndicatorState(display, 0x100, ctypes.byref(state))
-                        
-                        # Extract LED states (bits 0, 1, 2 for Caps, Num, Scroll)
-                        caps_on = bool(state.value & 0x01)
-                        num_on = bool(state.value & 0x02)
-                        scroll_on = bool(state.value & 0x04)
-                        
-                        # Update LEDs
-                        self._set_led_state('num_lock', num_on)
-                        self._set_led_state('caps_lock', caps_on)
-                        self._set_led_state('scroll_lock', scroll_on)
-                        
-                        x11.XCloseDisplay(display)
-                except Exception:
-                    pass
-            
-        except Exception:
-            pass
-        
-        # Schedule next update
-        self.root.after(100, self._update_led_states)
+    def _on_led_change(self, led_id, is_on):
+        """LED monitor callback: record the change and pass it to the engine."""
+        if self.recorder is not None:
+            self.recorder.put((events.LED_CHANGE, time.time(), led_id, is_on))
+        self.engine.led_changed(led_id, is_on)
     
     def _set_led_state(self, led_id, is_on):
         """Set the visual state of an LED indicator."""
@@ -343,80 +340,251 @@ class InputMonitorWidget:
         self.root.bind("<ButtonRelease-1>", self.stop_drag)
         self.root.bind("<B1-Motion>", self.on_drag)
     
+    def _setup_stats_display(self):
+        """Create the latency and usage stats panel, hidden until toggled."""
+        self.stats_label = tk.Label(
+            self.frame,
+            bg=self.BG_COLOR,
+            fg=self.TIME_COLOR,
+            font=self.font_mouse,
+            justify=tk.LEFT
+        )
+        self.stats_job = None
+        self._stats_wakeups = 0
+        self.root.bind("<ButtonPress-3>", self.toggle_stats)
+    
+    def toggle_stats(self, event=None):
+        """Show or hide the stats panel."""
+        if self.stats_job is None:
+            self._refresh_stats()
+            self.stats_label.pack(pady=2, padx=10, fill=tk.X)
+            height = self.height + self.stats_label.winfo_reqheight()
+        else:
+            self.root.after_cancel(self.stats_job)
+            self.stats_job = None
+            self.stats_label.pack_forget()
+            height = self.height
+        self.root.geometry(f"{self.width}x{height}")
+    
+    def _refresh_stats(self):
+        """Redraw the stats panel and schedule the next refresh."""
+        lines = []
+        if self.latency is not None:
+            for stage, hist in self.latency.histograms.items():
+                lines.append(f"{stage:<10} p50 {hist.percentile(0.5) * 1000:5.1f}"
+                             f"  p99 {hist.percentile(0.99) * 1000:5.1f}  max {hist.max * 1000:6.1f} ms")
+        if self.analytics is not None:
+            lines.extend(self._analytics_lines())
+        motion = self.engine.motion
+        lines.append(f"peak {motion.peak_speed:,.0f} px/s  distance {motion.distance:,.0f} px")
+        dropped = self.event_queue.dropped
+        if self.hook_process is not None:
+            dropped += self.hook_process.dropped
+        lines.append(f"queued {len(self.event_queue)}  dropped {dropped}")
+        wakeups = self.scheduler.wakeups
+        rate = (wakeups - self._stats_wakeups) * 1000 / self.STATS_REFRESH_MS
+        self._stats_wakeups = wakeups
+        lines.append(f"timer wakeups {rate:.0f}/s")
+        self.stats_label.config(text='\n'.join(lines))
+        self.stats_job = self.root.after(self.STATS_REFRESH_MS, self._refresh_stats)
+    
+    def _analytics_lines(self):
+        """Live usage figures for the stats panel."""
+        analytics = self.analytics
+        # Replayed events carry recorded times; rate them up to the latest one
+        now = time.time() if self.listen else None
+        clicks = analytics.clicks
+        lines = [f"keys {analytics.keys}  {analytics.key_rate.per_minute(now):.0f}/min"
+                 f"  clicks {clicks['left']}/{clicks['middle']}/{clicks['right']}"
+                 f"  {analytics.click_rate.per_minute(now):.0f}/min"]
+        top = analytics.shortcuts.most_common(3)
+        if top:
+            lines.append("top " + ', '.join(f"{text} ×{count}" for (text, _), count, _ in top))
+        return lines
+    
+    def _on_first_expose(self, event):
+        self.frame.unbind('<Expose>')
+        # Runs after Tk's pending redraws, i.e. once the window is painted
+        self.root.after_idle(self._first_paint)
+    
+    def _first_paint(self):
+        if self.profile is not None:
+            self.profile.mark('first paint')
+        self._start_input()
+    
+    def _start_input(self):
+        """Bring up input sources and icons now that the window is shown."""
+        if not self.scheduler.pending('startup'):
+            # Already started (first paint and the fallback both call this)
+            return
+        self.scheduler.cancel('startup')
+        # Slow imports and the LED backend load off the Tk thread
+        self._loader = threading.Thread(target=self._load_input_modules, name='input-loader', daemon=True)
+        self._loader.start()
+        self.root.after(self.EVENT_POLL_MS, self._await_input_modules)
+    
+    def _load_input_modules(self):
+        """Loader thread: import the input backend and icon data, open the LED backend."""
+        from . import icon_data  # noqa: F401
+        if not self.listen:
+            return
+        try:
+            if self.input_backend == 'process':
+                from . import hookproc  # noqa: F401
+            elif self.input_backend == 'evdev':
+                from . import evdev  # noqa: F401
+            else:
+                import keyboard  # noqa: F401
+                from pynput import mouse  # noqa: F401
+        except Exception as e:
+            self._load_error = e
+        from . import leds
+        self._led_backend = leds.create_backend()
+        if self.profile is not None:
+            self.profile.mark('input modules loaded')
+    
+    def _await_input_modules(self):
+        if self._loader.is_alive():
+            self.root.after(self.EVENT_POLL_MS, self._await_input_modules)
+            return
+        self._loader = None
+        if self.listen:
+            if self._load_error is not None:
+                print(f"input hooks unavailable: {self._load_error}", file=sys.stderr)
+            else:
+                self._setup_listeners()
+                if self.profile is not None:
+                    self.profile.mark('hooks active')
+            from . import leds
+            self.led_monitor = leds.LedMonitor(self.root, self._on_led_change, self._led_backend,
+                                               scheduler=self.scheduler)
+            if self._led_backend is not None:
+                self.led_monitor.start()
+            if self.profile is not None:
+                self.profile.mark('LEDs active')
+        self._preload_icons()
+        if self.profile is not None:
+            self.profile.report()
+    
     def _setup_listeners(self):
         """Setup keyboard and mouse event listeners."""
+        # Listener callbacks only enqueue; the Tk thread processes in batches.
+        # Where nothing can wake the loop (Windows, the hook process) the poll
+        # backs off to EVENT_IDLE_POLL_MS instead of stopping.
+        stops = self.scheduler.can_wake and self.input_backend != 'process'
+        self.scheduler.poll('events', self._process_events, self.EVENT_POLL_MS,
+                            None if stops else self.EVENT_IDLE_POLL_MS, wakeable=True)
+        
+        if self.input_backend == 'evdev' and self._setup_evdev():
+            return
+        if self.input_backend == 'process':
+            # Hooks run in a child process and are read from shared memory
+            from .hookproc import HookProcess
+            self.hook_process = HookProcess()
+            self.hook_process.start()
+            return
+        
         # Keyboard events using keyboard library
         self.keyboard_thread = threading.Thread(target=self._keyboard_listener, daemon=True)
         self.keyboard_thread.start()
         
         # Mouse events
+        from pynput import mouse
         self.mouse_listener = mouse.Listener(
-            on_move=self.on_mouse_move,
-            on_click=self.on_mouse_click
+            on_move=self._queue_mouse_move,
+            on_click=self._queue_mouse_click,
+            on_scroll=self._queue_mouse_scroll
         )
         self.mouse_listener.start()
     
-    def _load_icons(self):
-        """Load image icons from the images directory if available."""
+    def _setup_evdev(self):
+        """Read keyboards and mice from /dev/input on one thread (Linux)."""
+        from . import evdev
+        publish = self._publish if self.latency is None else self._publish_timed
         try:
-            base_dir = self._get_icons_directory()
-            
-            # Load icon files
-            icon_files = {
-                'win': 'windows-10-logo.png',
-                'left': 'mouse-left-click.png',
-                'right': 'mouse-right-click.png',
-                'middle': 'mouse-middle-click.png'
-            }
-            
-            icons = {}
-            for key, filename in icon_files.items():
-                path = os.path.join(base_dir, filename)
-                icons[key] = tk.PhotoImage(file=path) if os.path.isfile(path) else None
-            
-            # Scale icons to target sizes
-            self.win_icon = self._scale_icon(icons['win'], self.WIN_ICON_SIZE)
-            self.left_icon = self._scale_icon(icons['left'], self.MOUSE_ICON_SIZE)
-            self.right_icon = self._scale_icon(icons['right'], self.MOUSE_ICON_SIZE)
-            self.middle_icon = self._scale_icon(icons['middle'], self.MOUSE_ICON_SIZE)
-            self.win_icon_inline = self.win_icon
-        except Exception:
-            # If any error occurs, simply don't use icons
-            self.win_icon = None
-            self.left_icon = None
-            self.right_icon = None
-            self.middle_icon = None
-    
-    def _get_icons_directory(self):
-        """Get the directory containing icon images."""
-        if getattr(sys, '_MEIPASS', None):
-            return os.path.join(getattr(sys, '_MEIPASS'), 'input_monitor', 'images')
-        return os.path.join(os.path.dirname(__file__), 'images')
-    
-    def _scale_icon(self, img, target_px):
-        """Scale an icon to the target size."""
-        if img is None:
-            return None
-        
-        w, h = img.width(), img.height()
-        max_dim = max(w, h)
-        
-        if max_dim == 0:
-            return img
-        
-        if max_dim > target_px:
-            # Downscale
-            factor = max(1, max_dim // target_px)
-            return img.subsample(factor, factor)
-        elif max_dim < target_px:
-            # Upscale
-            factor = max(1, (target_px + max_dim - 1) // max_dim)
-            return img.zoom(factor, factor)
-        
-        return img
+            self.evdev = evdev.create_backend(
+                publish,
+                position=self.root.winfo_pointerxy(),
+                screen_size=(self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            )
+        except OSError as e:
+            print(f"evdev input unavailable ({e}); using keyboard/pynput hooks", file=sys.stderr)
+            return False
+        self.evdev.start()
+        return True
+    
+    def _queue_mouse_move(self, x, y):
+        """Mouse listener callback (pynput thread): enqueue a move record."""
+        self._publish((events.MOUSE_MOVE, time.time(), x, y))
+    
+    def _queue_mouse_click(self, x, y, button, pressed):
+        """Mouse listener callback (pynput thread): enqueue a click record."""
+        self._publish((events.MOUSE_CLICK, time.time(), x, y, button, pressed))
+    
+    def _queue_mouse_scroll(self, x, y, dx, dy):
+        """Mouse listener callback (pynput thread): enqueue a scroll record."""
+        self._publish((events.MOUSE_SCROLL, time.time(), dx, dy))
+    
+    def _publish(self, record):
+        """Hand a listener event to the Tk thread and the session recorder."""
+        self.event_queue.put(record)
+        if self.recorder is not None:
+            self.recorder.put(record)
+        self.scheduler.wake_threadsafe()
+    
+    def _publish_timed(self, record):
+        """``_publish`` for sources whose records carry the OS event time."""
+        self.latency.hooked(record[1])
+        self._publish(record)
+    
+    def _drain_events(self):
+        """Take the listener events that arrived since the last tick."""
+        if self.hook_process is None:
+            return self.event_queue.drain()
+        records = self.hook_process.drain()
+        if self.recorder is not None:
+            for record in records:
+                self.recorder.put(record)
+        return records
+    
+    def _process_events(self):
+        """Drain queued listener events on the Tk thread and feed the engine.
+
+        Returns whether there were any, so the scheduler can back off.
+        """
+        input_engine = self.engine
+        latency = self.latency
+        records = self._drain_events()
+        if latency is None:
+            for record in records:
+                events.dispatch(record, input_engine)
+        else:
+            for record in records:
+                latency.begin(record[1])
+                events.dispatch(record, input_engine)
+                latency.normalized()
+            latency.end()
+        return bool(records)
+    
+    def _load_icons(self):
+        """Prepare the icon cache; images are created on first use."""
+        self.icons = IconCache(self.root, self.icon_scale)
+    
+    def _preload_icons(self):
+        """Create the icon images up front so the first click or Win key doesn't."""
+        for name in ICON_FILES:
+            self._icon(name)
+        if self.profile is not None:
+            self.profile.mark('icons loaded')
+    
+    def _icon(self, name):
+        """Return the named display icon, or None if unavailable."""
+        size = self.WIN_ICON_SIZE if name == 'win' else self.MOUSE_ICON_SIZE
+        return self.icons.get(name, size)
     
     def _keyboard_listener(self):
         """Listen for keyboard events using keyboard library"""
+        import keyboard as kb
         while True:
             try:
                 event = kb.read_event()
@@ -427,310 +595,364 @@ class InputMonitorWidget:
                 # Ignore transient exceptions and try again
                 time.sleep(0.1)
                 continue
+            # Only enqueue here; widgets are touched from the Tk thread alone.
+            # Event time and scan_code are kept so we can order by actual press time and handle Linux meta key
+            if self.latency is not None:
+                self.latency.hooked(getattr(event, 'time', None))
             if event.event_type == kb.KEY_DOWN:
-                # Pass event time and scan_code along so we can order by actual press time and handle Linux meta key
-                self.on_key_press(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
+                self._publish((events.KEY_DOWN, getattr(event, 'time', None), event.name, getattr(event, 'scan_code', None)))
             elif event.event_type == kb.KEY_UP:
-                self.on_key_release(event.name, getattr(event, 'time', None), getattr(event, 'scan_code', None))
-    
-    # Key name mappings
-    SPECIAL_KEYS = {
-        'ctrl': 'Ctrl', 'control': 'Ctrl', 'lctrl': 'Ctrl', 'rctrl': 'Ctrl',
-        'alt': 'Alt', 'alt gr': 'Alt', 'lalt': 'Alt', 'ralt': 'Alt',
-        'shift': 'Shift', 'lshift': 'Shift', 'rshift': 'Shift',
-        'windows': 'Win', 'meta': 'Win', 'leftmeta': 'Win', 'rightmeta': 'Win',
-        'super': 'Win', 'lwin': 'Win', 'rwin': 'Win', 'cmd': 'Win',
-        'space': 'Space', 'enter': 'Enter', 'tab': 'Tab', 'esc': 'Esc',
-        'up': 'Up ⬆', 'down': 'Down ⬇', 'left': 'Left ⬅', 'right': 'Right ➡',
-        'backspace': 'Backspace ←', 'delete': 'Delete ⌫',
-        'insert': 'Insert', 'home': 'Home', 'end': 'End',
-        'print screen': 'Print Screen 📸',
-        'page up': 'Page Up', 'page down': 'Page Down',
-        'caps lock': 'Caps Lock', 'num lock': 'Num Lock',
-        'f1': 'F1', 'f2': 'F2', 'f3': 'F3', 'f4': 'F4', 'f5': 'F5', 'f6': 'F6',
-        'f7': 'F7', 'f8': 'F8', 'f9': 'F9', 'f10': 'F10', 'f11': 'F11', 'f12': 'F12',
-    }
+                self._publish((events.KEY_UP, getattr(event, 'time', None), event.name, getattr(event, 'scan_code', None)))
     
     def format_key_name(self, key_name):
         """Format key name for display."""
-        # Normalize incoming key name
-        key_name = key_name.lower().replace('-', ' ').replace('_', ' ').strip()
-        
-        # Remove left/right prefix for modifiers only
-        parts = key_name.split()
-        if len(parts) > 1 and parts[0] in ('left', 'right'):
-            if parts[1] in ('ctrl', 'control', 'shift', 'alt', 'alt gr', 'windows', 'super', 'cmd'):
-                key_name = ' '.join(parts[1:])
-        
-        # Check special keys mapping
-        if key_name in self.SPECIAL_KEYS:
-            return self.SPECIAL_KEYS[key_name]
-        
-        # Single character keys
-        if len(key_name) == 1 and key_name.isalpha():
-            return key_name.upper()
-        
-        # Default formatting
-        return key_name.title()
-    
-    def _normalize_win_key(self, raw_name, scan_code):
-        """Normalize Linux Win/Meta key that may be misreported as 'alt'."""
-        if scan_code in self.WIN_SCAN_CODES:
-            if isinstance(raw_name, str) and raw_name.lower().replace(' ', '') in ('alt', 'altgr'):
-                return 'windows'
-        return raw_name
+        return self.engine.format_key_name(key_name)
     
     def on_key_press(self, key_name, event_time=None, scan_code=None):
         """Handle key press events."""
-        # Normalize Linux Win key handling
-        raw_name = self._normalize_win_key(key_name, scan_code)
-        key_name = self.format_key_name(raw_name)
-        
-        if not key_name:
-            return
-        
-        # Track key press
-        if key_name not in self.current_keys:
-            self.current_keys.add(key_name)
-            self.key_press_order.append((key_name, event_time or time.time()))
-        
-        # Build and display key combination
-        self._display_key_combination()
-    
-    def _display_key_combination(self):
-        """Display the current key combination."""
-        ordered_keys = [k for k, t in sorted(self.key_press_order, key=lambda x: x[1])]
-        modifiers = [k for k in ordered_keys if k in self.MODIFIERS]
-        non_modifiers = [k for k in ordered_keys if k not in self.MODIFIERS]
-        
-        icon = None
-        has_win = 'Win' in modifiers or 'Win' in non_modifiers
-        
-        if non_modifiers:
-            keys = modifiers + non_modifiers
-            key_text = " + ".join(keys)
-            if has_win:
-                icon = getattr(self, 'win_icon', None)
-            self.show_input(key_text, icon=icon)
-        elif modifiers:
-            modifiers_text = " + ".join(modifiers)
-            if len(modifiers) == 1 and has_win:
-                icon = getattr(self, 'win_icon', None)
-            self.show_input(f"{modifiers_text} + ...", icon=icon)
+        self.engine.key_down(key_name, event_time, scan_code)
     
     def on_key_release(self, key_name, event_time=None, scan_code=None):
         """Handle key release events."""
-        raw_name = self._normalize_win_key(key_name, scan_code)
-        key_name = self.format_key_name(raw_name)
-        
-        if key_name in self.current_keys:
-            self.current_keys.remove(key_name)
-            self.key_press_order = [(k, t) for (k, t) in self.key_press_order if k != key_name]
-    
-    def on_mouse_move(self, x, y):
-        # Calculate delta
-        delta_x = x - self.last_mouse_x
-        delta_y = y - self.last_mouse_y
-        
-        # Update last position
-        self.last_mouse_x = x
-        self.last_mouse_y = y
-        
-        # Update counter
-        self.mouse_update_counter += 1
-        
-        # Update display every few events to avoid too frequent updates
-        if self.mouse_update_counter >= self.MOUSE_UPDATE_THRESHOLD:
-            self.mouse_update_counter = 0
-            self.mouse_label.config(
-                text=f"X: {x}, Y: {y} | ΔX: {delta_x}, ΔY: {delta_y}"
-            )
-        
-        # Update selection if we're in the middle of selecting
-        if self.is_selecting and self.selection_start:
-            self.selection_end = (x, y)
-            width = abs(self.selection_end[0] - self.selection_start[0])
-            height = abs(self.selection_end[1] - self.selection_start[1])
-            self.selection_label.config(text=f"Selection: {width} x {height}")
-    
-    def _is_double_click(self, x, y, button, current_time):
-        """Check if this is a double click."""
-        return (current_time - self.last_click_time < self.DOUBLE_CLICK_THRESHOLD and
-                abs(x - self.last_click_pos[0]) < self.DOUBLE_CLICK_POSITION_TOLERANCE and
-                abs(y - self.last_click_pos[1]) < self.DOUBLE_CLICK_POSITION_TOLERANCE and
-                self.last_click_button == button)
-    
-    def on_mouse_click(self, x, y, button, pressed):
+        self.engine.key_up(key_name, event_time, scan_code)
+    
+    def on_mouse_move(self, x, y, event_time=None):
+        """Handle mouse move events."""
+        self.engine.mouse_move(x, y, event_time)
+    
+    def on_mouse_click(self, x, y, button, pressed, event_time=None):
         """Handle mouse click events."""
-        if pressed:
-            current_time = time.time()
-            
-            if button == mouse.Button.left:
-                self._handle_left_click(x, y, current_time)
-            elif button == mouse.Button.right:
-                self.show_input("Right Click", icon=getattr(self, 'right_icon', None))
-            elif button == mouse.Button.middle:
-                self._handle_middle_click(x, y, current_time)
-        else:
-            if button == mouse.Button.left and self.is_selecting:
-                self._end_selection()
-    
-    def _handle_left_click(self, x, y, current_time):
-        """Handle left mouse button click."""
-        # Start selection
-        self.selection_start = (x, y)
-        self.is_selecting = True
-        self.selection_label.config(text="Selection: 0 x 0")
-        
-        # Check for double click
-        if self._is_double_click(x, y, mouse.Button.left, current_time):
-            self.show_input("Left Double Click", icon=getattr(self, 'left_icon', None))
-        else:
-            self.show_input("Left Click", icon=getattr(self, 'left_icon', None))
-        
-        self.last_click_time = current_time
-        self.last_click_pos = (x, y)
-        self.last_click_button = mouse.Button.left
-    
-    def _handle_middle_click(self, x, y, current_time):
-        """Handle middle mouse button click."""
-        if self._is_double_click(x, y, mouse.Button.middle, current_time):
-            self.show_input("Middle Double Click", icon=getattr(self, 'middle_icon', None))
+        self.engine.mouse_click(x, y, button, pressed, event_time)
+    
+    def on_mouse_scroll(self, dx, dy, event_time=None):
+        """Handle mouse wheel and touchpad scroll events."""
+        self.engine.mouse_scroll(dx, dy, event_time)
+    
+    def _on_intent(self, intent):
+        """Render a display intent emitted by the engine."""
+        kind = intent[0]
+        if kind == engine.MOUSE:
+            # Labels are redrawn once per frame with the latest values
+            self.renderer.mark('mouse', intent[1:])
+            if self.latency is not None:
+                self.latency.scheduled('mouse')
+        elif kind == engine.SHOW:
+            if self.history is not None:
+                self.history.push(intent[1])
+            self._show_intent(intent[1], intent[2])
+        elif kind == engine.SHORTCUT:
+            if self.history is not None:
+                self.history.push(intent[1], intent[3])
+            # The chord sequence, with the action it triggers underneath
+            self._show_intent(intent[1], intent[2], intent[3])
+        elif kind == engine.REPEAT:
+            # Counter updates are coalesced to one per frame
+            self.renderer.mark('repeat', intent[1:])
+            if self.latency is not None:
+                self.latency.scheduled('repeat')
+        elif kind == engine.SCROLL:
+            # Smooth scrolling emits hundreds of these a second; one redraw per frame
+            self.renderer.mark('scroll', intent[1:])
+            if self.latency is not None:
+                self.latency.scheduled('scroll')
+        elif kind == engine.SELECTION:
+            self.renderer.mark('selection', intent[1:])
+            if self.latency is not None:
+                self.latency.scheduled('selection')
+        elif kind == engine.LED:
+            if self.latency is not None:
+                self.latency.scheduled('led')
+            self._set_led_state(intent[1], intent[2])
+            if self.latency is not None:
+                self.latency.rendered('led')
+    
+    def _record_intent(self, intent):
+        """Record completed selections alongside the raw events."""
+        if intent[0] == engine.SELECTED:
+            self.recorder.put((events.SELECTION, time.time(), intent[1], intent[2]))
+    
+    def _show_intent(self, text, icon_name, caption=None):
+        """Show text with its named icon unless it is already on screen."""
+        icon = self._icon(icon_name) if icon_name else None
+        if self._displayed == (text, icon, caption):
+            # Same text already on screen; just keep it visible
+            self._schedule_reset()
+        elif self.latency is None:
+            self.show_input(text, icon=icon, caption=caption)
         else:
-            self.show_input("Middle Click", icon=getattr(self, 'middle_icon', None))
-        
-        self.last_click_time = current_time
-        self.last_click_pos = (x, y)
-        self.last_click_button = mouse.Button.middle
-    
-    def _end_selection(self):
-        """End the current selection."""
-        self.is_selecting = False
-        if self.selection_start and self.selection_end:
-            width = abs(self.selection_end[0] - self.selection_start[0])
-            height = abs(self.selection_end[1] - self.selection_start[1])
-            
-            if width > self.SELECTION_MIN_SIZE or height > self.SELECTION_MIN_SIZE:
-                self.show_input(f"Selected Area: {width} x {height}")
-    
-    def show_input(self, input_text, icon=None):
-        """Display input text and optional icon."""
-        # Cancel any pending reset
-        if self.reset_job:
-            self.root.after_cancel(self.reset_job)
-        
-        self._clear_inline_children()
-        
-        # Check if we should display inline (Win key with icon)
-        if icon and 'Win' in input_text:
-            self._display_inline_icon(input_text, icon)
+            self.latency.scheduled('input')
+            self.show_input(text, icon=icon, caption=caption)
+            self.latency.rendered('input')
+    
+    def _render_mouse(self, value):
+        """Draw the latest mouse position, and the movement since the last redraw."""
+        x, y = value[0], value[1]
+        delta_x, delta_y, speed = self.engine.motion.take()
+        self.mouse_label.config(text=f"X: {x}, Y: {y} | ΔX: {delta_x}, ΔY: {delta_y} | {speed:.0f} px/s")
+        if self.latency is not None:
+            self.latency.rendered('mouse')
+        if speed:
+            self.scheduler.at('motion_idle', self.MOTION_IDLE_MS, lambda: self._motion_idle(value))
         else:
-            self._display_standard(input_text, icon)
-        
-        self.reset_job = self.root.after(self.RESET_DELAY_MS, self.reset_display)
-    
-    def _clear_inline_children(self):
-        """Clear all inline child widgets."""
-        for child in self._inline_children:
-            try:
-                child.destroy()
-            except Exception:
-                pass
-        self._inline_children = []
-    
-    def _display_inline_icon(self, input_text, icon):
-        """Display text with inline Win icon."""
-        match = re.search(r'\bWin\b', input_text)
-        if not match:
-            self._display_standard(input_text, icon)
-            return
-        
-        self.icon_label.config(image='')
-        self.icon_label.image = None
-        self.input_label.config(text='')
-        self.inline_frame.pack(side=tk.LEFT, pady=2)
-        
-        start, end = match.span()
-        left_text = input_text[:start].rstrip()
-        token_text = input_text[start:end]
-        right_text = input_text[end:].lstrip()
-        
-        def make_label(text):
-            lbl = tk.Label(self.inline_frame, text=text, bg=self.BG_COLOR, fg=self.INPUT_COLOR, 
-                         font=self.input_label.cget('font'))
-            lbl.pack(side=tk.LEFT)
-            self._inline_children.append(lbl)
-        
-        if left_text:
-            make_label(left_text + ' ')
-        make_label(token_text + ' ')
-        
-        # Icon inline
-        icon_lbl = tk.Label(self.inline_frame, bg=self.BG_COLOR, image=icon)
-        icon_lbl.image = icon
-        icon_lbl.pack(side=tk.LEFT, padx=(0, 6))
-        self._inline_children.append(icon_lbl)
-        
-        if right_text:
-            make_label(' ' + right_text)
-    
-    def _display_standard(self, input_text, icon):
-        """Display text in standard format."""
-        try:
-            self.inline_frame.pack_forget()
-        except Exception:
-            pass
-        
+            self.scheduler.cancel('motion_idle')
+    
+    def _motion_idle(self, value):
+        # Redraw with zero speed; no event is pending, so no latency sample
+        self.renderer.mark('mouse', value)
+    
+    def _render_repeat(self, value):
+        """Show the autorepeat counter next to the repeating chord."""
+        text, icon_name, count = value
+        if self._displayed is None or self._displayed[0] != text:
+            # Something else was shown since; bring the chord back first
+            self._show_intent(text, icon_name)
+        self.display.show_count(f" ×{count}")
+        # A later SHOW of the bare chord must redraw it without the counter
+        self._displayed = self._displayed[:3] + (count,)
+        if self.history is not None:
+            self.history.repeat(text, count)
+        self._schedule_reset()
+        if self.latency is not None:
+            self.latency.rendered('repeat')
+    
+    def _render_scroll(self, value):
+        """Show the scroll direction with the notches scrolled so far."""
+        text, count, action = value
+        if self._displayed is None or self._displayed[0] != text or self._displayed[2] != action:
+            self.show_input(text, caption=action)
+        self.display.show_count(f" ×{count}")
+        self._displayed = self._displayed[:3] + (count,)
+        if self.history is not None:
+            self.history.scroll(text, count, action)
+        self._schedule_reset()
+        if self.latency is not None:
+            self.latency.rendered('scroll')
+    
+    def _render_selection(self, value):
+        """Draw the latest selection size."""
+        width, height = value
+        self.selection_label.config(text=f"Selection: {width} x {height}")
+        if self.latency is not None:
+            self.latency.rendered('selection')
+    
+    def show_input(self, input_text, icon=None, caption=None):
+        """Display input text, an optional icon and an optional caption line."""
         # Use selection font for 'Selected Area' messages
         font = self.font_selection if input_text.startswith('Selected Area') else self.font_input
-        self.input_label.config(font=font, text=input_text)
+        self.display.show(input_text, icon=icon, font=font, caption=caption)
+        # Counters still waiting for the next frame belong to older input
+        self.renderer.discard('repeat')
+        self.renderer.discard('scroll')
         
-        # Update icon
-        if icon:
-            self.icon_label.config(image=icon)
-            self.icon_label.image = icon
-        else:
-            self.icon_label.config(image='')
-            self.icon_label.image = None
+        self._displayed = (input_text, icon, caption)
+        self._schedule_reset()
+    
+    def _schedule_reset(self):
+        """(Re)start the countdown that clears the display."""
+        # Only moves the deadline; no Tk timer is cancelled or created
+        self.scheduler.at('reset', self.RESET_DELAY_MS, self.reset_display)
     
     def reset_display(self):
         """Reset the display to empty state."""
-        self.input_label.config(text="", font=self.font_input)
-        self.icon_label.config(image='')
-        self.icon_label.image = None
-        self.reset_job = None
-        
-        self._clear_inline_children()
-        try:
-            self.inline_frame.pack_forget()
-        except Exception:
-            pass
+        self.display.clear()
+        self._displayed = None
     
     def start_drag(self, event):
-        self._drag_start_x = event.x
-        self._drag_start_y = event.y
+        # Remember where the window and pointer were so motion events need no
+        # window-manager queries
+        self._drag_start_x = event.x_root
+        self._drag_start_y = event.y_root
+        self._drag_origin_x = self.root.winfo_x()
+        self._drag_origin_y = self.root.winfo_y()
     
     def stop_drag(self, event):
         self._drag_start_x = 0
         self._drag_start_y = 0
     
     def on_drag(self, event):
-        x = self.root.winfo_x() + event.x - self._drag_start_x
-        y = self.root.winfo_y() + event.y - self._drag_start_y
+        x = self._drag_origin_x + event.x_root - self._drag_start_x
+        y = self._drag_origin_y + event.y_root - self._drag_start_y
+        self.renderer.mark('window_pos', (x, y))
+    
+    def _render_window_pos(self, value):
+        """Move the window to the latest drag position."""
+        x, y = value
         self.root.geometry(f"+{x}+{y}")
     
     def close_app(self):
-        self.mouse_listener.stop()
+        self.renderer.cancel()
+        if (self.latency is not None or self.analytics is not None) and self.stats_job is not None:
+            self.root.after_cancel(self.stats_job)
+        if self.led_monitor is not None:
+            self.led_monitor.stop()
+        self.scheduler.close()
+        if self.mouse_listener:
+            self.mouse_listener.stop()
+        if self.evdev is not None:
+            self.evdev.stop()
+        if self.hook_process is not None:
+            self.hook_process.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
         self.root.destroy()
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(prog='input-monitor', description='On-screen input & mouse tracker widget.')
+    parser.add_argument('--backend', choices=('hooks', 'process', 'evdev'), default='hooks',
+                        help="input source: the keyboard/pynput hooks, the same hooks in a child "
+                             "process ('process'), or 'evdev' to read /dev/input directly on Linux "
+                             "(needs root or the input group)")
+    parser.add_argument('--record', metavar='DIR',
+                        help='record all input events to compact binary files in DIR')
+    parser.add_argument('--record-max-mb', type=int, default=64, metavar='MB',
+                        help='start a new recording file after MB megabytes (default: 64)')
+    parser.add_argument('--replay', nargs='+', metavar='FILE',
+                        help='drive the widget from recorded .imrec files instead of live input')
+    parser.add_argument('--speed', type=parse_speed, default=1.0, metavar='N',
+                        help="replay speed factor, or 'max' for as fast as possible (default: 1)")
+    parser.add_argument('--heatmap', metavar='PREFIX',
+                        help='on exit, write mouse heatmap and click map images to PREFIX-moves.png/PREFIX-clicks.png')
+    parser.add_argument('--serve', metavar='ADDRESS',
+                        help='stream display events to local overlays: a socket path (JSON lines) '
+                             'or [HOST:]PORT for a WebSocket on localhost. Every subscriber sees '
+                             'every keystroke, passwords included; web pages may only connect from '
+                             'localhost origins or those given with --serve-origin')
+    parser.add_argument('--serve-origin', action='append', default=[], metavar='ORIGIN',
+                        help='also let web pages from ORIGIN (e.g. http://overlay.example or null) '
+                             'subscribe to the --serve WebSocket; may be repeated')
+    parser.add_argument('--serve-remote', action='store_true',
+                        help='allow --serve on a non-loopback HOST, which exposes keystrokes to '
+                             'the network')
+    parser.add_argument('--shortcuts', nargs='+', metavar='FILE',
+                        help='show the action name of chords and sequences listed in these JSON '
+                             'shortcut catalogs (later files override earlier ones)')
+    parser.add_argument('--history', type=int, default=0, metavar='N',
+                        help='also list the last N chords, clicks and scrolls under the current '
+                             'one, older ones fading out')
+    parser.add_argument('--captions', metavar='FILE',
+                        help='write what the widget displays as a subtitle track (SRT, or WebVTT '
+                             'for a .vtt FILE) timed from startup, or from the start of the --replay '
+                             'recording')
+    parser.add_argument('--analytics', nargs='?', const='-', metavar='FILE',
+                        help='keep usage statistics (top shortcuts, clicks, typing rate; right click '
+                             'toggles a stats panel); print a report on exit and write it to FILE '
+                             'as JSON if given')
+    parser.add_argument('--latency', nargs='?', const='-', metavar='FILE',
+                        help='measure input-to-display latency (right click toggles a stats panel); '
+                             'print a summary on exit and write histograms to FILE as JSON if given')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='print how long each startup phase took, up to the first paint and '
+                             'the input hooks becoming active')
+    args = parser.parse_args(argv)
+    if args.history < 0:
+        parser.error('--history must not be negative')
+    if args.serve:
+        from .server import parse_address
+        try:
+            parse_address(args.serve, args.serve_remote)
+        except ValueError as e:
+            parser.error(f'--serve: {e} (use --serve-remote to allow it)')
+    return args
+
+
+def _report_replay(replayer):
+    rate = replayer.count / replayer.elapsed if replayer.elapsed else 0
+    print(f"Replayed {replayer.count} events in {replayer.elapsed:.2f} s ({rate:,.0f} events/s)")
+
+
+def main(argv=None):
     """Entry point for CLI or Python module execution. Starts the GUI loop."""
+    args = parse_args(argv)
+    profile = None
+    if args.profile_startup:
+        profile = startup.StartupProfile()
+        profile.mark('imports, arguments')
+    
+    recorder = None
+    if args.record:
+        from .recorder import SessionRecorder
+        recorder = SessionRecorder(args.record, max_bytes=args.record_max_mb << 20)
+        recorder.start()
+    
     root = tk.Tk()
+    if profile is not None:
+        profile.mark('Tk started')
+    latency = None
+    if args.latency:
+        from .latency import LatencyTracker
+        latency = LatencyTracker(root)
+    analytics = None
+    if args.analytics:
+        from .analytics import SessionAnalytics
+        analytics = SessionAnalytics()
     # Keep a persistent reference to the widget on the root to avoid
     # being garbage-collected and to allow access from external code.
-    root._app = InputMonitorWidget(root)
-    root.mainloop()
+    root._app = InputMonitorWidget(root, listen=not args.replay, recorder=recorder, latency=latency,
+                                   backend=args.backend, profile=profile, history=args.history,
+                                   analytics=analytics)
+    if analytics is not None:
+        analytics.attach(root._app.engine)
+    captions = None
+    if args.captions:
+        from .captions import CaptionTrack, CaptionWriter
+        if args.replay:
+            from .recorder import read_start_time
+            origin = read_start_time(args.replay[0])
+        else:
+            origin = time.time()
+        captions = CaptionTrack(CaptionWriter(args.captions).start(), origin,
+                                InputMonitorWidget.RESET_DELAY_MS / 1000)
+        captions.attach(root._app.engine)
+    if args.shortcuts:
+        root._app.engine.load_shortcuts(args.shortcuts)
+        if profile is not None:
+            profile.mark('shortcuts loaded')
+    if args.replay:
+        from .recorder import read_session
+        from .replay import Replayer
+        root._replayer = Replayer(root, root._app.engine, read_session(args.replay),
+                                  speed=args.speed, on_done=_report_replay)
+        root._replayer.start()
+    server = None
+    if args.serve:
+        from .server import StreamServer
+        server = StreamServer(args.serve, origins=args.serve_origin, allow_remote=args.serve_remote)
+        server.start()
+        server.attach(root._app.engine)
+        if profile is not None:
+            profile.mark('server started')
+    heatmap = None
+    if args.heatmap:
+        from .heatmap import HeatmapAggregator
+        heatmap = HeatmapAggregator(root.winfo_screenwidth(), root.winfo_screenheight())
+        heatmap.attach(root._app.engine)
+    try:
+        root.mainloop()
+    finally:
+        if root._app.hook_process is not None:
+            # Also covers the window going away without close_app
+            root._app.hook_process.stop()
+        if recorder is not None:
+            recorder.stop()
+        if captions is not None:
+            captions.close()
+        if server is not None:
+            server.stop()
+        if heatmap is not None:
+            heatmap.save(args.heatmap)
+        if analytics is not None:
+            print(analytics.format_report())
+            if args.analytics != '-':
+                analytics.dump(args.analytics)
+        if latency is not None:
+            print(latency.format_table())
+            if args.latency != '-':
+                latency.dump(args.latency)
+        if profile is not None:
+            # Closed before startup finished
+            profile.report()
 
 
 if __name__ == "__main__":
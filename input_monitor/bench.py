@@ -0,0 +1,379 @@
+"""Benchmarks for the input handling path.
+
+Drives the event handlers with reproducible synthetic event streams and
+reports throughput, per-event latency percentiles and allocations:
+
+    python -m input_monitor.bench                  # all scenarios, stub UI
+    python -m input_monitor.bench mouse_sweep -n 50000
+    python -m input_monitor.bench --ui tk          # real widget, no hooks
+    python -m input_monitor.bench --analytics      # with usage statistics
+    python -m input_monitor.bench --save base.json
+    python -m input_monitor.bench --compare base.json --tolerance 0.15
+
+The ``stub`` UI subscribes to the engine like the widget does (display
+de-duplication and latest-value-wins frame coalescing) without Tk, so it
+runs on headless machines. The ``tk`` UI builds a real InputMonitorWidget
+with listeners disabled and pumps Tk once per synthetic frame.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from . import engine, events
+from .engine import InputEngine
+
+SCREEN_W = 1920
+SCREEN_H = 1080
+FRAME_S = 1 / 60
+# Start of the synthetic streams: a fixed, plausible wall-clock time, since
+# the engine treats a zero timestamp as missing and stamps the current time
+EPOCH = 1.7e9
+
+# Linux scan codes for the keys used by the generators
+SCAN_CODES = dict(zip('qwertyuiop', range(16, 26)))
+SCAN_CODES.update(zip('asdfghjkl', range(30, 39)))
+SCAN_CODES.update(zip('zxcvbnm', range(44, 51)))
+SCAN_CODES.update({
+    'ctrl': 29, 'shift': 42, 'alt': 56, 'windows': 125, 'space': 57,
+    'backspace': 14, 'tab': 15, 'enter': 28, 'e': 18, 'k': 37,
+})
+
+
+# ---------------------------------------------------------------------------
+# Synthetic event streams. Each yields event records (see input_monitor.events)
+# with monotonically increasing timestamps, deterministic for a given seed.
+
+def mouse_sweep(count, hz=1000, seed=0):
+    """A high polling rate mouse sweeping back and forth across the screen."""
+    rng = random.Random(seed)
+    t = EPOCH
+    x, y = SCREEN_W // 2, SCREEN_H // 2
+    vx, vy = 7, 3
+    for _ in range(count):
+        x += vx + rng.randint(-1, 1)
+        y += vy + rng.randint(-1, 1)
+        if not 0 <= x < SCREEN_W:
+            vx = -vx
+            x = min(max(x, 0), SCREEN_W - 1)
+        if not 0 <= y < SCREEN_H:
+            vy = -vy
+            y = min(max(y, 0), SCREEN_H - 1)
+        t += 1 / hz
+        yield (events.MOUSE_MOVE, t, x, y)
+
+
+def drag_selection(count, hz=1000, seed=0):
+    """Repeated left-button drag selections of random size."""
+    rng = random.Random(seed)
+    t = EPOCH
+    emitted = 0
+    while emitted < count:
+        x, y = rng.randrange(SCREEN_W // 2), rng.randrange(SCREEN_H // 2)
+        t += 0.3
+        yield (events.MOUSE_CLICK, t, x, y, 'left', True)
+        steps = rng.randint(100, 400)
+        dx, dy = rng.randint(1, 3), rng.randint(1, 2)
+        for _ in range(steps):
+            x, y = x + dx, y + dy
+            t += 1 / hz
+            yield (events.MOUSE_MOVE, t, x, y)
+        yield (events.MOUSE_CLICK, t, x, y, 'left', False)
+        emitted += steps + 2
+
+
+def typing_burst(count, cps=12, seed=0):
+    """Fast typing with occasional held Backspace autorepeat."""
+    rng = random.Random(seed)
+    letters = 'etaoinshrdlucmfwypvbgkqjxz'
+    t = EPOCH
+    emitted = 0
+    while emitted < count:
+        if rng.random() < 0.1:
+            # Hold Backspace: 500 ms repeat delay then ~30 repeats/s
+            repeats = rng.randint(5, 30)
+            yield (events.KEY_DOWN, t, 'backspace', SCAN_CODES['backspace'])
+            t += 0.5
+            for _ in range(repeats):
+                yield (events.KEY_DOWN, t, 'backspace', SCAN_CODES['backspace'])
+                t += 1 / 30
+            yield (events.KEY_UP, t, 'backspace', SCAN_CODES['backspace'])
+            emitted += repeats + 2
+        else:
+            key = ' ' if rng.random() < 0.18 else rng.choice(letters)
+            name = 'space' if key == ' ' else key
+            yield (events.KEY_DOWN, t, name, SCAN_CODES.get(name))
+            t += rng.uniform(0.02, 0.06)
+            yield (events.KEY_UP, t, name, SCAN_CODES.get(name))
+            t += rng.expovariate(cps)
+            emitted += 2
+
+
+def modifier_chords(count, seed=0):
+    """Modifiers held while another key is hammered (Ctrl+Shift+K, Win+E, ...)."""
+    rng = random.Random(seed)
+    chords = [('ctrl', 'shift', 'k'), ('windows', 'e'), ('alt', 'tab'), ('ctrl', 'z'), ('ctrl', 'c')]
+    t = EPOCH
+    emitted = 0
+    while emitted < count:
+        *mods, key = rng.choice(chords)
+        for mod in mods:
+            yield (events.KEY_DOWN, t, mod, SCAN_CODES[mod])
+            t += 0.05
+        for _ in range(rng.randint(3, 20)):
+            yield (events.KEY_DOWN, t, key, SCAN_CODES[key])
+            t += 0.04
+            yield (events.KEY_UP, t, key, SCAN_CODES[key])
+            t += 0.04
+            emitted += 2
+        for mod in reversed(mods):
+            yield (events.KEY_UP, t, mod, SCAN_CODES[mod])
+            t += 0.05
+        emitted += 2 * len(mods)
+
+
+def smooth_scroll(count, hz=240, seed=0):
+    """Touchpad flings: bursts of fractional deltas decaying, some with Ctrl held."""
+    rng = random.Random(seed)
+    t = EPOCH
+    emitted = 0
+    while emitted < count:
+        zoom = rng.random() < 0.2
+        if zoom:
+            yield (events.KEY_DOWN, t, 'ctrl', SCAN_CODES['ctrl'])
+        velocity = rng.uniform(0.2, 1.5) * rng.choice((-1, 1))
+        horizontal = not zoom and rng.random() < 0.15
+        for _ in range(rng.randint(50, 400)):
+            t += 1 / hz
+            yield (events.MOUSE_SCROLL, t, velocity if horizontal else 0.0, 0.0 if horizontal else velocity)
+            velocity *= 0.99
+            emitted += 1
+        if zoom:
+            yield (events.KEY_UP, t, 'ctrl', SCAN_CODES['ctrl'])
+            emitted += 2
+        t += rng.uniform(0.3, 1.0)
+
+
+def mixed(count, seed=0):
+    """All of the above interleaved by timestamp, as during a real session."""
+    share = count // 4 + 1
+    streams = [mouse_sweep(share, seed=seed), drag_selection(share, seed=seed),
+               typing_burst(share, seed=seed), modifier_chords(share, seed=seed)]
+    return sorted((r for s in streams for r in s), key=lambda r: r[1])
+
+
+SCENARIOS = {
+    'mouse_sweep': mouse_sweep,
+    'drag_selection': drag_selection,
+    'typing_burst': typing_burst,
+    'modifier_chords': modifier_chords,
+    'smooth_scroll': smooth_scroll,
+    'mixed': mixed,
+}
+
+
+def generate(scenario, count, seed=0):
+    """Return the first ``count`` records of a scenario as a list."""
+    records = []
+    for record in SCENARIOS[scenario](count, seed=seed):
+        records.append(record)
+        if len(records) >= count:
+            break
+    return records
+
+
+# ---------------------------------------------------------------------------
+# UIs the engine is benchmarked against
+
+class StubUI:
+    """Display-free stand-in for InputMonitorWidget's intent handling."""
+
+    def __init__(self):
+        self.engine = InputEngine()
+        self.engine.subscribe(self._on_intent)
+        self.displayed = None
+        self.dirty = {}
+        self.frames = 0
+        self.shows = 0
+
+    def _on_intent(self, intent):
+        kind = intent[0]
+        if kind == engine.SHOW or kind == engine.SHORTCUT:
+            if self.displayed != intent:
+                self.displayed = intent
+                self.shows += 1
+        else:
+            self.dirty[kind] = intent
+
+    def pump(self):
+        if self.dirty:
+            if engine.MOUSE in self.dirty:
+                # The widget sums motion over each redrawn frame
+                self.engine.motion.take()
+            self.dirty.clear()
+            self.frames += 1
+
+    def close(self):
+        pass
+
+
+class TkUI:
+    """A real InputMonitorWidget (listeners disabled) pumped once per frame."""
+
+    def __init__(self):
+        import tkinter as tk
+        from .app import InputMonitorWidget
+        self.root = tk.Tk()
+        self.widget = InputMonitorWidget(self.root, listen=False)
+        self.engine = self.widget.engine
+        self.root.update()
+
+    def pump(self):
+        self.root.update()
+
+    def close(self):
+        self.widget.close_app()
+
+
+UIS = {'stub': StubUI, 'tk': TkUI}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _drive(ui, records, latencies=None):
+    """Feed records to ``ui``, pumping it at every synthetic frame boundary."""
+    target = ui.engine
+    dispatch = events.dispatch
+    clock = time.perf_counter_ns
+    next_frame = records[0][1] + FRAME_S if records else 0
+    for record in records:
+        start = clock()
+        dispatch(record, target)
+        if record[1] >= next_frame:
+            ui.pump()
+            next_frame = record[1] + FRAME_S
+        if latencies is not None:
+            latencies.append(clock() - start)
+    ui.pump()
+
+
+def _make_ui(ui, analytics):
+    target = UIS[ui]()
+    if analytics:
+        from .analytics import SessionAnalytics
+        SessionAnalytics().attach(target.engine)
+    return target
+
+
+def run_scenario(scenario, count, ui='stub', seed=0, analytics=False):
+    """Benchmark one scenario and return a dict of results."""
+    records = generate(scenario, count, seed)
+
+    # Timed pass
+    target = _make_ui(ui, analytics)
+    latencies = []
+    start = time.perf_counter()
+    _drive(target, records, latencies)
+    elapsed = time.perf_counter() - start
+    target.close()
+
+    # Allocation pass (tracemalloc slows everything down, so time separately)
+    target = _make_ui(ui, analytics)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    _drive(target, records)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    target.close()
+
+    latencies.sort()
+    n = len(records)
+    return {
+        'scenario': scenario,
+        'ui': ui,
+        'events': n,
+        'events_per_sec': n / elapsed if elapsed else float('inf'),
+        'p50_us': _percentile(latencies, 0.50) / 1000,
+        'p90_us': _percentile(latencies, 0.90) / 1000,
+        'p99_us': _percentile(latencies, 0.99) / 1000,
+        'max_us': latencies[-1] / 1000,
+        'alloc_peak_kib': (peak - before) / 1024,
+        'alloc_retained_kib': (after - before) / 1024,
+    }
+
+
+def format_table(results):
+    header = ('scenario', 'ui', 'events', 'events/s', 'p50 us', 'p90 us', 'p99 us',
+              'max us', 'peak KiB', 'kept KiB')
+    rows = [header]
+    for r in results:
+        rows.append((r['scenario'], r['ui'], str(r['events']), f"{r['events_per_sec']:,.0f}",
+                     f"{r['p50_us']:.2f}", f"{r['p90_us']:.2f}", f"{r['p99_us']:.2f}",
+                     f"{r['max_us']:.1f}", f"{r['alloc_peak_kib']:.1f}",
+                     f"{r['alloc_retained_kib']:.1f}"))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return '\n'.join(
+        '  '.join(cell.ljust(w) if i < 2 else cell.rjust(w) for i, (cell, w) in enumerate(zip(row, widths)))
+        for row in rows
+    )
+
+
+def compare(results, baseline, tolerance):
+    """Return messages for scenarios whose throughput regressed past ``tolerance``."""
+    reference = {(r['scenario'], r['ui']): r for r in baseline}
+    failures = []
+    for r in results:
+        base = reference.get((r['scenario'], r['ui']))
+        if base is None:
+            continue
+        floor = base['events_per_sec'] * (1 - tolerance)
+        if r['events_per_sec'] < floor:
+            failures.append(f"{r['scenario']} ({r['ui']}): {r['events_per_sec']:,.0f} events/s "
+                            f"< {floor:,.0f} (baseline {base['events_per_sec']:,.0f})")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m input_monitor.bench', description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('-n', '--events', type=int, default=20000, help='events per scenario')
+    parser.add_argument('--ui', choices=list(UIS), default='stub', help='UI to drive')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--analytics', action='store_true', help='also keep usage statistics')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--save', metavar='FILE', help='write results as JSON to FILE')
+    parser.add_argument('--compare', metavar='FILE', help='fail if slower than baseline JSON in FILE')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed throughput drop against --compare (default: 0.2)')
+    args = parser.parse_args(argv)
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+
+    results = [run_scenario(name, args.events, args.ui, args.seed, args.analytics)
+               for name in (args.scenarios or SCENARIOS)]
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            failures = compare(results, json.load(f), args.tolerance)
+        for message in failures:
+            print(f"REGRESSION: {message}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""Subtitle tracks (SRT or WebVTT) of what the widget displays.
+
+``CaptionTrack`` subscribes to the input engine and follows the main
+display: each chord, click, selection, shortcut (with its action on a
+second line), autorepeat count and scroll count becomes a cue that starts
+when it is shown and ends when something else replaces it or the display
+resets ``reset_delay`` seconds after its last update. Cue times come from
+the event timestamps, relative to ``origin``, so a live session and the
+replay of its recording produce the same track.
+
+A cue is handed to ``CaptionWriter`` once it can no longer grow (see
+``CaptionTrack.MIN_CUE_S``); the writer formats
+and appends it from a background thread through a buffered file, flushed
+after every batch, so the file on disk is usable while the session runs.
+
+Generating a track from recordings, without the widget and far faster than
+real time::
+
+    python -m input_monitor.captions session-*.imrec -o session.srt
+"""
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+from . import engine, events
+
+FORMATS = ('srt', 'vtt')
+
+# The widget's RESET_DELAY_MS
+RESET_DELAY_S = 2.0
+
+
+def format_timestamp(seconds, fmt='srt'):
+    """``HH:MM:SS,mmm`` (SRT) or ``HH:MM:SS.mmm`` (WebVTT)."""
+    ms = max(0, round(seconds * 1000))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    separator = ',' if fmt == 'srt' else '.'
+    return f'{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}'
+
+
+def format_cue(index, start, end, text, fmt='srt'):
+    """One cue block, including the blank line that ends it."""
+    if fmt == 'vtt':
+        # Cue text is markup in WebVTT; key names such as "<" must be escaped
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return (f'{index}\n{format_timestamp(start, fmt)} --> {format_timestamp(end, fmt)}\n'
+            f'{text}\n\n')
+
+
+def format_from_path(path):
+    """'vtt' for ``.vtt`` files, otherwise 'srt'."""
+    return 'vtt' if os.path.splitext(path)[1].lower() == '.vtt' else 'srt'
+
+
+class CaptionWriter:
+    """Append cues to a subtitle file from a worker thread."""
+
+    FILE_BUFFER = 64 << 10
+    QUEUE_SIZE = 4096
+
+    def __init__(self, path, fmt=None, flush_interval=0.5):
+        self.path = path
+        self.fmt = fmt or format_from_path(path)
+        if self.fmt not in FORMATS:
+            raise ValueError(f'unknown caption format {self.fmt!r}')
+        self.flush_interval = flush_interval
+        self.cues = 0
+        # Bounded: a producer far ahead of the disk waits instead of growing it
+        self._queue = queue.Queue(self.QUEUE_SIZE)
+        self._file = None
+        self._thread = None
+
+    def start(self):
+        """Create the file and start the writer thread."""
+        self._file = open(self.path, 'w', encoding='utf-8', buffering=self.FILE_BUFFER)
+        if self.fmt == 'vtt':
+            self._file.write('WEBVTT\n\n')
+        self._thread = threading.Thread(target=self._run, name='caption-writer', daemon=True)
+        self._thread.start()
+        return self
+
+    def put(self, start, end, text):
+        """Queue a finished cue; times are seconds from the start of the track."""
+        self._queue.put((start, end, text))
+
+    def close(self):
+        """Write everything still queued and close the file."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        get = self._queue.get
+        write = self._file.write
+        fmt = self.fmt
+        running = True
+        while running:
+            try:
+                cues = [get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            # Take the whole backlog as one batch
+            while True:
+                try:
+                    cues.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for cue in cues:
+                if cue is None:
+                    running = False
+                    break
+                self.cues += 1
+                write(format_cue(self.cues, *cue, fmt))
+            self._file.flush()
+        self._file.close()
+        self._file = None
+
+
+class CaptionTrack:
+    """Turn engine intents into timed cues of the displayed text."""
+
+    # Text replaced sooner than this (one frame of 25 fps video) would never
+    # be seen in the video. It gets no cue: the cue before it, if they touch,
+    # lasts until the replacement appears. Replacements are folded this way
+    # for at most this long, so a fast stream of changes (autorepeat counts,
+    # touchpad scrolling) still becomes a run of cues of about this length.
+    MIN_CUE_S = 0.04
+
+    def __init__(self, writer, origin=None, reset_delay=RESET_DELAY_S):
+        self.writer = writer
+        self.origin = origin
+        self.reset_delay = reset_delay
+        self._engine = None
+        self._text = None
+        self._start = 0.0
+        self._last = 0.0
+        # Start of the first text of the current run of quick replacements
+        self._run_start = 0.0
+        # The last ended cue, (start, end, text), while it may still be extended
+        self._previous = None
+
+    def attach(self, input_engine):
+        """Subscribe to ``input_engine`` intents."""
+        self._engine = input_engine
+        input_engine.subscribe(self.on_intent)
+        return self
+
+    def on_intent(self, intent):
+        kind = intent[0]
+        if kind == engine.SHOW:
+            self._show(intent[1])
+        elif kind == engine.SHORTCUT:
+            self._show(f'{intent[1]}\n{intent[3]}')
+        elif kind == engine.REPEAT:
+            self._show(f'{intent[1]} ×{intent[3]}')
+        elif kind == engine.SCROLL:
+            text = f'{intent[1]} ×{intent[2]}'
+            self._show(f'{text}\n{intent[3]}' if intent[3] else text)
+
+    def _show(self, text):
+        t = self._engine.event_time
+        if self.origin is None:
+            self.origin = t
+        if self._text is not None:
+            if t - self._last >= self.reset_delay:
+                # The display was cleared in between
+                self._end(self._last + self.reset_delay)
+            elif text == self._text:
+                # Shown again; the display only restarts its reset countdown
+                self._last = t
+                return
+            elif t - self._run_start < self.MIN_CUE_S:
+                # Replaced too soon to be seen; see MIN_CUE_S
+                previous = self._previous
+                if previous is not None and previous[1] == self._start:
+                    self._previous = (previous[0], t, previous[2])
+                self._text = text
+                self._start = self._last = t
+                return
+            else:
+                self._end(t)
+        if self._previous is not None and self._previous[1] != t:
+            self._put_previous()
+        self._text = text
+        self._start = self._run_start = self._last = t
+
+    def _end(self, end):
+        self._put_previous()
+        self._previous = (self._start, end, self._text)
+        self._text = None
+
+    def _put_previous(self):
+        if self._previous is not None:
+            start, end, text = self._previous
+            self.writer.put(start - self.origin, end - self.origin, text)
+            self._previous = None
+
+    def close(self):
+        """End the cue on display, as if the display reset, and close the writer."""
+        if self._text is not None:
+            self._end(self._last + self.reset_delay)
+        self._put_previous()
+        self.writer.close()
+
+
+def main(argv=None):
+    from .recorder import read_session, read_start_time
+    parser = argparse.ArgumentParser(prog='python -m input_monitor.captions',
+                                     description='Write a subtitle track of recorded input sessions.')
+    parser.add_argument('recordings', nargs='+', metavar='FILE', help='.imrec files of one session, in order')
+    parser.add_argument('-o', '--output', required=True, help='subtitle file (.srt or .vtt)')
+    parser.add_argument('--format', choices=FORMATS, help='default: from the output file extension')
+    parser.add_argument('--reset-delay', type=float, default=RESET_DELAY_S, metavar='SECONDS',
+                        help=f'how long an input stays on screen (default: {RESET_DELAY_S:g})')
+    args = parser.parse_args(argv)
+
+    input_engine = engine.InputEngine()
+    writer = CaptionWriter(args.output, args.format).start()
+    # Times are relative to the start of the recording, like a screen
+    # recording started together with it
+    track = CaptionTrack(writer, read_start_time(args.recordings[0]), args.reset_delay).attach(input_engine)
+    dispatch = events.dispatch
+    count = 0
+    start = time.perf_counter()
+    for record in read_session(args.recordings):
+        dispatch(record, input_engine)
+        count += 1
+    track.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0
+    print(f"Wrote {writer.cues} cues to {args.output} from {count} events in {elapsed:.2f} s "
+          f"({rate:,.0f} events/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
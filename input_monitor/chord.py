@@ -0,0 +1,68 @@
+"""Incremental model of the currently held key chord."""
+
+# Ends the text of a chord of modifiers only, e.g. "Ctrl + ..."
+PARTIAL_SUFFIX = ' + ...'
+
+
+class ChordState:
+    """Keys currently held, split into modifiers and other keys.
+
+    Both groups are insertion-ordered dicts, so adding or removing a key is
+    O(1) and press order is preserved. The rendered chord ``text`` and the
+    ``show_icon`` flag (chord is just the Win key, or includes Win alongside
+    other keys) are recomputed only when the set of held keys changes.
+    """
+
+    def __init__(self, modifiers):
+        self.modifiers = modifiers
+        self._mods = {}
+        self._keys = {}
+        self.text = None
+        self.show_icon = False
+
+    def __contains__(self, key):
+        return key in self._mods or key in self._keys
+
+    def __len__(self):
+        return len(self._mods) + len(self._keys)
+
+    @property
+    def held_modifiers(self):
+        """Held modifiers in press order (a read-only view)."""
+        return self._mods.keys()
+
+    def press(self, key):
+        """Add a held key; return False if it was already held."""
+        if key in self._mods or key in self._keys:
+            return False
+        group = self._mods if key in self.modifiers else self._keys
+        group[key] = None
+        self._update()
+        return True
+
+    def release(self, key):
+        """Remove a held key; return False if it was not held."""
+        group = self._mods if key in self._mods else self._keys
+        if key not in group:
+            return False
+        del group[key]
+        self._update()
+        return True
+
+    def clear(self):
+        self._mods.clear()
+        self._keys.clear()
+        self._update()
+
+    def _update(self):
+        modifiers = list(self._mods)
+        has_win = 'Win' in self._mods or 'Win' in self._keys
+        if self._keys:
+            self.text = " + ".join(modifiers + list(self._keys))
+            self.show_icon = has_win
+        elif modifiers:
+            self.text = " + ".join(modifiers) + PARTIAL_SUFFIX
+            self.show_icon = len(modifiers) == 1 and has_win
+        else:
+            self.text = None
+            self.show_icon = False
@@ -0,0 +1,151 @@
+"""Main input display drawn on a single Canvas with reusable items."""
+import re
+import tkinter as tk
+
+# Key token rendered with its icon inline, e.g. "Win [icon] + E"
+INLINE_ICON_TOKEN = re.compile(r'\bWin\b')
+
+
+class CanvasDisplay:
+    """Text and icons laid out on one Canvas from a fixed pool of items.
+
+    Every update only reconfigures and moves existing text/image items, so a
+    new chord or click costs a few item updates rather than widget creation,
+    destruction and geometry recalculation.
+    """
+
+    TEXT_ITEMS = 3
+    IMAGE_ITEMS = 2
+    ICON_GAP = 6
+
+    def __init__(self, canvas, font, color, wraplength, caption_font=None, caption_color=None):
+        self.canvas = canvas
+        self.font = font
+        self.wraplength = wraplength
+        self._texts = [
+            canvas.create_text(0, 0, anchor=tk.W, fill=color, font=font, state=tk.HIDDEN)
+            for _ in range(self.TEXT_ITEMS)
+        ]
+        self._images = [
+            canvas.create_image(0, 0, anchor=tk.W, state=tk.HIDDEN)
+            for _ in range(self.IMAGE_ITEMS)
+        ]
+        # Trailing counter, e.g. " ×14" for an autorepeating key
+        self._count = canvas.create_text(0, 0, anchor=tk.W, fill=color, font=font, state=tk.HIDDEN)
+        self._count_offset = 0
+        # Smaller line under the content, e.g. the action of a shortcut
+        self._caption = canvas.create_text(0, 0, anchor=tk.CENTER, fill=caption_color or color,
+                                           font=caption_font or font, width=wraplength, state=tk.HIDDEN)
+        self._caption_height = 0
+        self._font = font
+        self._visible = []
+        self._content_width = 0
+        canvas.bind('<Configure>', self._on_configure)
+        self._width = int(canvas.cget('width'))
+        self._height = int(canvas.cget('height'))
+
+    def _on_configure(self, event):
+        if (event.width, event.height) != (self._width, self._height):
+            self._width, self._height = event.width, event.height
+            self._center()
+
+    def show(self, text, icon=None, font=None, caption=None):
+        """Display ``text`` with an optional icon and caption, replacing what is shown."""
+        font = font or self.font
+        self._set_caption(caption)
+        match = INLINE_ICON_TOKEN.search(text) if icon else None
+        if match:
+            # Icon goes right after the token, e.g. "Ctrl + Win [icon] + E"
+            start, end = match.span()
+            left_text = text[:start].rstrip()
+            segments = []
+            if left_text:
+                segments.append((left_text + ' ', 0))
+            segments.append((text[start:end] + ' ', 0))
+            segments.append((icon, self.ICON_GAP))
+            right_text = text[end:].lstrip()
+            if right_text:
+                segments.append((' ' + right_text, 0))
+            wrap = 0
+        else:
+            segments = [(icon, self.ICON_GAP)] if icon else []
+            segments.append((text, 0))
+            wrap = self.wraplength - (icon.width() + self.ICON_GAP if icon else 0)
+        self._layout(segments, font, wrap)
+
+    def _set_caption(self, caption):
+        canvas = self.canvas
+        if caption:
+            canvas.itemconfig(self._caption, text=caption, state=tk.NORMAL)
+            _, y1, _, y2 = canvas.bbox(self._caption)
+            self._caption_height = y2 - y1
+        elif self._caption_height:
+            canvas.itemconfig(self._caption, state=tk.HIDDEN)
+            self._caption_height = 0
+
+    def _layout(self, segments, font, wrap):
+        canvas = self.canvas
+        self._font = font
+        texts = iter(self._texts)
+        images = iter(self._images)
+        visible = []
+        x = 0
+        for value, gap in segments:
+            if isinstance(value, str):
+                item = next(texts)
+                canvas.itemconfig(item, text=value, font=font, width=wrap, state=tk.NORMAL)
+            else:
+                item = next(images)
+                canvas.itemconfig(item, image=value, state=tk.NORMAL)
+            canvas.coords(item, x, 0)
+            x1, _, x2, _ = canvas.bbox(item)
+            x += (x2 - x1) + gap
+            visible.append(item)
+        for item in self._visible:
+            if item not in visible:
+                canvas.itemconfig(item, state=tk.HIDDEN)
+        self._visible = visible
+        self._content_width = x
+        self._center()
+
+    def _center(self):
+        """Shift the visible items so the content is centered."""
+        if not self._visible:
+            return
+        canvas = self.canvas
+        x = (self._width - self._content_width) / 2
+        y = (self._height - self._caption_height) / 2
+        if self._caption_height:
+            canvas.coords(self._caption, self._width / 2, self._height - self._caption_height / 2)
+        first_x = canvas.coords(self._visible[0])[0]
+        for item in self._visible:
+            item_x = canvas.coords(item)[0]
+            canvas.coords(item, x + item_x - first_x, y)
+
+    def show_count(self, text):
+        """Show ``text`` after the current content, replacing any previous count.
+
+        Only the counter item is reconfigured; the content is just re-centered.
+        """
+        if not self._visible:
+            return
+        canvas = self.canvas
+        item = self._count
+        if item in self._visible:
+            canvas.itemconfig(item, text=text)
+        else:
+            canvas.itemconfig(item, text=text, font=self._font, state=tk.NORMAL)
+            first_x, y = canvas.coords(self._visible[0])
+            canvas.coords(item, first_x + self._content_width, y)
+            self._visible.append(item)
+            self._count_offset = self._content_width
+        x1, _, x2, _ = canvas.bbox(item)
+        self._content_width = self._count_offset + (x2 - x1)
+        self._center()
+
+    def clear(self):
+        """Hide everything currently displayed."""
+        for item in self._visible:
+            self.canvas.itemconfig(item, state=tk.HIDDEN)
+        self._visible = []
+        self._set_caption(None)
@@ -0,0 +1,344 @@
+"""UI-agnostic input state engine.
+
+``InputEngine`` consumes raw keyboard/mouse/LED events, keeps all input state
+(held keys, click history, selection, mouse deltas, LED states) and emits
+compact display intents to its subscribers. It never touches a display, so
+it can run headless, in a worker, or under a profiler.
+
+Intents are tuples whose first field is the kind:
+
+    (SHOW, text, icon)            text to display; icon is None or an icon name
+    (REPEAT, text, icon, count)   the last key of the chord ``text`` is
+                                  autorepeating; ``count`` presses so far
+    (SHORTCUT, text, icon, action)
+                                  the key sequence ``text`` (steps joined by
+                                  ", ") matched a loaded shortcut; shown
+                                  instead of SHOW
+    (SCROLL, text, count, action) scrolling, e.g. "Shift + Scroll ↓"; ``count``
+                                  notches in this run, ``action`` None or a
+                                  name such as "Zoom In"
+    (MOUSE, x, y, dx, dy)         latest pointer position and delta
+    (CLICK, x, y, button, double) mouse button pressed
+    (SELECTION, width, height)    size of the selection being dragged
+    (SELECTED, width, height)     a drag selection completed
+    (LED, led_id, is_on)          lock-key LED changed
+"""
+import time
+
+from . import keys
+from .chord import ChordState
+from .motion import MotionAccumulator
+from .events import button_name
+
+# Intent kinds
+SHOW = 'show'
+REPEAT = 'repeat'
+SHORTCUT = 'shortcut'
+SCROLL = 'scroll'
+MOUSE = 'mouse'
+CLICK = 'click'
+SELECTION = 'selection'
+SELECTED = 'selected'
+LED = 'led'
+
+
+class InputEngine:
+    # Timing
+    DOUBLE_CLICK_THRESHOLD = 0.5
+    DOUBLE_CLICK_POSITION_TOLERANCE = 5
+    # A held key pressed again within this time is autorepeat, not a new press
+    REPEAT_MAX_GAP = 1.0
+
+    # Mouse tracking
+    SELECTION_MIN_SIZE = 5
+    # Scroll events closer together than this add up to one run
+    SCROLL_MAX_GAP = 0.5
+
+    # Wheel direction arrows: (vertical up, down), (horizontal left, right)
+    SCROLL_ARROWS = (('↑', '↓'), ('←', '→'))
+    # Common meaning of a modifier held while scrolling vertically (up, down)
+    SCROLL_ACTIONS = {
+        'Ctrl': ('Zoom In', 'Zoom Out'),
+        'Shift': ('Scroll Left', 'Scroll Right'),
+    }
+
+    # Linux scan codes for Win/Meta keys
+    WIN_SCAN_CODES = {125, 126}
+
+    # Modifier keys
+    MODIFIERS = {'Ctrl', 'Alt', 'Shift', 'Win'}
+
+    # Key name mappings
+    SPECIAL_KEYS = {
+        'ctrl': 'Ctrl', 'control': 'Ctrl', 'lctrl': 'Ctrl', 'rctrl': 'Ctrl',
+        'alt': 'Alt', 'alt gr': 'Alt', 'lalt': 'Alt', 'ralt': 'Alt',
+        'shift': 'Shift', 'lshift': 'Shift', 'rshift': 'Shift',
+        'windows': 'Win', 'meta': 'Win', 'leftmeta': 'Win', 'rightmeta': 'Win',
+        'super': 'Win', 'lwin': 'Win', 'rwin': 'Win', 'cmd': 'Win',
+        'space': 'Space', 'enter': 'Enter', 'tab': 'Tab', 'esc': 'Esc',
+        'up': 'Up ⬆', 'down': 'Down ⬇', 'left': 'Left ⬅', 'right': 'Right ➡',
+        'backspace': 'Backspace ←', 'delete': 'Delete ⌫',
+        'insert': 'Insert', 'home': 'Home', 'end': 'End',
+        'print screen': 'Print Screen 📸',
+        'page up': 'Page Up', 'page down': 'Page Down',
+        'caps lock': 'Caps Lock', 'num lock': 'Num Lock',
+        'f1': 'F1', 'f2': 'F2', 'f3': 'F3', 'f4': 'F4', 'f5': 'F5', 'f6': 'F6',
+        'f7': 'F7', 'f8': 'F8', 'f9': 'F9', 'f10': 'F10', 'f11': 'F11', 'f12': 'F12',
+    }
+
+    def __init__(self):
+        # Precompiled raw key name -> display name table
+        self.key_names = keys.KeyNameTable(self.SPECIAL_KEYS, self.WIN_SCAN_CODES)
+        self._subscribers = []
+        # Optional ShortcutMatcher, see load_shortcuts()
+        self.shortcuts = None
+        self.reset()
+
+    def reset(self):
+        """Initialize all state tracking variables."""
+        # Time of the key press, mouse button or scroll event being handled, for subscribers
+        self.event_time = 0
+
+        # Keyboard state
+        self.chord = ChordState(self.MODIFIERS)
+        self.repeat_key = None
+        self.repeat_count = 0
+        self.last_press_time = 0
+        # Chord texts of the shortcut sequence in progress
+        self._sequence = []
+        if self.shortcuts is not None:
+            self.shortcuts.reset()
+
+        # Click tracking
+        self.last_click_time = 0
+        self.last_click_pos = (0, 0)
+        self.last_click_button = None
+
+        # Mouse tracking
+        self.last_mouse_x = 0
+        self.last_mouse_y = 0
+        self.motion = MotionAccumulator()
+
+        # Scroll tracking
+        self.scroll_text = None
+        self.scroll_amount = 0.0
+        self.last_scroll_time = 0
+
+        # Selection tracking
+        self.selection_start = None
+        self.selection_end = None
+        self.is_selecting = False
+
+        # LED states
+        self.led_states = {}
+
+    def subscribe(self, callback):
+        """Call ``callback(intent)`` for every display intent."""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def _emit(self, intent):
+        for callback in self._subscribers:
+            callback(intent)
+
+    def load_shortcuts(self, paths, cache_dir=None):
+        """Name the actions of chords listed in shortcut catalog files."""
+        from . import shortcuts
+        nodes, actions = shortcuts.load_catalogs(paths, self.SPECIAL_KEYS, cache_dir)
+        self.shortcuts = shortcuts.ShortcutMatcher(nodes, actions)
+        self._sequence = []
+        return self.shortcuts
+
+    def format_key_name(self, key_name):
+        """Format key name for display."""
+        return keys.format_key_name(key_name, self.SPECIAL_KEYS)
+
+    def key_down(self, key_name, event_time=None, scan_code=None):
+        """Handle key press events."""
+        # Single lookup covering Linux Win key handling and display formatting
+        key_name = self.key_names.lookup(key_name, scan_code)
+
+        if not key_name:
+            return
+
+        current_time = self.event_time = event_time or time.time()
+        # Track key press; the chord text is maintained incrementally
+        if (not self.chord.press(key_name) and key_name == self.repeat_key and
+                current_time - self.last_press_time <= self.REPEAT_MAX_GAP):
+            self.last_press_time = current_time
+            if key_name not in self.MODIFIERS:
+                # Autorepeat: only the counter changes
+                self.repeat_count += 1
+                self._emit((REPEAT, self.chord.text, 'win' if self.chord.show_icon else None,
+                            self.repeat_count))
+            return
+
+        self.repeat_key = key_name
+        self.repeat_count = 1
+        self.last_press_time = current_time
+
+        if (self.shortcuts is not None and key_name not in self.MODIFIERS and
+                self._match_shortcut(key_name, current_time)):
+            return
+
+        # Build and display key combination
+        self._display_key_combination()
+
+    def _match_shortcut(self, key_name, current_time):
+        """Emit SHORTCUT if this press completes a catalog entry."""
+        sequence = self._sequence
+        sequence.append(self.chord.text)
+        if len(sequence) > self.shortcuts.max_depth:
+            del sequence[0]
+        matcher = self.shortcuts
+        match = matcher.feed(matcher.chord_key(self.chord.held_modifiers, key_name), current_time)
+        if match is None:
+            return False
+        action, steps = match
+        self._emit((SHORTCUT, ', '.join(sequence[-steps:]), 'win' if self.chord.show_icon else None,
+                    action))
+        return True
+
+    def _display_key_combination(self):
+        """Display the current key combination."""
+        key_text = self.chord.text
+        if key_text is not None:
+            self._emit((SHOW, key_text, 'win' if self.chord.show_icon else None))
+
+    def key_up(self, key_name, event_time=None, scan_code=None):
+        """Handle key release events."""
+        key_name = self.key_names.lookup(key_name, scan_code)
+        self.chord.release(key_name)
+        if key_name == self.repeat_key:
+            self.repeat_key = None
+            self.repeat_count = 0
+
+    def mouse_move(self, x, y, event_time=None):
+        """Handle pointer motion."""
+        # Calculate delta
+        delta_x = x - self.last_mouse_x
+        delta_y = y - self.last_mouse_y
+
+        # Update last position
+        self.last_mouse_x = x
+        self.last_mouse_y = y
+        self.motion.add(x, y, event_time or time.time())
+
+        self._emit((MOUSE, x, y, delta_x, delta_y))
+
+        # Update selection if we're in the middle of selecting
+        if self.is_selecting and self.selection_start:
+            self.selection_end = (x, y)
+            width = abs(self.selection_end[0] - self.selection_start[0])
+            height = abs(self.selection_end[1] - self.selection_start[1])
+            self._emit((SELECTION, width, height))
+
+    def mouse_scroll(self, dx, dy, event_time=None):
+        """Handle wheel or touchpad scrolling (``dy`` > 0 is up, ``dx`` > 0 right).
+
+        Consecutive events in the same direction with the same modifiers add
+        up; each emits the run's total so far, and the UI draws only the
+        latest one per frame.
+        """
+        if abs(dy) >= abs(dx):
+            if not dy:
+                return
+            arrow = self.SCROLL_ARROWS[0][dy < 0]
+            amount = abs(dy)
+        else:
+            arrow = self.SCROLL_ARROWS[1][dx > 0]
+            amount = abs(dx)
+        modifiers = self.chord.held_modifiers
+        text = ' + '.join([*modifiers, f'Scroll {arrow}'])
+
+        current_time = self.event_time = event_time or time.time()
+        if text != self.scroll_text or current_time - self.last_scroll_time > self.SCROLL_MAX_GAP:
+            self.scroll_text = text
+            self.scroll_amount = 0.0
+        self.scroll_amount += amount
+        self.last_scroll_time = current_time
+
+        action = None
+        if abs(dy) >= abs(dx):
+            for modifier in modifiers:
+                actions = self.SCROLL_ACTIONS.get(modifier)
+                if actions is not None:
+                    action = actions[dy < 0]
+                    break
+        self._emit((SCROLL, text, max(1, round(self.scroll_amount)), action))
+
+    def _is_double_click(self, x, y, button, current_time):
+        """Check if this is a double click."""
+        return (current_time - self.last_click_time < self.DOUBLE_CLICK_THRESHOLD and
+                abs(x - self.last_click_pos[0]) < self.DOUBLE_CLICK_POSITION_TOLERANCE and
+                abs(y - self.last_click_pos[1]) < self.DOUBLE_CLICK_POSITION_TOLERANCE and
+                self.last_click_button == button)
+
+    def mouse_click(self, x, y, button, pressed, event_time=None):
+        """Handle mouse button events."""
+        button = button_name(button)
+        current_time = self.event_time = event_time or time.time()
+        if pressed:
+            if button == 'left':
+                self._handle_left_click(x, y, current_time)
+            elif button == 'right':
+                self._emit((CLICK, x, y, 'right', False))
+                self._emit((SHOW, "Right Click", 'right'))
+            elif button == 'middle':
+                self._handle_middle_click(x, y, current_time)
+        else:
+            if button == 'left' and self.is_selecting:
+                self._end_selection()
+
+    def _handle_left_click(self, x, y, current_time):
+        """Handle left mouse button click."""
+        # Start selection
+        self.selection_start = (x, y)
+        self.selection_end = None
+        self.is_selecting = True
+        self._emit((SELECTION, 0, 0))
+
+        # Check for double click
+        if self._is_double_click(x, y, 'left', current_time):
+            self._emit((CLICK, x, y, 'left', True))
+            self._emit((SHOW, "Left Double Click", 'left'))
+        else:
+            self._emit((CLICK, x, y, 'left', False))
+            self._emit((SHOW, "Left Click", 'left'))
+
+        self.last_click_time = current_time
+        self.last_click_pos = (x, y)
+        self.last_click_button = 'left'
+
+    def _handle_middle_click(self, x, y, current_time):
+        """Handle middle mouse button click."""
+        if self._is_double_click(x, y, 'middle', current_time):
+            self._emit((CLICK, x, y, 'middle', True))
+            self._emit((SHOW, "Middle Double Click", 'middle'))
+        else:
+            self._emit((CLICK, x, y, 'middle', False))
+            self._emit((SHOW, "Middle Click", 'middle'))
+
+        self.last_click_time = current_time
+        self.last_click_pos = (x, y)
+        self.last_click_button = 'middle'
+
+    def _end_selection(self):
+        """End the current selection."""
+        self.is_selecting = False
+        if self.selection_start and self.selection_end:
+            width = abs(self.selection_end[0] - self.selection_start[0])
+            height = abs(self.selection_end[1] - self.selection_start[1])
+
+            if width > self.SELECTION_MIN_SIZE or height > self.SELECTION_MIN_SIZE:
+                self._emit((SELECTED, width, height))
+                self._emit((SHOW, f"Selected Area: {width} x {height}", None))
+
+    def led_changed(self, led_id, is_on):
+        """Record a lock-key LED state change."""
+        if self.led_states.get(led_id) != is_on:
+            self.led_states[led_id] = is_on
+            self._emit((LED, led_id, is_on))
@@ -0,0 +1,301 @@
+"""Linux evdev input backend.
+
+Reads keyboards and mice straight from ``/dev/input/event*`` with a single
+epoll loop, instead of the ``keyboard`` read loop plus a pynput listener
+thread. Raw ``input_event`` structs are decoded a whole read at a time with
+``struct.iter_unpack`` and published as event records (see
+``input_monitor.events``) carrying the kernel timestamp and key code. The
+key code is what ``keyboard`` reports as scan code on Linux, so
+``InputEngine.WIN_SCAN_CODES`` applies unchanged.
+
+Pointer motion and wheel notches are coalesced to one record each per
+read. Positions are queried from X11 when available, since the compositor
+applies pointer acceleration that relative motion does not include.
+Otherwise the relative motion is summed and clamped to the screen.
+
+Reading the devices needs root or membership of the ``input`` group.
+"""
+import ctypes
+import ctypes.util
+import fcntl
+import glob
+import os
+import select
+import struct
+import threading
+
+from . import events
+
+# struct input_event { struct timeval time; __u16 type; __u16 code; __s32 value; }
+INPUT_EVENT = struct.Struct('llHHi')
+READ_SIZE = INPUT_EVENT.size * 256
+
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+EV_ABS = 0x03
+
+REL_X = 0x00
+REL_Y = 0x01
+REL_HWHEEL = 0x06
+REL_WHEEL = 0x08
+
+KEY_A = 30
+BTN_LEFT = 0x110
+BUTTONS = {0x110: 'left', 0x111: 'right', 0x112: 'middle'}
+
+# Linux key codes -> names as reported by the keyboard library
+KEY_NAMES = {
+    1: 'esc', 12: '-', 13: '=', 14: 'backspace', 15: 'tab',
+    26: '[', 27: ']', 28: 'enter', 29: 'left ctrl', 39: ';', 40: "'", 41: '`',
+    42: 'left shift', 43: '\\', 51: ',', 52: '.', 53: '/', 54: 'right shift',
+    55: '*', 56: 'left alt', 57: 'space', 58: 'caps lock',
+    69: 'num lock', 70: 'scroll lock', 74: '-', 78: '+', 83: '.',
+    87: 'f11', 88: 'f12', 96: 'enter', 97: 'right ctrl', 98: '/',
+    99: 'print screen', 100: 'alt gr', 102: 'home', 103: 'up', 104: 'page up',
+    105: 'left', 106: 'right', 107: 'end', 108: 'down', 109: 'page down',
+    110: 'insert', 111: 'delete', 119: 'pause', 125: 'left windows',
+    126: 'right windows', 127: 'menu',
+}
+KEY_NAMES.update(zip(range(2, 12), '1234567890'))
+KEY_NAMES.update(zip(range(16, 26), 'qwertyuiop'))
+KEY_NAMES.update(zip(range(30, 39), 'asdfghjkl'))
+KEY_NAMES.update(zip(range(44, 51), 'zxcvbnm'))
+KEY_NAMES.update(zip(range(59, 69), (f'f{i}' for i in range(1, 11))))
+KEY_NAMES.update(zip((71, 72, 73, 75, 76, 77, 79, 80, 81, 82), '7894561230'))
+
+
+def _eviocgbit(ev_type, length):
+    """EVIOCGBIT ioctl request number."""
+    return (2 << 30) | (length << 16) | (ord('E') << 8) | (0x20 + ev_type)
+
+
+def _has_bit(bits, bit):
+    return bits[bit // 8] >> (bit % 8) & 1
+
+
+def device_kind(fd):
+    """'keyboard', 'mouse' or None for an open event device."""
+    ev_bits = bytearray(4)
+    fcntl.ioctl(fd, _eviocgbit(0, len(ev_bits)), ev_bits)
+    if not _has_bit(ev_bits, EV_KEY):
+        return None
+    key_bits = bytearray(96)
+    fcntl.ioctl(fd, _eviocgbit(EV_KEY, len(key_bits)), key_bits)
+    if _has_bit(key_bits, KEY_A):
+        return 'keyboard'
+    if _has_bit(key_bits, BTN_LEFT) and (_has_bit(ev_bits, EV_REL) or _has_bit(ev_bits, EV_ABS)):
+        return 'mouse'
+    return None
+
+
+class X11Pointer:
+    """Pointer position from XQueryPointer on a private Display connection."""
+
+    def __init__(self):
+        path = ctypes.util.find_library('X11')
+        if not path:
+            raise OSError('libX11 not found')
+        x11 = ctypes.cdll.LoadLibrary(path)
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XQueryPointer.argtypes = [ctypes.c_void_p, ctypes.c_ulong,
+                                      ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+                                      ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                      ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                      ctypes.POINTER(ctypes.c_uint)]
+        self._x11 = x11
+        self._display = x11.XOpenDisplay(None)
+        if not self._display:
+            raise OSError('cannot open X display')
+        self._root = x11.XDefaultRootWindow(self._display)
+        self._windows = (ctypes.c_ulong(), ctypes.c_ulong())
+        self._x, self._y = ctypes.c_int(), ctypes.c_int()
+        self._win_xy = (ctypes.c_int(), ctypes.c_int())
+        self._mask = ctypes.c_uint()
+
+    def __call__(self):
+        byref = ctypes.byref
+        self._x11.XQueryPointer(self._display, self._root,
+                                byref(self._windows[0]), byref(self._windows[1]),
+                                byref(self._x), byref(self._y),
+                                byref(self._win_xy[0]), byref(self._win_xy[1]), byref(self._mask))
+        return self._x.value, self._y.value
+
+    def close(self):
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+class _Device:
+    """Per-device decode state."""
+
+    __slots__ = ('fd', 'kind', 'partial')
+
+    def __init__(self, fd, kind):
+        self.fd = fd
+        self.kind = kind
+        self.partial = b''
+
+
+class EvdevBackend:
+    """Publish keyboard and mouse event records from evdev devices.
+
+    ``publish(record)`` is called on the backend thread. ``pointer`` returns
+    the current pointer position; without it positions are summed from
+    relative motion, starting at ``position`` and clamped to ``screen_size``.
+    """
+
+    def __init__(self, publish, pointer=None, position=(0, 0), screen_size=None):
+        self.publish = publish
+        self.pointer = pointer
+        self.x, self.y = position
+        self.screen_size = screen_size
+        self._devices = {}
+        self._epoll = select.epoll()
+        self._wake_r, self._wake_w = os.pipe()
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+        self._thread = None
+
+    def open_devices(self, pattern='/dev/input/event*'):
+        """Open every readable keyboard and mouse; return how many were found."""
+        for path in sorted(glob.glob(pattern)):
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                continue
+            try:
+                kind = device_kind(fd)
+            except OSError:
+                kind = None
+            if kind is None:
+                os.close(fd)
+            else:
+                self.add_fd(fd, kind)
+        return len(self._devices)
+
+    def add_fd(self, fd, kind):
+        """Watch an already open device (or pipe carrying input_event bytes)."""
+        self._devices[fd] = _Device(fd, kind)
+        self._epoll.register(fd, select.EPOLLIN)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='evdev', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the loop and close all devices."""
+        if self._thread is not None:
+            os.write(self._wake_w, b'\0')
+            self._thread.join()
+            self._thread = None
+        for fd in self._devices:
+            os.close(fd)
+        self._devices.clear()
+        self._epoll.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+        close = getattr(self.pointer, 'close', None)
+        if close is not None:
+            close()
+
+    def _run(self):
+        devices = self._devices
+        while True:
+            for fd, mask in self._epoll.poll():
+                if fd == self._wake_r:
+                    return
+                device = devices[fd]
+                try:
+                    data = os.read(fd, READ_SIZE)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    data = b''
+                if not data:
+                    # Device unplugged (or pipe closed)
+                    self._epoll.unregister(fd)
+                    continue
+                self.feed(device, data)
+
+    def feed(self, device, data):
+        """Decode a chunk of input_event bytes and publish the records."""
+        if device.partial:
+            data = device.partial + data
+        size = INPUT_EVENT.size
+        whole = len(data) - len(data) % size
+        device.partial = data[whole:]
+        if not whole:
+            return
+        publish = self.publish
+        moved = False
+        dx = dy = 0
+        wheel_x = wheel_y = 0
+        t = 0.0
+        for sec, usec, ev_type, code, value in INPUT_EVENT.iter_unpack(memoryview(data)[:whole]):
+            if ev_type == EV_SYN:
+                continue
+            t = sec + usec * 1e-6
+            if ev_type == EV_REL:
+                if code == REL_X:
+                    dx += value
+                    moved = True
+                elif code == REL_Y:
+                    dy += value
+                    moved = True
+                elif code == REL_WHEEL:
+                    wheel_y += value
+                elif code == REL_HWHEEL:
+                    wheel_x += value
+            elif ev_type == EV_ABS:
+                moved = True
+            elif ev_type == EV_KEY:
+                button = BUTTONS.get(code)
+                if button is not None:
+                    if moved:
+                        self._move(dx, dy, t)
+                        moved = False
+                        dx = dy = 0
+                    publish((events.MOUSE_CLICK, t, self.x, self.y, button, value != 0))
+                    continue
+                name = KEY_NAMES.get(code)
+                if name is None:
+                    continue
+                # value 2 is autorepeat, reported as a press like the keyboard library does
+                kind = events.KEY_UP if value == 0 else events.KEY_DOWN
+                publish((kind, t, name, code))
+        if moved:
+            self._move(dx, dy, t)
+        if wheel_x or wheel_y:
+            publish((events.MOUSE_SCROLL, t, wheel_x, wheel_y))
+
+    def _move(self, dx, dy, t):
+        if self.pointer is not None:
+            self.x, self.y = self.pointer()
+        elif dx or dy:
+            x, y = self.x + dx, self.y + dy
+            if self.screen_size is not None:
+                width, height = self.screen_size
+                x = min(max(x, 0), width - 1)
+                y = min(max(y, 0), height - 1)
+            self.x, self.y = x, y
+        else:
+            return
+        self.publish((events.MOUSE_MOVE, t, self.x, self.y))
+
+
+def create_backend(publish, position=(0, 0), screen_size=None):
+    """Open an EvdevBackend on the input devices, or raise OSError."""
+    try:
+        pointer = X11Pointer()
+    except (OSError, AttributeError):
+        pointer = None
+    backend = EvdevBackend(publish, pointer, position, screen_size)
+    if not backend.open_devices():
+        backend.stop()
+        raise OSError('no readable keyboard or mouse in /dev/input; root or the input group is required')
+    return backend
@@ -0,0 +1,79 @@
+"""Hand-off of raw input events from listener threads to the Tk main loop."""
+import collections
+
+# Event record kinds. Records are tuples ``(kind, time, ...)``:
+#   (KEY_DOWN, time, name, scan_code)
+#   (KEY_UP, time, name, scan_code)
+#   (MOUSE_MOVE, time, x, y)
+#   (MOUSE_CLICK, time, x, y, button, pressed)
+#   (LED_CHANGE, time, led_id, is_on)
+#   (SELECTION, time, width, height)     completed drag selection
+#   (MOUSE_SCROLL, time, dx, dy)         wheel notches, fractional for
+#                                        smooth scrolling; dy > 0 is up
+KEY_DOWN = 0
+KEY_UP = 1
+MOUSE_MOVE = 2
+MOUSE_CLICK = 3
+LED_CHANGE = 4
+SELECTION = 5
+MOUSE_SCROLL = 6
+
+# Scroll deltas are stored in 1/WHEEL_DELTA notch units by binary formats
+WHEEL_DELTA = 120
+
+BUTTONS = ('left', 'right', 'middle')
+LED_IDS = ('caps_lock', 'num_lock', 'scroll_lock')
+
+
+def button_name(button):
+    """Return 'left'/'right'/'middle' for a pynput Button or a plain name."""
+    return getattr(button, 'name', button)
+
+
+def dispatch(record, target):
+    """Feed one event record into an object with the InputEngine event API."""
+    kind = record[0]
+    if kind == MOUSE_MOVE:
+        target.mouse_move(record[2], record[3], record[1])
+    elif kind == KEY_DOWN:
+        target.key_down(record[2], record[1], record[3])
+    elif kind == KEY_UP:
+        target.key_up(record[2], record[1], record[3])
+    elif kind == MOUSE_CLICK:
+        target.mouse_click(record[2], record[3], record[4], record[5], record[1])
+    elif kind == MOUSE_SCROLL:
+        target.mouse_scroll(record[2], record[3], record[1])
+    elif kind == LED_CHANGE:
+        target.led_changed(record[2], record[3])
+
+
+class EventQueue:
+    """Bounded FIFO of compact event tuples.
+
+    Listener threads only append records; the Tk thread drains the whole
+    backlog in one batch per tick. ``deque.append`` and ``deque.popleft`` are
+    atomic in CPython, so producers never take a lock.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items = collections.deque()
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, record):
+        """Append a record, dropping it if the queue is full."""
+        if len(self._items) >= self.maxsize:
+            self.dropped += 1
+            return False
+        self._items.append(record)
+        return True
+
+    def drain(self, limit=None):
+        """Remove and return up to ``limit`` queued records, oldest first."""
+        items = self._items
+        count = len(items) if limit is None else min(limit, len(items))
+        pop = items.popleft
+        return [pop() for _ in range(count)]
@@ -0,0 +1,141 @@
+"""Bounded-memory mouse movement heatmap and click map.
+
+``HeatmapAggregator`` subscribes to the input engine and bins pointer
+positions and clicks into fixed-size screen grids of ``array`` counters.
+Move samples are buffered and folded into the grid in batches, so the
+per-event cost is one append and memory stays constant however long the
+session runs. Grids are rendered with a 256-color palette, one bytes row at
+a time, into PNG data or a Tk ``PhotoImage``.
+"""
+import array
+import base64
+import math
+
+from . import engine, png
+
+
+def heat_palette():
+    """256 colors from black through blue, cyan, yellow to red."""
+    stops = [(0, (0, 0, 0)), (64, (0, 0, 180)), (128, (0, 200, 220)),
+             (192, (255, 230, 0)), (255, (255, 30, 0))]
+    palette = []
+    for (i0, c0), (i1, c1) in zip(stops, stops[1:]):
+        for i in range(i0, i1):
+            f = (i - i0) / (i1 - i0)
+            palette.append(tuple(int(a + (b - a) * f) for a, b in zip(c0, c1)))
+    palette.append(stops[-1][1])
+    return palette
+
+
+class HeatmapAggregator:
+    """Screen grids of pointer samples and clicks."""
+
+    CELL_SIZE = 8
+    BATCH_SIZE = 1024
+
+    def __init__(self, screen_width, screen_height, cell_size=None):
+        self.cell = cell_size or self.CELL_SIZE
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.grid_width = -(-screen_width // self.cell)
+        self.grid_height = -(-screen_height // self.cell)
+        cells = self.grid_width * self.grid_height
+        self.moves = array.array('L', [0]) * cells
+        self.clicks = array.array('L', [0]) * cells
+        self._pending = array.array('l')
+        self.samples = 0
+
+    def attach(self, input_engine):
+        """Subscribe to ``input_engine`` intents."""
+        input_engine.subscribe(self.on_intent)
+        return self
+
+    def on_intent(self, intent):
+        kind = intent[0]
+        if kind == engine.MOUSE:
+            pending = self._pending
+            pending.append(int(intent[1]))
+            pending.append(int(intent[2]))
+            if len(pending) >= 2 * self.BATCH_SIZE:
+                self.flush()
+        elif kind == engine.CLICK:
+            index = self._index(intent[1], intent[2])
+            if index is not None:
+                self.clicks[index] += 1
+
+    def _index(self, x, y):
+        x, y = int(x), int(y)
+        if 0 <= x < self.screen_width and 0 <= y < self.screen_height:
+            return (y // self.cell) * self.grid_width + x // self.cell
+        return None
+
+    def flush(self):
+        """Fold buffered move samples into the grid."""
+        pending = self._pending
+        if not pending:
+            return
+        moves = self.moves
+        cell = self.cell
+        grid_width = self.grid_width
+        width, height = self.screen_width, self.screen_height
+        xs = pending[0::2]
+        ys = pending[1::2]
+        for x, y in zip(xs, ys):
+            if 0 <= x < width and 0 <= y < height:
+                moves[(y // cell) * grid_width + x // cell] += 1
+        self.samples += len(xs)
+        del pending[:]
+
+    def levels(self, counts):
+        """Yield one bytes row of 0-255 levels (log scaled) per grid row."""
+        peak = max(counts) if counts else 0
+        scale = 255 / math.log1p(peak) if peak else 0
+        log1p = math.log1p
+        # Counts repeat a lot (especially 0), so memoize their levels
+        lut = {0: 0}
+        grid_width = self.grid_width
+        for start in range(0, len(counts), grid_width):
+            row = counts[start:start + grid_width]
+            levels = bytearray(grid_width)
+            for i, c in enumerate(row):
+                if c:
+                    level = lut.get(c)
+                    if level is None:
+                        level = lut[c] = int(log1p(c) * scale)
+                    levels[i] = level
+            yield levels
+
+    def render_png(self, which='moves', scale=1):
+        """Render a grid ('moves' or 'clicks') as PNG bytes."""
+        self.flush()
+        counts = self.moves if which == 'moves' else self.clicks
+        rows = self.levels(counts)
+        if scale > 1:
+            rows = self._upscale(rows, scale)
+        return png.encode_indexed(self.grid_width * scale, self.grid_height * scale,
+                                  rows, heat_palette())
+
+    @staticmethod
+    def _upscale(rows, scale):
+        for row in rows:
+            wide = bytearray(len(row) * scale)
+            for offset in range(scale):
+                wide[offset::scale] = row
+            for _ in range(scale):
+                yield wide
+
+    def photo_image(self, master, which='moves', scale=1):
+        """Render a grid into a Tk ``PhotoImage``."""
+        import tkinter as tk
+        data = base64.b64encode(self.render_png(which, scale)).decode('ascii')
+        return tk.PhotoImage(master=master, data=data)
+
+    def save(self, prefix, scale=1):
+        """Write ``<prefix>-moves.png`` and ``<prefix>-clicks.png``; return the paths."""
+        paths = []
+        for which in ('moves', 'clicks'):
+            path = f'{prefix}-{which}.png'
+            with open(path, 'wb') as f:
+                f.write(self.render_png(which, scale))
+            paths.append(path)
+        return paths
@@ -0,0 +1,138 @@
+"""Fading list of the most recent chords, clicks and scrolls."""
+import tkinter as tk
+
+from .chord import PARTIAL_SUFFIX
+
+
+def fade(color, background, amount):
+    """Blend two ``#rrggbb`` colors; ``amount`` 0 is ``color``, 1 is ``background``."""
+    start = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+    end = [int(background[i:i + 2], 16) for i in (1, 3, 5)]
+    return '#' + ''.join(f'{round(a + (b - a) * amount):02x}' for a, b in zip(start, end))
+
+
+class HistoryStrip:
+    """The last ``size`` entries on a Canvas, newest at the top.
+
+    Entries live in a preallocated ring buffer whose slots each own one text
+    item. A new entry shifts every item down one row with a single tagged
+    ``move``, reuses the oldest slot's item for the top row and recolors
+    only the items that crossed into a dimmer fade band, so its cost does
+    not depend on ``size`` or on how long the session has been running.
+    Repeated entries and autorepeat update the top row in place.
+    """
+
+    TAG = 'history'
+    FADE_LEVELS = 4
+    # Fade of the dimmest band towards the background
+    MAX_FADE = 0.7
+    PAD_X = 4
+
+    def __init__(self, canvas, size, font, color, background):
+        self.canvas = canvas
+        self.size = size
+        self.row_height = font.metrics('linespace')
+        self._texts = [None] * size
+        self._captions = [None] * size
+        self._counts = [0] * size
+        self._items = [
+            canvas.create_text(self.PAD_X, 0, anchor=tk.NW, fill=color, font=font,
+                               tags=(self.TAG,), state=tk.HIDDEN)
+            for _ in range(size)
+        ]
+        self._head = size - 1
+        self._length = 0
+        # Presses before the current autorepeat run of the top entry
+        self._repeat_base = 0
+        levels = min(self.FADE_LEVELS, size)
+        self._colors = [fade(color, background, self.MAX_FADE * level / max(1, levels - 1))
+                        for level in range(levels)]
+        # Rows where the fade band changes, with the band's color
+        self._band_starts = [(row, self._colors[row * levels // size])
+                             for row in range(1, size)
+                             if row * levels // size != (row - 1) * levels // size]
+
+    def __len__(self):
+        return self._length
+
+    def entries(self):
+        """(text, caption, count) of each entry, newest first."""
+        return [(self._texts[slot], self._captions[slot], self._counts[slot])
+                for slot in (self._slot(row) for row in range(self._length))]
+
+    def push(self, text, caption=None):
+        """Add an entry; the same entry twice in a row counts up instead."""
+        head = self._head
+        if (self._length and self._texts[head] == text and self._captions[head] == caption and
+                not text.endswith(PARTIAL_SUFFIX)):
+            self._counts[head] += 1
+            self._repeat_base = self._counts[head] - 1
+            self._redraw_head()
+            return
+        self._add(text, caption, 1)
+
+    def repeat(self, text, count):
+        """Show ``count`` autorepeated presses on the top entry if it is ``text``."""
+        if self._length and self._texts[self._head] == text:
+            self._counts[self._head] = self._repeat_base + count
+            self._redraw_head()
+
+    def scroll(self, text, count, caption=None):
+        """Show a scroll run of ``count`` notches, updating it while it grows."""
+        head = self._head
+        if (self._length and self._texts[head] == text and self._captions[head] == caption and
+                count >= self._counts[head]):
+            self._counts[head] = count
+            self._redraw_head()
+        else:
+            self._add(text, caption, count)
+
+    def _slot(self, row):
+        return (self._head - row) % self.size
+
+    def _add(self, text, caption, count):
+        head = self._head
+        if self._length and self._extends(self._texts[head], text, caption):
+            self._set_head(text, caption, count)
+            return
+        canvas = self.canvas
+        canvas.move(self.TAG, 0, self.row_height)
+        self._head = head = (head + 1) % self.size
+        self._length = min(self._length + 1, self.size)
+        item = self._items[head]
+        canvas.coords(item, self.PAD_X, 0)
+        canvas.itemconfig(item, fill=self._colors[0], state=tk.NORMAL)
+        self._set_head(text, caption, count)
+        for row, color in self._band_starts:
+            if row >= self._length:
+                break
+            canvas.itemconfig(self._items[self._slot(row)], fill=color)
+
+    @staticmethod
+    def _extends(previous, text, caption):
+        """True if ``text`` completes ``previous`` rather than following it."""
+        if previous.endswith(PARTIAL_SUFFIX):
+            # A chord still being built, e.g. "Ctrl + ..."
+            return True
+        if caption:
+            # A shortcut sequence replaces its first steps
+            return text.startswith(previous + ', ')
+        # More keys pressed while the previous chord is still held
+        return text.startswith(previous + ' + ')
+
+    def _set_head(self, text, caption, count):
+        head = self._head
+        self._texts[head] = text
+        self._captions[head] = caption
+        self._counts[head] = count
+        self._repeat_base = 0
+        self._redraw_head()
+
+    def _redraw_head(self):
+        head = self._head
+        text = self._texts[head]
+        if self._counts[head] > 1:
+            text += f" ×{self._counts[head]}"
+        if self._captions[head]:
+            text += f"  {self._captions[head]}"
+        self.canvas.itemconfig(self._items[head], text=text)
@@ -0,0 +1,226 @@
+"""Input hooks hosted in a child process.
+
+The pynput mouse listener and the ``keyboard`` read loop normally share the
+GIL with Tk, so a slow redraw delays hook callbacks (and the OS may drop
+hooks that respond slowly). ``HookProcess`` runs both in a dedicated
+process that writes fixed-size records into a shared-memory ring buffer,
+which the Tk process drains in batches.
+
+Ring layout: a 64-byte header of uint64 counters (records written, records
+read, records dropped) followed by ``capacity`` 64-byte slots
+``<d B B H i i 32s``: time, kind, flags, code, x, y, key name (UTF-8). The
+field meanings match ``input_monitor.recorder``. Only the child advances
+the write counter and only the parent advances the read counter; a full
+ring drops new records rather than blocking the hooks.
+"""
+import multiprocessing
+import struct
+import threading
+import time
+
+from . import events
+
+COUNTERS = struct.Struct('<QQQ')
+HEADER_SIZE = 64
+SLOT = struct.Struct('<dBBHii32s12x')
+
+WRITTEN = 0
+READ = 8
+DROPPED = 16
+
+NO_SCAN_CODE = 0xFFFF
+NAME_SIZE = 32
+
+_BUTTON_INDEX = {name: i + 1 for i, name in enumerate(events.BUTTONS)}
+
+_U64 = struct.Struct('<Q')
+
+
+class RingBuffer:
+    """Single-producer, single-consumer ring of event slots over a buffer."""
+
+    def __init__(self, buf, capacity):
+        self.buf = buf
+        self.capacity = capacity
+
+    @staticmethod
+    def size(capacity):
+        return HEADER_SIZE + capacity * SLOT.size
+
+    def __len__(self):
+        written, read, _ = COUNTERS.unpack_from(self.buf, 0)
+        return written - read
+
+    @property
+    def dropped(self):
+        return _U64.unpack_from(self.buf, DROPPED)[0]
+
+    def put(self, t, kind, flags=0, code=0, x=0, y=0, name=b''):
+        """Producer: store one record; False if the ring is full."""
+        buf = self.buf
+        written, read, dropped = COUNTERS.unpack_from(buf, 0)
+        if written - read >= self.capacity:
+            _U64.pack_into(buf, DROPPED, dropped + 1)
+            return False
+        SLOT.pack_into(buf, HEADER_SIZE + (written % self.capacity) * SLOT.size,
+                       t, kind, flags, code, x, y, name)
+        # Publish only after the slot is complete
+        _U64.pack_into(buf, WRITTEN, written + 1)
+        return True
+
+    def drain(self):
+        """Consumer: remove and return all stored records as event tuples."""
+        buf = self.buf
+        written, read, _ = COUNTERS.unpack_from(buf, 0)
+        count = written - read
+        if not count:
+            return []
+        capacity = self.capacity
+        start = read % capacity
+        first = min(count, capacity - start)
+        view = memoryview(buf)
+        records = []
+        self._decode(view[HEADER_SIZE + start * SLOT.size:HEADER_SIZE + (start + first) * SLOT.size], records)
+        if first < count:
+            self._decode(view[HEADER_SIZE:HEADER_SIZE + (count - first) * SLOT.size], records)
+        view.release()
+        _U64.pack_into(buf, READ, written)
+        return records
+
+    @staticmethod
+    def _decode(view, records):
+        append = records.append
+        buttons = events.BUTTONS
+        for t, kind, flags, code, x, y, name in SLOT.iter_unpack(view):
+            if kind == events.MOUSE_MOVE:
+                append((kind, t, x, y))
+            elif kind == events.KEY_DOWN or kind == events.KEY_UP:
+                append((kind, t or None, name.rstrip(b'\0').decode('utf-8', 'replace'),
+                        None if code == NO_SCAN_CODE else code))
+            elif kind == events.MOUSE_CLICK:
+                append((kind, t, x, y, buttons[code - 1] if 0 < code <= len(buttons) else None, bool(flags)))
+            elif kind == events.MOUSE_SCROLL:
+                append((kind, t, x / events.WHEEL_DELTA, y / events.WHEEL_DELTA))
+
+
+# ---------------------------------------------------------------------------
+# Child process
+
+def _encode_name(name):
+    data = name.encode('utf-8') if isinstance(name, str) else b''
+    if len(data) > NAME_SIZE:
+        # Cut on a character boundary
+        data = data[:NAME_SIZE].decode('utf-8', 'ignore').encode('utf-8')
+    return data
+
+
+def run_hooks(shm_name, capacity, stop):
+    """Child process main: run the hooks until ``stop`` is set or the parent dies."""
+    from multiprocessing import shared_memory
+    from pynput import mouse
+    import keyboard as kb
+
+    # The segment is owned (and unlinked) by the parent; spawned children
+    # share its resource tracker, so attaching here needs no cleanup
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = RingBuffer(shm.buf, capacity)
+    # Mouse callbacks and the keyboard loop run on different threads
+    lock = threading.Lock()
+
+    def on_move(x, y):
+        with lock:
+            ring.put(time.time(), events.MOUSE_MOVE, 0, 0, int(x), int(y))
+
+    def on_click(x, y, button, pressed):
+        code = _BUTTON_INDEX.get(events.button_name(button), 0)
+        with lock:
+            ring.put(time.time(), events.MOUSE_CLICK, bool(pressed), code, int(x), int(y))
+
+    def on_scroll(x, y, dx, dy):
+        wheel = events.WHEEL_DELTA
+        with lock:
+            ring.put(time.time(), events.MOUSE_SCROLL, 0, 0, round(dx * wheel), round(dy * wheel))
+
+    def keyboard_loop():
+        while True:
+            try:
+                event = kb.read_event()
+            except ImportError:
+                return
+            except Exception:
+                time.sleep(0.1)
+                continue
+            if event.event_type == kb.KEY_DOWN:
+                kind = events.KEY_DOWN
+            elif event.event_type == kb.KEY_UP:
+                kind = events.KEY_UP
+            else:
+                continue
+            scan_code = getattr(event, 'scan_code', None)
+            code = NO_SCAN_CODE if scan_code is None else scan_code & 0xFFFF
+            with lock:
+                ring.put(getattr(event, 'time', None) or 0.0, kind, 0, code, 0, 0, _encode_name(event.name))
+
+    listener = mouse.Listener(on_move=on_move, on_click=on_click, on_scroll=on_scroll)
+    listener.start()
+    threading.Thread(target=keyboard_loop, daemon=True).start()
+    parent = multiprocessing.parent_process()
+    try:
+        while not stop.wait(0.5):
+            if parent is not None and not parent.is_alive():
+                break
+    finally:
+        listener.stop()
+        shm.close()
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+
+class HookProcess:
+    """Start the hook process and drain its records on the Tk thread."""
+
+    CAPACITY = 1 << 13
+    STOP_TIMEOUT = 1.0
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity or self.CAPACITY
+        self._shm = None
+        self._ring = None
+        self._process = None
+        self._stop = None
+
+    @property
+    def dropped(self):
+        return self._ring.dropped if self._ring is not None else 0
+
+    def start(self):
+        from multiprocessing import shared_memory
+        self._shm = shared_memory.SharedMemory(create=True, size=RingBuffer.size(self.capacity))
+        self._shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        self._ring = RingBuffer(self._shm.buf, self.capacity)
+        # Never fork a process that already holds a Tk/X connection
+        context = multiprocessing.get_context('spawn')
+        self._stop = context.Event()
+        self._process = context.Process(target=run_hooks, name='input-hooks', daemon=True,
+                                        args=(self._shm.name, self.capacity, self._stop))
+        self._process.start()
+
+    def drain(self):
+        """Records written by the hooks since the last call, oldest first."""
+        return self._ring.drain()
+
+    def stop(self):
+        """Stop the child process and free the shared memory."""
+        if self._process is not None:
+            self._stop.set()
+            self._process.join(self.STOP_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        if self._shm is not None:
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -0,0 +1,734 @@
+"""Pre-scaled icon images. Generated by packaging/build_icons.py; do not edit."""
+
+ICONS = {
+    ('win', 26): (
+        'iVBORw0KGgoAAAANSUhEUgAAABoAAAAaCAYAAACpSkzOAAABGElEQVR42u3WP0sCARjHccNC13CV'
+        'oKmX4Gi4hS8gHCTE/IMKIYkeBhpYQkKJg5vcLLgpzb2AFicHwUFodbIhMMzvyROInnGKCskdfDg4'
+        '7nl+B3c891gs//JQOlY4cY5rPCGybjPNMVy4wiMaaGOInznqX42OcAoPAshLQxs+MNZpuIw629yL'
+        'F7yiiy+dgh7s+F4hZCGoZaBgI0FNM8gM2vlXF0YFZTyjhCIKuEcOCRziTmShIIMUkriR+2KITseP'
+        '0nHPBl3OFael+FbOaSnWZllIHswo936/o5b5eZuT4TfIhxre0MdoO0GLv3Kt4RkuEJdpUZXrn5sJ'
+        'MrbpnMimE5Rdoo53DHT2CXUb69YBHLIh+fEwHUO7PCbKzEB4P24sUQAAAABJRU5ErkJggg=='
+    ),
+    ('win', 39): (
+        'iVBORw0KGgoAAAANSUhEUgAAACcAAAAnCAYAAACMo1E1AAABfUlEQVR42u3YPyiEcRzH8UN3uXSD'
+        'wWCRMhlNTDJYkCxGkzKIySBWZVG6TP5FJFHypwv5l5QklCguMWGTM1FK/ry/7juJ556c8xx9n3p1'
+        'z9V1z+f33O96Pn19PjtcHh1REfA6RACFqEQzehFBFNe/ESAT+ShHE3qwgFPc4wWvn4j95M8gslCH'
+        'ToxjD3cOAZzE3F48AzkoRjVa9A5MYweXqEIIT98I4iJcPEQRatCGQWziysVFa1MdLpTEl1k4C2fh'
+        'LJyFs3AehZOH+wXOcaa96gTHOMQ+drGNLX3ubmAdZQhiBWtY1fNlLGpPk6o0ixktDZOYwBhGMYJh'
+        'DCH8VfWJS7N6HEyw6nlduZjT9xH9nNy5bPTrypMVtj+EhbNwFs7CWbh/EE6GLhVoRDemtInc4Nnb'
+        'cM6TolyUoB7tGNCCIBXr0btwiSdMfp21yWsr+rCknfAhtVOm5MJL4IIP20WK5gFuHbZLzOv+KNsl'
+        'D6VoQJcGP3ofq6XxTNj/J+bXb9amRvWt/SD7AAAAAElFTkSuQmCC'
+    ),
+    ('win', 52): (
+        'iVBORw0KGgoAAAANSUhEUgAAADQAAAA0CAYAAADFeBvrAAACS0lEQVR42u3ay0uUURjH8XG8FGpe'
+        'CgpJMsKgbKMQtEnaBKFdNi1aJC5atBACwc1shCRcG9FfYCDSMrFN2yAiikSdqCiSvF+otFJTp77v'
+        'zC/e12GaMZwZ55XnwAfh1ZlzfmcOwvPMCQRs2Ej/CIXzUILjaMYhPyw64Fl0E27hHh7jHb4jgt9o'
+        'zKWFF+EozqMNPRjE27hFJ9O4E7tdjtO4jjt4iCF8w8YWFp3FQLEFB7Xok6jX8xLt9hjWtrnoNAaK'
+        'LTgf+9GAq+jAfQxopxc8O/1Er6vErwwGSRHI3eV6XEMnHuAZprG+xQlyIFAofAUfsZKGCXIi0M00'
+        'TmCBLJAFskAWyAJZIAtkgSyQBfrfQBHZUAXqLHYVy/iJH+oDDOg9K/AFS7KokvurnjtF4RxmMIUJ'
+        'fMYnlTLv1Vt4g1EMq5h8jVfyMlp0JghUrg5LLY6pcXEE1ajCQRzQrpehFMXYiz1qdhRKgafSdZ9t'
+        'lu8RjJMXJ5DSP6rVwiSTJpo4nvu3m8v3zEsQ6EaCo/H3WMxjVmW4czQmdTzG9XNKv5vTax7pPZ1P'
+        '8rmORSY12D8FC2SBLJAFskAWyAJZIAtkgbIZqFWV564JFFT9cgIXdS/gbrS2CYVHVDZH/BMo9c0N'
+        'p8Q+jLP6NG+jF09V5K37J1Dqb8idwPtwCpei39e6FeuHLITK4sUL94pLHS6jXVdcBtXNWcq9ixfb'
+        'C+x0jGpwTn2NbvTjhfoYa/4KlDxsQfSmVSh8Bi3oQp8aI96LHj4JlPwYF6lveMEf18tsxMYfCfaI'
+        '4UdjZgEAAAAASUVORK5CYII='
+    ),
+    ('left', 48): (
+        'iVBORw0KGgoAAAANSUhEUgAAACcAAAAwCAYAAACScGMWAAAJNUlEQVR42u2ZfXRT5R3Hk9aKKJsc'
+        'HMJEUBSKMstkDtimMiZnUKCkb0lu7r3Py715a5q0TfqaviRNG5q+UQQLLcrbcEOPAw94Nnd2xs5R'
+        'AbdxDiLHwkpbKKVQoFCYtLYW2iR3z5OkFZh6bAqyP3jO+Z3kJum5n/ye3/f7+z2pTHZv3Vv31shX'
+        '966dEadeXftUQ+36l1ve2x3xfwHVVlUu6yivHN9WusrR4lm1v23jRvPV/R/dfbjGTVvlR1Y55jUW'
+        '298/WVZWevnNP0w8fWDf3c9Y++qaiFZnETrqdv7lRLVn/oXfvRl5vr5mWvOaSkPLts0T7xpYU3VV'
+        '5DF7Pjxht+84X1055fzWt+5vraliGkrtexvLS7IJ3EN3Beyz6vWyU87SZU2FRXtaKismdG7Z/MAx'
+        'j8fdWFz87okNq6OPbtkSsb+qLGpvSenNtVldLrviqpZfyi+9r6PENe5Tx+oIEUK5mlFHJSiTIxYv'
+        'Xix/4WfzRwfX6nA/3ppX+P4Jd9nT5/74TlRzqdtzzFFc21S7btyl7XWTmsqdFZ+4HVsPesrG0M8f'
+        'fq1a3llWMvWiLUN/JcX8drcupfGSXnehrSBfacQYQAg6OAAPajTchvjExGU/X7Bg3CM/CqMqmupf'
+        'l7fkFDhPF+anHnr9DXmbp2TlCVfRro61VeM76+ofa3YX/anJU1BwvKrk4V0b62XtedmPdVnNFRdT'
+        'xHP9kPcNAE66BlmpB7NSW7bVajMZPRgACSIkQYgkHoLryYzqUGxsLD9//vxx0dHRI8ja6roxDQUl'
+        'Ve1VFRMat22JPOrM33G+0rXw1Mb6Bxpdrm3HPa70c5s2RjWtrZGfdeXGXknBx/oh5x/kgeRnNZKf'
+        '46RBnpO6MZRO5uRYM1NN5ZgAQwQlROAQhBLAQAIAXE9MTHxv4cKFMyZNmvTd4Bpq6mX/9FTLP925'
+        'XbZv+w7Zh27X1M821Eaefa3m0aOlrtWn39j04NUNmyPOFjqELoO220uy5IOcNECAvFAt+XgCyHLS'
+        '5yKSTtrtmRmpxnIEg3CYwGEIJIRo0ExCSa1WHye1OCd65szw6/D4+nVEKNURddvtsi6XK/6qTttN'
+        'tlHy81CSKBCvlryADcJpGOmyVpSaS4qzbRaLGxEgGAALBt3iQBZR8Dmj4Zpil8fNHLWSL6+pmX7R'
+        'ktZEt3GQwFA4P0+gAEPA6DUn9QnI35Fl3fk3R+Ess8n0jKAVdwOM/MFtDcGFAgauBUnNsO8uWbps'
+        'bNhg24oc8suF+TV95EaShsIwARhaZz4KyrGSlwNSV3ra6R2FuXNTBfyxVqf/s95imcmLQiv8OjgS'
+        'AGKJB+hafEJiwpQZc8KDO19TMbHLZDgzAGnhUzAaGkni2ED26PUAz0ttZsvfHYW5CRAjHxR0velZ'
+        'OT9FOv1++A2Zo3A0eyqG3TPvxUWRYcF1OguW9opo0EuAfCRjEkfB1KTmmMBzH1QFbKQ11bK3qMCe'
+        'BBH2IazrL3C4XsA6/QEAgmqFIUEMxRCchoddsSsTHw0L7j9Wi6UPAX8wY2wgY1QMUih7VK3URk5b'
+        'LB+U5tsVGGu9AGv77IXO5wVRdwACGLISeBPckAeyPBhYskLxq/tHCrYrxynrNemLrgHOHwRibwgu'
+        'ADeAmIBIutLMnR+WrZpn1uve0RqMdWardRbEQgcCQa8j4rgJbih4iHyKZHXSww+NUBcfF7lk/Sla'
+        '1yDP+v0crblbAMn1IGQCqu1FvNRpyzr87/KyZ40G4/OiXv9JAChUc98Gl6jSqCf8YPLI4P7hKZZ1'
+        'p4jO64D3U1UG6+0GQCqQ0OtULD1QkFqczuz01NRVtMYght8JLj6ZUT819cmRwW13W2QXLYa8HmIj'
+        'AfsgLUkKBAECwYxJpDN4yXsDJINf8khqKyjMy81IX4OIWQOSzWHruAUOhgyZDAeDiiRl/IypI8xc'
+        '3bp0WUOWdfoZa0Ztlzml+YpOGPgSUSMOepyXwPlZnjzyZHvV0hfkZqecjvx8a/oaTNoXFQFRLwHB'
+        'IUgijEAQj0NiD4+1+4lac5YsX/lDccncESoi5rcyrFE9Z0J8ntOa9tJHeVmLOnKzUjvN5m2dxpQj'
+        '5wz44lW9ztsjCP5+xPu7tKK/ucSRnWlJLQMkcyzCfoBEYi1iLwthuwaCD9SAL2cQSk7i+BiFhvlF'
+        'gkaTG5eQ8LhSETdCuKgHZVgrFgIA/QIW+gxa8VSqXtydn5leUJ6dmfS20x77L4c9riHbpjhpS4PN'
+        'eVnGI5XuyUa9foqaY2ESyyqAoHsFa/UvAa32l0CrX8pAaGUA3KlBsJXFsI8Ae5MZjWrGE1NH7nOC'
+        'Tu+kW4JpgYe2hJqniEW/VhC/0IriGYNRd8Rk0P41zWB6K81k2WwymTaLBsPvgajbgwTdIZK5dhbB'
+        'zyEWvfRvETVgSMXCk0dAOorIT54VxgzAIWgndeLHgdmM1o4QbD8Bl0fDN0GhZh4Yk0hAKgAsSBhg'
+        'MpXQLwUCn8Hky2H01bRCdwWKWjh3QRijvAbwOTxRK1Xbjf2RjkTU+emchgkcDrSooTYFh1U6NGwO'
+        'vfa/VkJKRp+CY+bMDgOOY7MhHX3Q1/vUaIOUid9gTtc9EfNsWHCZJAN3EA75U9Kshh9PGj9yOKVK'
+        'lUG2687BQeQ3pdt0kfIwppL4xARIBOG7U3CkQ/ig1pAY1si0QrHyRR7B63C4yOHtgyOiIsfGawoV'
+        '81xYcL9e/MpEhmPPUmsIxG2Fg1StTfEMOy4suOjZs2WJyuRa6nXwVjsZXa0F+i7Hw4oJ06aFf/pa'
+        'Hhf3E5bnLtyuzFGowAEH4nZyApsxqqNhTExMRJIy2UayNzA6ODh8fgBIuK7S8MaXFy2Ry0a7Fv1m'
+        '0Vglo97A0+1FX024w/GNdXVjwOBsR7yNBbAqdoXiftntWrHLl41VsZoaAtgPEPwWwBva1fD7eGie'
+        '6yUtsTRBmTzmtv+OtyI+PkqpYRgWgKNEaT4QysbNGbuxvwqhEL0E7DDpOHFJStV9d+yHxmeenilT'
+        'MswjpC+mkePfQXLzPlLcfjpOkVoKjOQ06PmAjEs9ZFTaR86yIsDC+KVxiu/n19D4+ARZUjIXIWr1'
+        's8jYo7Hm5paZbbZXzbbMteTE7+axmGQyp03HWJDzRuPd/bH7yblzZRm5uTKdzSYHBtu9f+J87+u/'
+        'XD9U27Prr8IAAAAASUVORK5CYII='
+    ),
+    ('left', 72): (
+        'iVBORw0KGgoAAAANSUhEUgAAADoAAABICAYAAACnUebiAAASDElEQVR42u2bCXQUVdbHqxNZHAYU'
+        'cBs9M+4KjBlHQXFGBSEJgYSsnXTX8t6rqt47nU6nsyedPZ10AoGQYABZVAQ8yjhuOPoJ6uFzAQ+r'
+        'goSQhC1gCAmrLElI0jXvVXcHcFyYsaPooc65p/dO/fre+7/3vnqhqGvHtePace24dlw7rs7jwzUf'
+        'KbZ88HmAmqV/m4Adr7wScPLFZSP3VFZF7qipNe9ZtWrkbwpwV4WTanfVXN82Z15oY3npaw1FRXub'
+        '6+pean3z9Vt/M5Cbyouova6S2xoL84sachxNza6yd44tf3Fa99p1N579bIPiNwFZv3hZ4BflxX//'
+        'siDj/T2F2Z8frp7DdaxaPeLTtWsV895/59cPeGLVSup4be2QxpJCtL0ot76+vPjZljkVD556cXng'
+        'JyteULS/9NzIg4vrnm54buF9+994LeDXSfnBJmpXUfHvmnNyTXsz03ftr3CmN9fV3rRjwVLFsZdX'
+        'DmmsLpuwtzxv+c6SvC/qn50H299957pfJWfjrMqh9bkOzVdp6dtaigqFo/Nrh7S+vo5qfW756P1V'
+        'VZYvSrK27izOeaexyhW9e1HdiK9eXP7rgzxUvSCwqagoendm1pamwlLz3mXVg9rfWEUdXrz4jnqX'
+        'q2aXI6+hoaK4sGXF0ps31S1UfFJTRX1YXqx4r7Do+/PcWU11Fc+ljuaVKw4XFwUccDoV6zLnUkaN'
+        'hmJomoqNi1UoVSoqLDyceuKJiQMPuW/xa1Rb0aw/78vI29hYkF/SvOS5odTokdThRQtv213iXLnV'
+        '4djWVFkRsb/u2cGbXllAHVi6aMSXs13hWyrKQjaWlw/69vfZV1dQzTWzAlryS4afzXY+dNqaFddh'
+        'TbEfsmeAJtfsUTqeD9QgNJkXkC6BpsOjYmLHRIRHjHj8sb8FjBxx+8CBNjtnD9uTkbN0b47j1X1V'
+        'c29+74MVVPs/Vg/fU+pcUp+d+1mTy/XUrkWLArv//6PAtqU1T+8py3t3a356/abSPMPG0pJ+0FVz'
+        'ZykOVpaObi/Mm9Fms9Z0mEzbToqGY6cFTdcpAfa2GvSnmhy50K433K6BYB8EXC+AqAtA/jhNs1uV'
+        '8QlzQ8KmPRn0yF+Hj77pZv+Wr0/rahRN+cXTGlNTtx0qLQytX7FKcXTZwsB9s8qE3fm5uw9WlMZ8'
+        'Pb/mutZlywcdrqmObCjO3LXbmfVqQ0XhxK+qyoa8lV9MfVpcQu3Nyx3RnpvBHrYa3m83aU+c40Fv'
+        'F2CkLgSkTsRI55BKatfynU056fqc5KR7TRrxNAJAQghJEBsA2CDspTn2yMyY6FefmTo16qGHHrrB'
+        'b6AH5i0a2pCev3xfZnbtyZpZw5/PslFH62ruasxJ+6y11FF1fFn18LXz5wcemVs9uT7fsbnJmb+w'
+        'Zf7sP35Z/YKCelSids5xDTqYn/lwm9X80iktf+IM4tznECe5WVqSGBrfclIvx0g9kJGOacTOxsw0'
+        'bb495d5EreYMDzkJQiABBCUEvcA8lFj8HWqaPhIZGbl00qRJ48eNGxc4atSon6i0lXXDtuWWzvqq'
+        '3DV+89tzFc2vrVbscDlDtuWkbzvx7OygMy8vUhxasPCOXYVF/9xZmPvugWV1t7a/tZoSq4qp5lmu'
+        'oS1FWUxbsrb+rED3dXO01MtCqQ/DuTFkH37s5oB0AbDSeQx/RKfrbMjJ0RWkpd6bqBPPIshiOCAD'
+        'ElAEIb7PYViPpzmO642Li9sxZcqUuKCgoCE33njj/w66o2oBtcFZGbihtlrOiU3rNlDvFTpGf1JW'
+        'PH730qWBsljNdk3enu/YsKd6TsjOda/Jn2t77vlh+/Py7F8n6tvOC4zkBiqpl+ekThyOFzBAD1Tj'
+        'WzUGJt5lcfhyEs7RrgZHniEnxXaPUSucQYiAQhmUx6ACBkX4fTK8fJ+ENJDUanVHWFiYbsKECdc/'
+        'cP/9AydWe+dVjthX6XywoXKxLDznV64YdDQrN6PNaDyNz1bqxSfj5jhJYkmoquXbPgIug+IQVtOy'
+        'V1uN+m7cNyflp6c+YNZrziEcugB5vNcPCslj6DXUD0zT9Onp02fYH584cejANUzzllCvz1oo369b'
+        'maZod5XTJ8zmI+fxSXZhr/Tik5FYIEkcBuMSsNFSD/DkJclVN62WOnkk7UtKPF9f7jQ6UlPvNOl0'
+        '7dArRiRkeeCB9eQpAUSe12SDWKh4iWFB28zIGHr8Y38LHNB6e/LllVR7bc0Dh+yp288gwd0HOBmI'
+        'eFTCuSlhwD6owt4kHmVwjmJQDoct9tJRo/5Uc3bmkq1lxXfZEhOH6HW6JCTwTRjKDXlfjl4ERZeB'
+        'EnAewwqSCpehGREzgwYU9MiSBYOPFRfVHtfqe4jouBk1VlQsQDgsiei4MVgvxI+JJwkkg70KoHTc'
+        'ZLjQUeCoeDMr4+4soyHOajJrjBbLHRqTMYYT+RbOq7o/BArk1wTi2Z44ZUINhh2YEH7ekUcdr5n3'
+        'SIfNergThywpHRKjwkBq2XvEcxIWHTfxJPCGLMNKXdgTrbbkvftdzoezk4xpegS+QZC/oDOb60y2'
+        'lFFIr3uWQ1fgUcTL4Yt4Eac82zY9ImLiHff9xf+g+6tnDf46N6fwpE7AasrIouNmCahKzkkJe1DC'
+        'HpRhOd/rjHQWn1yTxfLxZy7nXWmp1jc4HOYkBEW9cbslJfUm0WjKAoJwxR4lxgHUExufUDbmkYn+'
+        'HxMPOgtvaU+1fXQGEqFRSz2cr06qZZO8aiuxjAxOyk0fft9pfIINiZb16ytdf0pJS1nDyScsSnpz'
+        '0q70bMfNWrM5m+MFOQcvgoLv9ajPlGpmc/D0iBv8DtpaUjD+uMXUcoEAsiQ3WW+4Ei+qsEcTsKk8'
+        'ykteh/FSD277TmNFbTBj0PLyP6WkJK+RWz2Wl0xma6Mjv/gWvTkxl8MQED+PgLd2/gCoN08lNQfP'
+        'To+K+/PDjz3pX9DT2WnhxzTCqR45H9We8CThKoPSsuLKJtdSIkgej57FJ78nMfHjT1zld2bYU96G'
+        'OGwZTpD0JktDtqPwFp3BlCPnHoHsB4XfAXq5qViuLzQ8SvlM6Az/he9qawZ1zpbInhKFzh6ssBJQ'
+        'ecGYS8wjRr4cJZ0RCWFSWlpsyTsaqyofdNiSF4hI6AGCpk9rMr+Xmp09WqMzlCLsJYRVmwfwe3P0'
+        '28Zw0B0Ro8yYHBzqv5r6j/R8xTmLQXMWge5ejunPxctBfbCMnLvdSCV7tRt3P0cTTZ0nXGX62oy0'
+        'IJtBP1tvNC7Sm8wTzNbksVAQNwO5WYCXNQw/BspC5I6OV5cETwvz33LOxtxSRZdFr+9CXLfcBLD0'
+        'd0B6n2M9AtWN1DJoL24eTuGc67DZjhxxlqVvn1M1zGAwBJjNicF6k3E9hupDV9AwfNuwqLljE+jy'
+        'kGnT/Qf6SVFhQKdVrz8P2a4+IkLePPTZZcDeftejyLQsTkShz2CvHUhKPrGjvFSdnJj4B61Gs5t0'
+        'RTLUFXVG8HKPAuiOU7Hlk5+ZMch/w3mZI+CURaf9hgddstqyl4qQD/DS59T9j2XhwqqMJ2qpXWfq'
+        'bigusuSmpT5g0uvwPICnFB7IE8x/41Ho9Wh0vKp8akio/0BXllgVx21GsUPDd12AwFNWiIFLDYNh'
+        'lXUDtdzr4g5cHtF6SN0lCowfH9cYupsLCpLKHLljcSZ0eqYXz1h2JR6VzSdG2KMx8WrnlOAQ/4HW'
+        'Vpqog/bE4AMm/b7TotBLWkAiMkSB+4BHZQmoB5LkpdoLiqcbniynqOS626HFoIVFybMLC8YlGXRd'
+        'vNejwAsKfaAIekP1knHNV0sRj4cAoUfNcu0zImPiQoOn+Lc7+r+MjCHbcvMeO5SVXtyamrzhsNnQ'
+        '0aHT9J0REIb2rCL0ykbLHiXe7MOjGxnVekECfp2RjhgN3XudJSlVBXnjrHptJ48HdFIzOeRt7wDp'
+        'jgQvGJQNYGAMJ3G82MciTRsDxbVIY8iKiacfnRIy/bonJ0/1b8MgqJS/t7B0mMNqnrAq03rDttz0'
+        'oD1Zafzh9NR57Vbr+g6jseWYTt/TLiLpmMDiHhfiGopwU+9ZM+rGI93XZtOFPc5CuyvPMdasEzsR'
+        'gcRhSlpAjjQNuDUkzQMuHRIDQRcNQaMKcP9SQ1jGiRq1Cgn3Ryaorp86M+LeaLUqPDwqalRoWJgf'
+        'KW99kEKIi4KMqo2H4IjZYFibYjK6HMlJ9Jx0+6P/ykr7466s9L/stqdE7rSZk/dn2xYfyUz9sNVq'
+        '/fywSf/FUYO2qdWob9udatu2c3ZZaGFG+iiNwK+hAbtfjUC9CqJNSNSvF0T964AXq5QsY1ZBGBaV'
+        'EH9/LE3fFBmvvCuWZUPjWCYF20o1jxoSOO6bqDhlyozwcD9eFlEEUlqjUYPnxm45tPCvLvB8Lz7Z'
+        'c3oR7U+2GD/NslvnO1JTEivzHfG1BdlPrcjPfuRtR/aYj7PTxnyRZf/rrtzMv28vyhuzcV7F4MxU'
+        'uwKH5B/iafphDDImWkXfyWsMd4pa431Qow0SDIZJgsGcQCMhk4ZoFQ3hlzSCx1j891kE3ACnCw04'
+        'dwLDusJnzvTv9R+d0aTFuXKB50mIeUoCEQ3OKxI8Ni0vuo0aXadeI2JHar9Kwj9AstX0it1inJ9h'
+        'sRRlWG0p6bZUkz3FbkxMsli1JlMG0ukLWCTWCRr9Go3WsJXj+UYMdRS3iZ0AiW7ftCILFVFdnAJE'
+        'rfG458Zd1ZwYtWqQX0FFrU7AM2G3iCFF/Id46FVKnFekUQde47CgACDggk7yDJ8Q71vlwzMor5FE'
+        'hE0QJV7E7xcwgCjihkEjj2kQ+H484B3byA8oSAI20h56DMp/G3DAjTTamli12r+gDA85GoFOKCBv'
+        'gfcppEctPTUO9i9fkrIgYFUVACefIMKC4+mC8IliEJ5MKASUPEciAv8wAmnq5QVtTv4+EiWCHC3I'
+        'a3w/MEtARU2tkqb9C6oGHINBzwORl5USeBesILy4+CwvVULgaQDwyV4E9ZYKnhjngSQ/Fn+xtSOT'
+        'izy9eN/7Q32up2EAbl5nmB/PsP4F5SCgWcCd9+Tojzfdl86Q/c/B7//cf7z3R4ykhtZkWaDyNyjN'
+        '0HioBxdBf2EjSzIGS/JiFS8M9iso9qbqagM1JtmWqTngX1CVWh3PcOy5qwWUxblsTrYvwx2Vf0M3'
+        'TqmMpVnmjDw7XhWgSDIlpSxmoOBf0JmRkdMw6PGrAdK3ZiToTBU0x/u3MwoNm/aImqEP9XtULifw'
+        'itTXX+aZST33aY7rU9KcIZ6F/h3TpoaG3J7A0Fsh750XSQ3k0RXVPL+at1bjvrcnKl711DPTZ/p3'
+        'r8OU0OBhUXGxL14G+QuA+hoM3DAcUHLg9hvuudu/8+jYoKCA6TMjAAvBBZ9XAYL/VZH/6ZC+66by'
+        'KsML45+c7F8hIsf9Y8dSTz791K3xqoQtHGnz+j3680ECuWcWcZ8Lv4mLT5g54o4B2pP0+MQnAqJi'
+        'Yqy4eejsz9WfA9K31OIZ2dwMB96KVcbfSA3Ucc+YMdTTkyfdlqBWrceQfQObo7D/9tIraSwUWuJp'
+        'LjhGGTew2+nuuetuKjwiYjLufZvlMWsAQOX51bctxwsqXxdF4lmlmnWERkQP+Vk2SI4bO+66qJho'
+        'A8Nx7cA3bvXXVvSfdkVl4/L385cscwLPynwfHp8Wh0fG/Lx7+SeHThkUG6800YBrZ0ltEzzDd/8O'
+        'E59dCSy85P3y5UPPtVLfbEqUHvD8kgRafdPIn7qD7H/qlmZMHxqnSqBxl9LAyYP1d3jnO0GhvO6E'
+        'Lg177xVv+RZ5VyyI4EFwkoGgTKlWjw4LD//l9vGHhIVdFxOvnIBh1+ATOgN8i87eywffrcqeFYjL'
+        'V+EFr4meq9oIdePv2qKi1YwyQfW70PDwX35T86TgZ6jI6OibcWiJeHzaiOvdOSwgbs8GC95jZKGL'
+        '7FVAvvoL+uuwbyMGHrncEGkuYGvEDUEpHiLGhEwLvvr27WPvKhJo5lZe0IhaneGfgqg9SPYF4ZGq'
+        'j8PgZK8CIAWfFH8Bg/HyqnwfQEIP/kwHtvVI0KYLov4+pNEFUlf7ERMTRynjuQAchrfzooYBglhi'
+        'SbG/mZKZ+bkp2bYZ25bElNTNtvTMdVDUzkaiRmOxJgfxCAUinV7BGQzUr+4QDAaFLS09sKi8fLA9'
+        'N/d6e3bOsNScnOHJ2Y5hhU7XkOTUjECt2fzb+Geha8e149pxRce/ARsUCWpHnCYRAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('left', 96): (
+        'iVBORw0KGgoAAAANSUhEUgAAAE4AAABgCAYAAACzDERbAAAeNElEQVR42u2cB3hTZfvwk4IgU0Ww'
+        'FFEZ4gtVVFAEX0UFhNI9M858zslOutOVpE2a7skqewqI48X14kb8Kw4UREBmB6stdNFCQWZHcr7n'
+        'OUlKiuj7+n0fAf/2ua77SnvSFvLLve/7RCDoOT2n5/ScntNzek7P6Tk9p+f0nNt26l/bINjx3mde'
+        'ez/Z3uezN9/z8n5oSA+UPzrVr28SXnx3893NK5ePrSoqke8vmbf+yNq1QXVbP+vbQ+d3TmvpWq/z'
+        'y9aOrC9bxFbmZX18xGw5VV5UfKp60+vU+W+/vruH0A3nZFG+sKowu29dXuGUWnP2ior09OPludZj'
+        'dYvLlra+8WZU62efDmvd8Z2wh5Tb+Z/cPOGhPPPIiiyjrtyctu9wurH6ZEHRxpY161658PEng+u+'
+        '+8br9O6dPaDcz5FVa3sfKS2esMdqWLjfnFxZZTVuPz2/hG1cs3Z0w1vv9975xReChVs/7gHlOufX'
+        'rxc0LVzQv6owb+4+a/rWX7LSj5UXZC06Pb/o6YvrN/T96bUNwqOb1gjrN6zsW79+jc+xNaserVj/'
+        '2qCKf7319zbX6pLSfqetVvJoWvKuikzTkap5RboTy5YNP7RoKQ/ml3Xre9WuWuTduKQIP1mSs+FA'
+        'cf6nlWtWzmz89KPef09iX/4k2FNa2vdgmiGgQq8/XG1I291QkCc9uXr5oL2bNgm/2lUruPD+B33O'
+        'bFzteyjXVHo4I6nqsCWt7mBx3ryqtavGN3y0xetvye1ocVH/SotFdDA5ZW95muGjmry86acXLuhz'
+        '6sMPBA3vfSVsWLPJu3b+InV5XuaOnzOTaw7nZ244UbYgoGL18nt2r1rltXPp8r8ftFMr1/Q6mpPt'
+        'V56W9k2FIWNnVW7e9Op1i/rw+dubb3nVrVv3UGVpqfVIhuX4oQzj/sqFebGnXl/9UMX6Db0/zi74'
+        '+wE7sepdwf7ixcK63HljTxjNn5YbDIdPFBSSR5Ys6bOshBTUvrVB2Lh61cNVxSXFu9NNtYczLR/W'
+        'FBeFVa9aMnjHe1sEH5gyhYfXrem1Y15h/+352QO/sGb9obn++7VSQWN+nuCotUh4xVLidSk9766G'
+        'VOugukzLiNos67D9GaV9/2WxClUsK2RIspdYLBoolojvjpSIeweGhnr5+wcIp059Tjjl2WmC+waP'
+        'uI3g5q0UnsopfqDWmJV3XG88dtRsVf0yL28Aeu7d4mKvupUrR1Xl5K3ab0g/dcBqXVOxcP746jfW'
+        '9Dqz7UtB09vr+jSsWjq6sjQvcU+uZevP+dkLd+Xn37Ro3bt6uaBpwfzetTnmIfVGw4SGpNSg83Fp'
+        'qRd0SevPq2K/aVZpyuu0MT+eyrDEfG4xD1ABMJClyGQGULtJmtolwbB/iSVYrkSC0cHBoc/5zQ0Y'
+        'Mf2VGX3u6jfg9kTyytzSPkdNmRHl+uTDJy2Zq6oXLPLZtfE14akD3wma39k85HhJieFQmvFUZbp5'
+        '/YnSUt+Da9bykfPyJx8MaFqzyP9okWXTAUtK3c+W5B9255rlP+Rk97vx39izqLh3bWH2qOZsS+iZ'
+        'pMTFTVrNt81KZe15VnnxApB3XADAfoEhuUYZY6tNSf76myyzj16tHqNiwF6awDmCJDiKBp0kBdoI'
+        'kj4rkUj3iUTiTQHBQew/p09/bMy4cf3uHzrMcwC/X7pIcCyn4KHKlLTXjybrD9eXFr54ZOMmryPf'
+        'fS9o2rj67uqFpeFHLOaDlRbTZ3UlBdNOLSnrtW/ZOkHj2+/1q1+yEK/MNe4+ZNXXVhZkFFcUZk4+'
+        'NC9/wBZzFv8Cvs/KFhzNSO/VUJjj02BOVdQm6j5qjNPUtbL0tSuAtF8hce4aTXGXaYK7AqTcRUrE'
+        'nWFw7lRywo6vrWkjjHHRvjFKxQkAoZEEydEAcDQDOIKgOIoCdpIi26U41hIaGblt5uzZhuemTp04'
+        'YcKEvj4+PrceYOWyFXcdzcimKuOSKk6bjMVnlpTyHY510Vph48KSJ46mp35w3JRypGVJcVDzW0v7'
+        'PhGnEpxbtXZAY1lZ5BGz6UC5OXV/dWlWdPWKZYNdf3NbsUXw+pYPhFWZpntrkxOjzsRFv3dWI7/Y'
+        'zBDcOSgdEJgdE3N2XMrZCYLrhBrVTkq4DlrKnWcoe21C3HfbjHqf9MQ433i1qoaB4ABFchAUR0Ch'
+        'KJqjaRpqIM2RUAhAcWJcei00PGznrFmz9NOmTfOFAO967LHHbh24mpJl95QbcpYdSTLuOJ2f98/W'
+        'tWX8u7VncUnv2uJ8bUVa4tG6LMOqKxuX+vy0uUTw2eLFvRsWLX6p0mL+8qDZcPjk/AK6ac3S+4Km'
+        'nHD8wcmc4NPcst4183LH1aXF5zTrFEcvMET7NQirDUJqJ0kIDeM4TAIFgsMJzoauE1KujcK5s1Cj'
+        'ahMTv9+akTo8U5/oG69RnWLg79IUNFUEj0baRsHvITz4SMHvCUDyQlKUTSqVNgYFBf37xRdfnO3r'
+        '69tvyJBb1CMsL146cK+1SLvLkg2OLF806OutRY587o03+u62ZhTsNqbsqJ1fMOviWyt7oeunVywf'
+        'UZmbv2qvMa2+sjhXf3LjysFntmzmf4ctzRIcW1Dapzo349V6U/wnTSri0mVaZG8jxVwHr1k0Z8Mh'
+        'OByDIuFsJObUOJJDYKH5ck0sy51MTvnhC3PG8IwkPQ8OwJ/jwdEkr2UucAA90ug6FEDxWkjCN4Yg'
+        'iI7w8PD9UPtinnnmGR9vb+///6Z7oHSZYGdeaa9v8wp67d28vuv6N+s3eW21mCZ/l5c9a/+SskGu'
+        '63Vl8577xZz+474s6/un16wYe3Dbu/z1LCVMMdZuGHgiOzu8JjH25yYF1d7GQjAQmo2Scu0MxV2B'
+        'LwppVQcl4dqhoEc7RkCIJG+ulwEKDhBcauqP2ywWH2NC/IQYlaKGRuB4QA4NQ5oGIDjGCY6GQJHw'
+        'QJ1gIUC7WCxu8Pf3L5k6darPmDFjbm8NXbOoeHRFjkV/tDB/9p6SjX1c1y8uXXN3S35RVG2ifs8Z'
+        'pdJ2Bb7ATqgldl6roElCjeqEmmbDHTA7YSDo5MFBs5UgnyflrkIITTKGq0lL3fWtxfKgSZ/weIxG'
+        'eaoLHCC7wDHu4CiiCxyAAcQNoF0ikbTMnTs3G/q9kY+NG3f74JUvXijcV1zc51Bxiddq2acCwZsP'
+        'Co5tfK3X2ezs4EZd9L6zMrbzV/hC2qA/siF/Bs2Qw3GOI8S8oIBgI6VQ2xyCvufEYh5gGwwC9XIZ'
+        'V21O3/ttjnWUJTnpqXidtp6GWsprEUXyQGgemkNcfq7LhJ2PXV/TgBNLpK2BQcElM2bMGvHgw2Pu'
+        'jKpj3etGr/olZY83G43bzysUHdfgO99GYzDNgE6fpCE0BA5pmQhCRCLhOqEGdVAO4bURBopOqZS7'
+        'BP3bCbXKXpVt/fbLHOsIk14/Nlaj/YUiCDuvaS5tQppF0ry5Um7RFQF1AXMIgo2eZ+wYTjYEBYcl'
+        'PPvc87e/vd/65iZBw8rlQ6szLUUNWt3Vy/A/aYNa0QHBtEMtsZEUhIaEcPg6KAgUCgqd0HRtBAKH'
+        '8f7tCgTeoJS1H0/WHzyYm6X8ItvcN06n669WqWKg+ZVDcB18RAV0l9bRNwF3HZozZUHXAAsTaNoe'
+        'JZaW+wcGTXvq6ad73eZm5+q7zxYVqerjE2sv0CwEQfHa1QkjJoJnI5CpOsC5zLMTahkfTfnIivOp'
+        'yBWoSWfUyvYzZtNbx3OsU1YkxN9njo4enRwX/7Baoxmo0mqfl2tU72KA6iQBzackN4KjfgccSSIz'
+        'ZniBAG3hEVFv+PsHPuI/N+D2+bumBfPGNaebPmtRqTraESAp9GUSqFlOc7RBTXL4OILXLgStk8J5'
+        'LUM+DdoPBExx51jW3mJMPdlYUvT8wsQ4nzS1IilGJtuqVqo+1MXGieQx0QNZrWYGKWdP4Mj8bqJx'
+        '1B9oHCzTuuDBOrc+LCxC7hcYdHtMdl16hte54iJdS1xM00WG5iGhhJbjKwIRr2GOPA1dx3ntQhHW'
+        'oW1SPooicO3QVzXIZB1N2ZlvfmxKuzdTHyPTsFQ9Q5IwttCdrFL1kzImZpo2KWkQUCpXEVA7HeCo'
+        '/w4c7YCG4DlN1hYWHvnRHH//MQ8++qTnwR2bX+zTaEj9+JxKZr9KYzwoDpoohyM/hvyZhNcsDgmO'
+        'KgWMj648PPhzKAFGWncVgquVya+dtGRkLTUbB2cYkxYAlmoneU2B5iWTN+riEySxqam9WY0ml2Jl'
+        'f0rjSKfGuWudWII1hYRFhP3jqec8263eVpAubC7Jf6FOp644T8NSCvkuCK4TOX5eHPBQBOUIBFTq'
+        'gIc7ggG67nheyqGAcpKVXavKSM9YmGUZbDSlLCUYuoOi0ItkOSBXnUlITiP06aa75FptHonAIe3p'
+        'Bs6VGN/cVF0a5xIcal1IRFTBtOkz+3sU3E/5Wf2arBkxrTr1r1cQNAiiA0LoIDBHpESgCIf2OUTi'
+        'gEe4kmFUTcAEGGrlJWhyJxjZtYr0jIxFVvNgkyltGcWADgChkSTDsXL1uTSThTFYM+9SanUFJAPN'
+        'DcEgXTkc7SzFyN8x1evgXBoHwXERYukO/+CwkY+Me8pz4OrnFw9rTEsuO69g2xEwZHadzrSC92m8'
+        'eUod0GDu5hAHQEeNKuI6QBTXQYu5izDpRRpXaYLgLObBxrSUpThJdgAKAsIBx8rUrRnmLJnRmo3A'
+        'FVIAAXWCI11J7h+DczdV9IjAi3HqzNyQiOefnvqi58z1Sr71kaZY3dvnYHrQwTt7sdMEMTe/5vR5'
+        'hJvwQQHj87lOWsT7wSsw6lbz4NIti80ZgzMMqUsBw3ZQJAtjCuCATNlqSM9kLdbCu5QaXQH/4hEw'
+        'l/wnU+0mwGm6gIuUYBfnBIbir7zq77lFoasp8eMvRKu/vABoWzvqrZFiJxwXMIdZcu7BAXcGB6iR'
+        'nXzElfBmi1pNp1i2rSYrs3h9pmVQdlpqsYKVtdGMnMNR7iVXNCYbjWJrYUEfVq4sBFDjeGAQOCAd'
+        'sBy53c2DA6oeusRVisHILJLiV/2CQjNmzvEf2McT0DbHpgiu6GOe/FWt+P5XirSjpiRHujTKDRbh'
+        'goc7BHcISnzbnd0RBK8dmuoZuczWnJ25dXdB7tDi1GRRnFxewTDsNSCXX5Kp1B/FJSf7xiXph8pV'
+        '6rdp5KdIiocGSPq/AHdjsHCAk+Bke0ikeL5fYPB9Hikj3km1CC/G6yZfVsl+vEzi9k53jSJuFDd4'
+        'PDhH4GijJVDEfHekAybErSzDNSTGNV9eXCb6MMvqbY7RhUarVdlqrcakUGue1aemDlRFR0dB39RE'
+        'kNfbSq5a9c+DozmMpNtDoyTL/IOChzw47P5bD26nOV94OV475aoC7GojcLvNZZ4E9jvi9hzfKoda'
+        '1gVOzEfWy7CiaJYz9pbUtKrmgsK0qpKSESuzLUKVSuWl1WpH6WKi9QqN+ghOUXYKAGcT83o68mfA'
+        '8eIA1xEulq7wDwy+f+g9g249uO1Go/BqcsyUa0p25zUCs7vSjxvlpgBxZwR21q0oaeZBQrkKo2Iz'
+        'K7fVJOgby/NyszZnm/rrNJr7lArlfEbGNsMUxYYA8QObGxLg/wSue8eEdplqR6QEXxEQHDF0yMBH'
+        'PKBxubnCi4naKZfk1I9XScJuI3Fnwd4d4M2DhNSZkkgd0deZ76GobINfX8Uorl6msh+3ZO7akmV6'
+        'UB8T8w+NSnWY78WhGhU4tOX6zOG/17hu8ODPSwmqI0yMrZjjHzp02P0jbz24b/MMwrOJ2mdblcwP'
+        'FykC+jiiC5zD190MlrNyIKTXgwjmqiQkfJ8OAe2UEtw5Ws7VGtP3fJFrfigjOfnJOJ32NJpwuXI1'
+        'Xij6/xoc5UyakalCH7fcLyBo6FPjH7314N7KihWeTYmZ3KKR7WhlaDtMuJxJr1NIpyBo/NcYH3Xt'
+        'TuHTEB4czhf5DrN11LY2+P15SsadSjX8/H1xzsM5JuPTidG6RhpNuWg04XIMbGi32vQ/gevWDXZp'
+        'ndNUw6HGQR839JEHfW49uMV5GkFdkta3Plr5eaMMdPKzBRL121Dj0vFoJ90AusA5C39Huxxek6Ix'
+        'oaNbfBWgtASZK8G1QnC1KWl7fppfOqrIkjE5KVp3Bk3yAaD4mQPJzxgc+ZkjmUUmTHHEDeBubKN3'
+        'NQIc4Owwj7scGBqRPWduwD1PjHrg1oNbujBWUG5IvPdQQqziWFzsj2e06pZzsPQ6zwLuIo0mWQTf'
+        '/XX04zAeoh0FAb4JIL4+oOHBwZ8FaJovhr8j4keILYyMqzEY9u5dtGB0aaZ5cnK0rgnAvwOQiQLn'
+        'XJWvAABfdvGPruqBIm/QMFeRD8s0mP8RFOiEifV5ErDlkWLpRr/AkKdnvfpqb3bOJM9UDu/Ex3pt'
+        'N5gGHTCZJteY0hR1huQ1p/Xx+2u0qpZGtcLWKmMhRKhN0ITa0HSLIvhWOd9BIZ1lFwwEaMaKGpsd'
+        '0MfZoLnC9IZrgr9bnW76Zf+S+aNLLOkQnLaRcU65XJpF8JqFEmHAC+AjraM64AfUFMX/DIKFmgI4'
+        'zV7EaFmllGTep2SqGJyWvRQcFukz49W5vV54eabninwsMsxLLY3yTqCwyeZYzSPLUmIH7cpIfmif'
+        'QT+3ypCcWpOUsL4pMeH7M1rdyRaF8txZVt52XibjzjIkdxZIuctQK68RFNcGX9w1wqmdGNQ6mNw2'
+        'KRTciXTDgX2LS0YXmNMnxWvVjfx4kKEhALTuAIHBsgsnnPBQAU87CncpSXRiFNkqpchaEUnskNL0'
+        'JoKV5RAyRWQUQY8Ll2D9ZgYFDfaPCB8bFBX1RGBo6MDZfn4eaqFPnC2gaNybloqyFLjkgFoGPtFp'
+        'lEZTsj4wIyHu8YVJsd77csw+9dmZE6qTk2aeTEyIPp2UtLhSo/6wMlqx82S8sropXne5RaftbFGp'
+        'bC0Kme28DNh/BaS9BdD24xqVrTLLvP2HRYUjrGkp46LVyv0krFBwmrRj8HkIw0YAmY1mFO0Mq7gA'
+        'IdZISWqPiCC2wufXReFYfIRU4hdJ4OODxVHerwT6D5odEjJ0TkjIeAjLL5zAsyMIfFu4VPpTUFg4'
+        'Hhgc0i8qJMgD4PoPE1AyeiJFE98QhNROEmQnQzOX1HL5aZ1Cvis1NvrflsS4DHO8bk5BeuroDdb0'
+        '4VvNxge2J8Y//LMhYWJFZsqcGmu6utqYmnIyWZ9ZFRe94HiMZu3pxNgPq/XxPxwxpLy3vyBbvG1+'
+        'ft90fWJ/hVxGizHJZgmJ/zuKwFeHSbECCQnSgEwVDRgFScsUflKKfjpUKh4toemhIWLJoGCReLAI'
+        'wx4JEYlmheNYkgSA98UUuVNEEdUYCy5hDG0TE0R7WJSoDIK7/6nxj3lG6WDdOIlRKHZCX2JH5kKj'
+        'bq1rgwg6aIYmbHKWvqaP1bWkJcZ+nRofszQrLdVSmJmhyDcb/PJNKZMLTCljC8ym4avyMoe8k2kY'
+        '8llG8rCvzene2zPN9/xQVtLrtTKrIMNiElKA6SWSSgeEREbeCzVmYJgIG0ixintU2tgHFCrtKFom'
+        'f5JWKF5mNRoxq9bG44y8RELSWzCaPo5R9BUMgE4p2ieBvg9HKQ1KXfjtJqJDQpCrI0Si+++7Z7CH'
+        'wOl0k4BcsYukaLvLMfNpgVMI3ok7oh+AIgOMXSNX2nRK1QWNQnZCp1L8HKdTf5UYH/1Bsj5mSVqC'
+        'LtsYH5Nkjk+UmROTxCZ9apAp1RCQkpISEJ+YEKyJiYli1GqCVqnlGM2mQnDz5ErNvxRKzf8AVrZL'
+        'SlHlEFA9vH6ZhGZMUIyd6JpuAecWANonQRtPjnUJHFoKDBzrJRQ1dOAIH8+AU6jUkxhWvhPtZjAA'
+        'aRjMs1z7G/xwGDhSAIrlBy78/ICEQqClQIAmTfyeGwH9GsXSbTDNuCJjmYsKIGtVy1Rn1XJ1s1qp'
+        'aVYpVc0KpaKZVSrO0nL5OVKGUgnZRZJmr8GggKZgHA4DCgwIHD82RLMIZAFQgEvgNeBsegKoeQz8'
+        'fzLo3yaoTqitr0tpMOzhJ5/wDDggYydCON8jU2UhLNb5n+HXrtC7TDFuAxL4CCMh4Yx8FISJnuc1'
+        'wLmBRMPnEASaZp2QUVvc1QFxaC+JxoJQAMzzeDiu5/k3ym3h0HkdaTrjFFcLihdn8xPDSQhOtglG'
+        '6gcmP/OMZ8DhgHpcQhHbpYCykTBNQLtpjqUXwIOhkdAOAKjpSLlqTediIDJtQCPYGMfCdIQhoCag'
+        'vRAkaFUVPcc4NpFQxYCKcrTCikolBATBYaCwPFi0UEjwQjuBIfcB3LoowOkyHOKAjeFEJ83K3sBo'
+        '4P30i//0DDiYL/mKSfwrDIIjWKhN6MUCRz7Faww/vgNdW5M8AP6FXS/UAUx8eXAwMWah72Fo2tkB'
+        'oXhwFHBCQ5Cd8EhXrYnWvJxdYJoinftx1E2L+y6AN/TjpNDHAbnyTZxhvSdOe84z4ChA+2Ik8RU0'
+        'IZurP/bbgYn7+tWNBTh1k1mA+1DF+bvurSDq+mDmN0s3ztLq94r733wP/89SgrLJ1Lq3ASv3nvjo'
+        'Ix7SOBybAOUrqCE21zv6m2bhHSI3AnSBg6mKTaGNeRcoVd6P+o7zGLjxUL6E7/YdD+73Zg44Bezq'
+        'mPgPGI1u+IhJHoqqMIKNxwj8S9LdVP8i4FziBLcFJs3DfR4a7iGNw7B/SDDpFwRN/jU1zglOE5vw'
+        'oUKlGe5zr4c2viKjoh4TScSfQ837i5oqQK1zuy5ev0WpjfHu46kliNDwsHFRItEnOEnYaED/JcE5'
+        'TfV9Vql9QOCp4+fvPyoiKnIz1LjO3x3B3eHgYIHfKVPp1gOZ6n6PgXt5xsveUOuWESTZQYPuedZf'
+        'QiA4MUa0SUkmH2fkAz0GDtZ2g0LCwzJximy7WVSl/sxU3YMBgXbOJdDXIgy/HCqSqEKiJJ7bBR4x'
+        '8qHegWEhpITEWynnFjhfg6JhsftW+B0EzZEIk/xdiOgRB+BciFjy8rSZsz23uu898B7BbH+/5yMl'
+        'ogrXvQfuQtLUHadtzvu7+NqVIAg0v/glkqTG3jvuUc+u7T8z9TmfsKjIz3lIDODcNc9xEwd1ZwYG'
+        'Z3AQ48TiuaERgwSDB3uUm+AxX1/h3MCAeFh6nXXB6gbuDvNx/K1Jzo4wAGwLTtIRQx5++PZ8Rsqs'
+        'V2dNjBRFfQPzuc471VTdV/bRfQ7oUSSRfh4aFvGo4HadF6a/NDAkLMwA69ZuWkfdIXmdY+UBdNs6'
+        'xwiyWSzBYkLDI/rdNnBjxo8Xzpr96oTwyIiPYTJs7xZhPQyu240iXf1A0O0eB4ICNoJmX5Pg5INh'
+        'kRGC23omTpzYZ26AfxT0dacgMPvtM1Xqhk6wA9x1aFDbSFAdEiF56aUZc27/B2eNGTVaMP3ll/uG'
+        'hIZkIZNFEZZ0dYM9DA64g6Oug6OBzI5TTGOECNNPn+nX7/EnnxXcMeeVmTNGQ5NdjpFEKxr6drXN'
+        'u72Qm5vU/4tZXv9bLnDuP+MaRYJzIimeMzcwdJjgTjtTn5/qNTfQ/x+RYtFGKUm0E87VU8q5eorG'
+        'dLRrfOcStyXoP+XwKbe/4T5KRBM10rnqBdCCDi8dOEUtipJIRgeEBt+ZH9H20uxXhP4BAWNFmBTB'
+        'O4t3BQxnyeO8N+G6UF1zzj8DDnTd5+AS0DWK5PuDgB9426H2N0hJsiw8KsonICjgzv4kxUnPPCP0'
+        'Dw4aFSWV5EB4J6Hm2Ymb3BL+G7kpKNJN3Ey7a/zoGkE6JvikS9Mo0gb97BH4xukjJZLh/5z+0l/j'
+        '4yenPPusMCg8/H74TlMQ3n4oNjRoJl07HK7NyW6+7o/AETdES+YmAlxVyzWYkG8XSyUhkSLx4NkB'
+        'AX+xz+z0GSl4ZfYsr+DwsMeh3zNjFHkAat41fmeEctwe7nihoDu8bgNkyg3eddB8iuHKz2h04y8L'
+        'XQJ7maTBTzCyJ0VERY7y8/cT+vqMFPxlz/ix44RBwcEDRBg2HSepMlj2lDOs7Cp8tLvnWfxt385P'
+        'bODrSn7z8npC7YLc7edJYKNo9hJMN3YDRp4N4U2REng/v6CQ/z2fDBscHu4llmL3Ql80DTCyNKVK'
+        '8yl8PArNrA0W3B1oQEzQjuUc/mZemh8acxQLQTIMWrGAzp7qxCm6A7DyKxDcYVameAd+rQGs8nFW'
+        'phxAsfL/vR+lGxoaJogSYcKISKIvfPG+MoUyDgKZRzDMZm1c/J7YpKQqXULiMYVOd1wVHXNcHRt/'
+        'PDpBX6WJjfsRo8AGnAb52uhYuUqjHQVo0ItVKIWESiX42x1GpfJSaqMHpZjSR2YXFj5lyc19ISXD'
+        '/EqiwTAjyZQ+M9VinWHJyX8h3ZrzREx8krdSF90fY0HPZ6rfeEZNmiSIS04VxqakCGNTk4VibbSQ'
+        'VCb0gOk5Pafn9Jyec2ec/wN2fUOjCBsNIwAAAABJRU5ErkJggg=='
+    ),
+    ('right', 48): (
+        'iVBORw0KGgoAAAANSUhEUgAAACcAAAAwCAYAAACScGMWAAAIpUlEQVR42t2Ze0xb9xXHTYGmhbZT'
+        'UyVpombLtGxaV7VLaBVpnbZU09Yk0tR/qgSwff1+GwyY1yDQQHmDwTwTEsLDYSakvOkSOkggBUKB'
+        '0FAIRIAxAYONMa9QQsvDvr+dexcyRIGAgSTaTzq6+Gfu/X30Ped3zrk/UyhPeRhrG1/VFn/5DtIM'
+        '2VCetzF0tWZfg0JR3pKcGq0vu74bTU09X4BjX3/lcDc9Q9wak3Rdk1/wvrmn5/lQESFkA0ZcKZrc'
+        '3N98E6eo6MzO+gSNa54t4JzRaHMrI8ejSZmiHPiydC8BqCsq2HMnKenK3fMXTxGfn+mYqKnf0Zae'
+        'jDXHRF/rVed9iKamKfe/KHyzMSGmqCs38ygaHd38IjqdzqawsNBOqVS+rFar7X7QdlDG/lXx2lh5'
+        '6auz1f+2RQbdT+4ZuPWN/VBdnT1aWKD0qfN+XxsTXXkvV3UEdXRQuq/kHWyOV1SZblTtshqqo6PD'
+        'NjEx8YhcLk90d3e/w+fzx728vC4OFhfs7/Hx1Ro9pBOjfj61uojw06NX8g8udVXrF0V/vaVMKrxf'
+        'XPBb4nN/ecGBxpiw64Pl5QfQ4CClPS2N3ZZ4LhqZTDYbDWRKbGzsYTc3t2tsNnsWwzDEYDBIE4tF'
+        'dX2Xsg8NiwUzFtpJhFNd0TSDhRvdZJODgZ8lfl9Y+CZx/+x3bTa9avUH9XGKq20q1RHiud0Xzp24'
+        'nZB0wazpsptvbn65KTa54l5e0a/WDVZeXm7v7+8vAqhJJpP5GGrRpGJxrV6V7WQSiX9YoNOQhUZD'
+        'OM0VLTBOohk2hg/JZB36BOWfUFcXqUhX3qV3m2Nirk7eqNk119pqdzsxXnWv5LIT8V1j2kVuS2qW'
+        'cF1gtbW1duC2CIAwL4f6n3KSr4dysg9NCEQzFioVlMMQAvUQ9VOEY87ITKWhUaHENJCceAL19pJe'
+        'aEs+y6tPOssh1rilznKqV2e9R/zdW1Lh0J1XtGtdOcnPz88X1LKsBkbCSaR1epXKaZLPm8Fpn6IF'
+        'ACKUw2lUZAH3z2NUmKOhEaFkbDjl7BECrvdG9UvtFRX7rA7+qKioj1gs1vRaYBB7uMzDI89YWnpQ'
+        '5+5pmAe3zjNdkIVOKEcFAzdjDGRmuCIznY7uy31bJ0pK39hUqmhoaNghkUganwCGYMcWqrJz9uRf'
+        'yds5lJ7ylxGpVI/TMIQDnBk7BVdnhEBBnAFXugua4HDwoYjIQNTbb7MZ1Y6vBUYYl8t9cP78+d/J'
+        'ZV5xPIFgICAk8KgpNPzMPI0DLnVB87AhcJozqSChnIWEdUHD7p79EwXFe6wC6+zstCUUWQecvqSk'
+        'ZL9AIGhn0ZhIzBOGDijiGdNMLmwKF1DO5bFrzQw6MjNpoJ4rmuLwLQPxCmer4DIzM1+H5DrwJDgO'
+        'h6MvLS0l4O5yaCwk4ohCBxVx1GkWB1zpQroTwcZAhGsBCseI+KOhWSaGBk7/I9MquLS0tLdh4dn1'
+        'wJWVle0XCvh3mXQm4vCEIYY4hetDFpuEw+lUMvYQ/SR8diZBLUT+g91r9JY3omGt7YbhoDz9mUi2'
+        'KyXcZXAjUFd/IRLwbtIxukUm9+UPR0bzZ2B3ErFmwR4pt8yInWxyc9egrjbHDcMpFIpjxOKLgKtB'
+        'wrw5MDBQlqdS/fzz8NCPtWXF+40+PjULjyDwFcDIeVDUJHUbQm0tP9s03FrqQUmb8fP39x69WrGz'
+        '1z+wZoLDwhfop8j6+jjmlsOBmSQE3Lcbh4uPjz+2CLVUvdWUFInFdYbsS07jAumMGRaeW9ylqyhn'
+        'AeWMUrdB1NG6cbiEhIRjK4EtJt4lbn1U+CV1un9mHR4R82cQpJAFqAQkHN15RThiQwy7E3B3Xtsw'
+        'XHp6+hvQr2VCHjPA4vhymOXKQVdSN6DKchqWCmcId85jdLKukrkOypkZlLLQ6DCPoQdc1rzew619'
+        'IDxMjnR9G68S+fn5dqmpqW9lZWW9FRQU5AJdiQpyWRdA/bgSnEgiqtflZh0elgAcQM0zaOghCwyq'
+        'wiQHM+tF3AcGubxlMDgkcVAR+1FrvnrvhbTU3VblOSKVQJp4KBaLrwUEBHhCiXrXaDTaR0REvAeK'
+        'sry9vcNlMlkRNJ61UH87fX19QkdKCnZrggKrx2VeHWPefnWGwIDL+jPBQV1hYX+fKM3/ZW/r7Z3x'
+        'sREfy+WyGJ6A1y4QCzt7tN0vWRNzx5epYxaJRPc9PT3VAOsdHBx8ErriD4jq0NTU9LrBYHhxamrK'
+        'Xt/b4/Ddt427cnMv/TokLPzo6TOf0b18vSM8PL0qeWweiMjEmeBaDJ7N5QuMfdo+R2vgTix33fJd'
+        'Cq3ULMTkBJhRIBQMckX8fq6Q28/hsYc5HOb3TCZjgcZwxalsF4ChIxZ5PxsxMQ4YlDq+yNSv6X/F'
+        'mlRyYpWki1ZKMRgUdRIAFmUx4Hs2BvN0xGTAFaoFh5xnI4zFRHQ2Rv4vX8Af0Wg0r1iThNeE+2mu'
+        'AwhCTYBgMFgkBAOMmCPgGACMMVnkHJvx33metXCrKbeVBl2P0So4IuaeEpzj/xccxNzxpWVqO0wo'
+        'FBq0Wq3DhuGSk5P/8KRuZLMGybubSOwbhktJSTkA+evhdgJ6eHhUWXXkBS8tjlBLO9fTz1ljxDOh'
+        'BIZYVVv7+vooUKoit0s5aFAfRkdHv2P1e2tGRgb5krMdgFKp9KubN2++aDUcbHMb4txtq8GgJv8I'
+        'TcOHmz69VKlU+yD2tFsIh/v6+sZVVVW9sCVnuNDD/RHcO7oVYO7u7uWVlZUOlK0axNlvZGTk33g8'
+        'nsEaqEfJ3AKNaXFmZubOLT8BHx8fJxLz29AZNyx9p1iPgeozELufFxQUOFK2c7S0tOyAl2gO7LY7'
+        'ax0oEjsclJ6CVv6yUqk8BOo/nd8RpqenKTk5OTuioqLeB0WCAEANsNVgDRBTFTB3DnIkNy0tbW91'
+        'dbUt5VkOogSNjo6+AO8QtnNzc8/fL4HbNf4D7MoZH61Ee0cAAAAASUVORK5CYII='
+    ),
+    ('right', 72): (
+        'iVBORw0KGgoAAAANSUhEUgAAADoAAABICAYAAACnUebiAAAQQklEQVR42u2beVgb553HOXyROI6d'
+        '1Djb2Mk+3e5uN5u22yd9ttt095/dbrfPs22ePrEJ6BiNRtyncDjMZawDcUON8AHCAmxjHC5jsONg'
+        '47pUxsbGssFc5hZIIMmIwwZz6nj39wrJVlU7JVlhYrfzPO8zw8xo0Ge+v/OdkZPTC7IgpHBGD8Y3'
+        'IYScnV7mRfVFw/ebco5e7C4sClxqbd3y0oKOXb62tTW/IKYxLamtOVtcpaz84l8Nw6PrXkpYNNju'
+        'Ony24gctuUdLmwWZ94ZPVfo/uHlrM5jzy6muoavrtcFjRZRMIOqWH81PmWq8thWp1S+Jmgi52Aei'
+        '4eozP7mZnnFDLhYXz7fdfuuFh1zQaNwa8qWFt49If6utq/9nDG2GH+13VlZVvNeSc/CLO+Lcz+ab'
+        'mne82GrqdC6dpRX/1pieUSNL4t3qP3mchlQqnGqc0EOV8+jZs+/dysi+cEt88CRqb978YsOqVM4T'
+        'DXXuPQWHI64LhF1dBVL+nLzFHIiQYsq5v7L8/WsZSdfbC44kTd++vWktfMvJ3rdQd986NDy84sSP'
+        'xsacQdXlQHT37rrhz8o/kiUnd8jzjgqmbjS9Zj5HPejcV1X2n40pyUOqqspfGRWDLqsK1tjY6DQw'
+        'MLBRJpN9t7Cw8DexsbGRKSkpPufOnds629vmoiqv+PBeRqZYeVQc87C67JdG+Y2dC+13XdBwz1Ov'
+        'Nzs0tOVWaVmAuqHhn/TK4WXf7OlxHqw9+2G9YH9PpzQ/2tTWtgHvn2m67tyen89vysi4MX7l97tW'
+        'Tbna2trvCgSCGC6X2+zr66tnMBiIIAgEa4NQKPQerSrf1pmY2KqhOGiczURjft4GNZerGxYlfaEu'
+        'ktKMra1b7XPiokLxqiz3yCFZSlpX98niIDTYs9F6rKe88L+bhIkdg5+Vffw4QHV2bmkWpV/vyT9+'
+        'ACzB1WGAIyMjTqdPn34nJibmYEBAgIrFYukxHKzNkBZQE4CGj1aUufclxPbPsZjIRN+DTAxPpKcx'
+        '0SSLMqmDQxeGEvjN6mwxTd/whz8q8SYbZG59Jac8ZckpcnmeRDTX22n2wfk79S73juRGX0vNuDp9'
+        '9cbfWs9XFJ2iGpOy7nRX1f69QyDPnDmzkc/newQFBbWSJGlks9kI1sgKirfxmslkGpOEgjBNVdmO'
+        '/oRYxQyoucT8BBmYngjR6cjIZKI5koEeUBTS+gc+HOEJTtwvOf5DNNH32I9RV5drT8mpnzekpTa1'
+        'FUji0Ohy+Td+qe7t5tT03/UUFkajGY1Z1YXm1u2y9BxZm+Tk3v93EwAqvgH+l8DhcKZtoTCkFfbx'
+        'PgBNFQjDxisrdyhj4xQLBIUMYNZ6AER0GAwvZCJ2IwNrN1pkM9AYhzIqI6NaRg8d+h/U3e36BPau'
+        'a/fJwt1NPH73RN3lH6MH82aX6TyWx7kqzmhcGurYZnEj5+a8osim7LxSpJtd/7UhwRe3RUZGHgMQ'
+        'vRXSCmUd9qAiYVKYrqzMXRUTN6hnssF0GQALkDQCYGkAuxu2P0YmlicyMmhonkkhZUj4qOpY/q8X'
+        'W24+jqDGa1c33s3KOdyUfThnqqnVrGrP5c93XszLKRhvk79rPa+/um57T2nVv3xtSLlcvjkqKuo4'
+        'gBiskGCayB7YFpTJJAxCUWqYtqzUXRkbM6AnaGCue0BRLwBkwMCgn1jM2Av2w3GAnycp1B/G1WmL'
+        'Cn+O+vsfm6D28pX3/iCRFrbVnNu4avVmfHz8fgBYtFXPXk17UAYDfFSUsneipuZvRvbFDugZdIAC'
+        'UyX2oCUWmK35b4AEMzYRJJgw+DBJB8UxLAcpwyN7JgpP/NgakSfvtDi3nj+/XnnrhuMh29vbnXNz'
+        'c/8XAs6MPdTThm3kxZFYlJLsP3HxkntffGL7DOltVswIAWme8oI1KErHymJgAsBJpAdYI8Ca4LwH'
+        'HF9Tf3zied3ZmtUv3E+ePPlmWFjYraep92WgcGMWIiIijhcVFe18KG9aNySVcAYjwtUPSZbJCGB6'
+        'FsCYQTG4p8WMAZLFgIH/9kSLLBINBgUvjIjFEahrFSuetra2dSKRaC98cdNKQS1pxQSROffChQvb'
+        'iiXSrcUninf1dtzZqC3O/2gkNFSjh4BjwgGJsazuErnHDIbN2MSkmwMTIjzhHFCVTaKhyMj22bOf'
+        '/8OqgUokku0hISGtVpVWMvANCQwMVFVVVb2Tn5f/bgT30/N+QYH9wuxkbzSscBlLTjnyiO1vNNGW'
+        '04ue5fEElEY3+62BALMmPBACpQ1wzpiv79JI9qF46FhWB/TgwYM0iqL0tia5khEeHn6lvLzcLSEh'
+        'IY5g4DQD1sAm709Pj7yiFR9mTfiGzBvppBl0ifQAKKymlxkUm68eigg99lPCy3zOLMlGQ7GJzai3'
+        '7XWHQ3Z2drrBFy77KiZrA1oP1ZNbYmIiD6cgDuRP0pOY0amUW4YPHfbSBobMGRiEGc6ATdTsq8sR'
+        'GKcdA0kgPRv7K/wNprwE1xwJCZsaLi74L4eDlpSU7IIattMuiq4YtLq6ehOA8nGB782gENuLnNEp'
+        'R7aocsUe2sDgOQPTUhlhSBx1zcGIZt6HCByQLIEJtnHaGfPmGAYyUvavhtl+CJ3IxFdVE9+QvXv3'
+        'YkU3HThwgM8EU6RAUSaNNXNfO7pFkyveMxEQNGtgQloxFw508zAxcTmI/dLir3gfVhfOMxB09JAC'
+        'VYW8aqRWO3YiOyMjYw/45+JXBcUD0lH92bNnATSRT4BKJPioF431UKMb36LOPbRbFxA8awClTFAV'
+        'GYllNbGyJpxmIAqbVcX7cFTGqsN6lmQiTWysHGn7HVsVpaamBtv750r81aLoFeyjCfFxsQTd02Su'
+        'ljh+Gq12yk2dk0vT+QaAj+KiwAPM0pJPGU8fJjoG9ULzYL6avRH9qL/zTYeCJicnx9vWsU8r4J8F'
+        'CulFUVlZ+c5hce73IsK5FwOCArr5IuFeo0bjMpWaljFNUgYjw8vio/RnQtqORQAdCeXeR3fl33Yo'
+        'aFJS0v6vC4p7VGjIs+rq6raWFBe9np6Z5t56p9lt6vSpX6rCQoYXIBAZsR9ic6XTVgS6BKCjodxx'
+        'dPf2ToeCQkW039ZcVwprLerBv+f27dtXfKyw8O2HVxvXDeVJyIHIKNU4h20y4E6F4WFp0xh2UfcZ'
+        'oASAhnB1DgfFiuIvbZ09eBbglx2Dz+uFKSnUxPm6b/XF8dp0bB+0AMFHj8s+wtNSIKzQdAFUHRau'
+        'Qx0tjlfUFsDehL/MpK2q4jkjvkDAnSg785Y6Kg76URJM1RMtQXRdhN50ueRbgemCiS+A6SpDw3So'
+        'vcXhipqrmqeZrn2j/azITDAJU4pQxB2rLt8xFBc9sEjimQU8kwDVDkFYivgn6eSZkRdA59gEGuaC'
+        '6Xbcdux0Znp6ujeHw1myhV1pUf+4iwFF0wTC8NHairfuJUYNznAwKERaaLSXCJal5POwFA5PB8Q9'
+        '6yJUSONQMCijozvQvXbH1rvQh27LysryCQ0NPe/j43MflDPZQ2H/tZ/5s1UaDyFPAIqeeWswLnZw'
+        'nmRZ+k86+CpzeYbBCxQGYD2B4S2VENwIPRQZ03D9+36ceWUEt703OfmQplD6M4c/E1VDqTUyMrKh'
+        'o6PjNaiSPuDxeHEAfRnKQhUoPQtAJnsVrSZthWfC+oCQH66rAdCEmAE8r7tc7tGgAKDDoAGgF/ir'
+        'F3rEpqNJbwJpfTh6TWDw1DA3onNYmHRSmZn2ydSp4u8s9Pa6TapUrg6vdXNycj4AMGlaWhotMzPz'
+        'jStXrmwYHBx8FfrMf4Ri/VeQOlL9/Pzugmk/AKhZSCdLVngrMG7AhSJ+iLamfHv3/pjOKYpCS3QC'
+        'lGOjaY439Jkco9qfWlT4+Uz1ckP6Bvhx5xUZotixY5JfoMbrb0/39rySL8l7NT8/70eRe7nCuNiY'
+        'uO7uu46daUhJSUm0KGWCLmY0Ojq6AgJUMHQl72s0GvN049TU1LqWlpZdJ06c+Hc4nxUXFyeMjY0t'
+        'iIqKqoQORgY347RYLP7OzJXL6xVSSfi9hLjr2oTEK/cTeWfUSckSdVZmoi7/EE1fU/c+6ul7HS2M'
+        'uOK52b6utjelkiMf7Y+PzgnjBjeTHHKGBmbtFxgw3jvQu93RoAdsTdECbYT1AijdGR8ff4zP5/tL'
+        'pdL/uHr16t8NDAxsm5iYcG1ubna+cOGCi0QicS0rK3NRKBROSKt1Grva4Dwll22auS5bv3Dpoqup'
+        'vc1lXKt16+jq+nbVmZofZWb+dg9fIErcFx3zO1+O7xjFJAwUC8cFBiLA5Jngrxwf32n4P+6rBvq0'
+        '6IoDETZXGA9hewzMeBiK+UYw6yLIwSK4CZHQpnnzBUImTyBgJPD2e/FEAn9BsiCGL+Tl7ouJqQkI'
+        'Dm4hfbwVTA5jnEHR5wgOYSBYUKSAaXMIDqJgsJkcxGJSiGSxUYBf4KOhviGHK8r/snnblXQ2bPBJ'
+        '0pttIjgsIww9i2IZWSTDSECxwCYZiCTwUzc6opNeiEnREEHS4ToAar4+hVgwCBasARLDB/kFzgKo'
+        'YxWF7oX35/KlfUr5k5oY0gmTDTAwSNhmQ2XENt8oBlgE0wxLQRFBQGphwX4OwPgQFCjJhs9CZQW5'
+        'kwa5l07BOaC0v7//o76+vtUHtU8j2Hxta2Hrtq36GIKE4oBiYABvOO4NX5wNA46z8XkEolikGY4E'
+        '9ZigHpPNgUGZr+cDn+XAdZjgq74Bvo/6+/vdHV3r8lZaCa2ksyEJfIw0K8ViL4/Hn7M/n3xynM3C'
+        'x5ev6+fvN/NcFF3rAQEPg27/SwCddjgojrp/BX2ZQFcajJ7ngPQysxqgifYt2FoOy8OrKWgs3nAo'
+        'KHQtYfYvX6z1CAkJUY2Ojm52NKgH9J0G27dN1ho0IiLiztzcnGN70uzs7J+C809+U0wXD2gDyx3e'
+        'eJeWlu4Cn+j6Ko8jVtM/oRw0AGiUw0HB6TeEhYWVPKtbed4D3Eh36tSp76/KE28w31/jJ2pr7aP4'
+        'f4N/nuvt7V2dFzYKCgrcQdU7z9t0rTcWdy+WJn8+KSmJWrWXNaAlck1NTQ3FD42et+laYfEIDQ2V'
+        'VVdXr+67RrW1tW9C/pKvldmC68zAzf541V+oUigUzkVFRb/A5rMWvrlv375j9fX1rzg9j+XatWu4'
+        'bUsA2EXb5y2OMmf7qRiryXK53Ovl5eU7n+svli5evPhqVFSUFL7IkqP91fb5jhUyODi4u7Cw8H25'
+        'XP78f2VYUVGxA0wpH77QojUiOkpR6yuxeMIcKrIuiUTyE5lMtnY/pQTYN3g8Hp4KfeAoZW0eOBsg'
+        'wtZLpdIPnL4JS0NDw7r09HRPKBF7cepxBKyPj89UdHS0GCDdnb5JCw4QN2/edIf6MzkgIEBjU5P+'
+        '2Ylt232QPhY+/fTT82CqP1Mqla5O39Tl0qVLrpBr3xUKhUGQbz8HZSaxv1mDyh+9Y/9k3xKc2wHB'
+        'LQ3q15+WlJRsaG1tdXohlsnJSafKysrNYNLfgxp5j0gkiomPjxeDOZZGRkaWwTjO5/OTsrKyOFAA'
+        'fAjn7ei2+SXEC708evTIZWxsbP309PT62dlZ15f2F7x/XZ7j8n8A1HycYHfVggAAAABJRU5ErkJg'
+        'gg=='
+    ),
+    ('right', 96): (
+        'iVBORw0KGgoAAAANSUhEUgAAAE4AAABgCAYAAACzDERbAAAaf0lEQVR42u2dB1xb173HAQ88Eo84'
+        'jZM4TZv0pS/NavvST1/78prX1zZt32vzXjNskHQ1QSyz98ZMsQxmGcwwwxgDDrENxjaO2ctmI/bU'
+        'AMQUGIjBAqTT/5EQkRUcY6cWuOF+PudzpXuvxL1f/f7rnHMvWlrfgQUhnjYST2xHCOlobS5rhYa0'
+        'h0uq/42bluUwW1L5M9QzuG2TytrAafEuFFAKvAKElRwOl5+dbT9ZWnEAdQ/p4H2byzfB6xLsEeVd'
+        '1qsK4xQWeXuNNUYnXOJn5//PArd7D5qe3gT0jfD6W3TGiq+81pGSbHczMFx40zu0ayjjgre0Z2D/'
+        'Jp01mC1qbdUdu3z1f1uPR12s8PQbbk1KjhouLvnJUnf3lk1CawHYWPu95thYpyIfX2HNicirwrzL'
+        '7yGRaBPePZAQ2oKj69f2tbXt6jqTdrTKn9NeHRJSPld/65dI3LP1Ow9tTiTSrrmQ+/uyU6dzujNy'
+        'rIav3vgx4vO3q0bTuaYG3f6M9I8awo7frAkPKx+8eOlPkrrG7d9ttY2Pa7dczHu7PDwmtcg7YBRU'
+        'Vdh7/txhSX/vLlV4aHpgmyjv0p/rgkMbbwaG1ghzc3+7mkK/W/AEAm1xYdmLbSmnrasCvVtLj7l3'
+        '89PTHaT9/c+hxUVtJUBJR9f2vvRzR8oDOR31UcevyxorfwTq3PR1aLhHZ+lm6TvciLDT5V7e4y0n'
+        '485NFBa9gaZnV5SFxOIt/LzPPyz2dW+vjwrLE5eVvoZVuwkPzG+ppuZge3xieKmfv+BWZETOfHPz'
+        'y6pmiUT9O1rSTjuU+vmKelNTfCVNjU9vnBKIx9MpLi7enpaWtpvD4eyJjo5+7syZM3vz8/Pl6cBc'
+        'X6u28FzWrsmr138mvpL/L+PZZ/d/eeXiTtRQsw2JhGtSwB0+X4dXVnFAUFz6jKSjYwsaG1vZN11S'
+        '+lzz6SSnfA9XYU3UieQva24dgvxu5XvHC7/4XkNU1JkK/wDBcMHVP0Oasr6qa4Pwn5GR8c6JEydI'
+        'QUFBgZ6enrkODg5cY2PjAScnp0IA+B89PT3aE0UFP+yOjE5pc3S63efqMjLI8eaOhgenTZyMdpxI'
+        'Of17SUXxISTo+sa0YY7Pf6Eq9WxcedTJa/2fnT8y21Sz717f17WrKzPNpMDTUdQRfzJutqL8hZV9'
+        'AwPaokuXfl3h51/fHB1XsNjAfWldgLW2tu7Ozs7+rZeXV6iZmVm9gYGBmMViyQiCQFQqFdFoNESh'
+        'UJb8/Pw825uatgnOpn3ItbMfHGYw0G0agaaYBJpks6SjJqZ3+m1t+bxAzudDpxOPSqqrX7lf9JPw'
+        'eDsbM7KOlIeG15b4+XV0nUnxQv1d+++F1/ZUY0xw5E1fL35/drYBfNc2lRxvR19yimO5q69w8NxF'
+        'E1CsZnpVBgcHtTMzM3fHxsb+wd3dPdvExGQEIC1gWBgUBgawkPI9iUSSArjgtvp6XV5ykn63ve3Y'
+        'LJ2KZIQekpI/hTUJLZEBIpmGhgyMpAPWtl/yvPxqR2MTLaczMl+WdXZ+Leu/29S8bTj/ytttCQnR'
+        'hV7HBA2nEk4N3yh6Za67bQX2ZF72q02hwZfKOcHt87VNb6GpqZV9CzU1rzUFRd6qDoz4gn/1i1fR'
+        'zMzjd8Jnz559GyuMzWaPYUAMUA9uGJKyqb6HY6S+vj6ctvo6ABdP6bGznphhEADrU7READjSYYT0'
+        '9RGiUJGERkfTdDoaYxujfiOzuSF3r6KpM2f/D9VW71utqwi1t+9riU9yK/Tz77t18uTpyYrygyrR'
+        'dosgO/NvJR7evf2p6cFL3R17VT/LO5tjcd0rcIybfM5I2tL1+EoysVi8FVT2gaGh4U0mkzmHlYUB'
+        '0eFCVaHh7Xibco1NNcDPj9Pd1KgrTE6g9drZiqeZdCShktFdmj5aBMUhMhnAkdESlYQWYNs8jYzm'
+        'mAwkNjSS9trYdvMiwr1my66/uNp53a6seLYhPjaw2M9ntC893QsNDe1eMevGxr3ciKjU6oCAxrHS'
+        'G/+NZodXeop5V6+/WRYaxW2OSflsqqb5qccCLTc391kfHx97UJkQfJgcEIaihKaEpApMuSYAXJCP'
+        'H6evoUl3NCmJOmBtN3GXykIyMhUtUkB5oDREoi7DO4Jk1I+RjPYxkhDQwAeKGXQkNDGbF3r75o1l'
+        'Zb2O1EwXtTdDeVX9QmNYcEyVh1fnxOVrH6Db8zrKSD9ZdO1XxaGgyLQ4d0lf8w7l5ybqmnbdjE7y'
+        'rwiJrhsqunXwHw6toaFhP0TJUFDZHVVlKeGpb1tFcYsBvv6czvpG3eHERAoGJ6EyARSGpgRHWwGH'
+        'KB/D648AIJgxXR/2gzIpdDRhaLrU4+5xeTgj/d9RX/sW9VRIWlr8erV3QOet8Jjw+ebuPcp9o421'
+        'u8pS4pKLk2MDxS21K7kbmpzU7snJ/9eujJy/dZ/L+cd1ANTV1WmVlZU94+Hh4QcQpjEIZaRUBaaq'
+        'vNXBEYvAjcOtb9w+kBRPEljbjktoWGEYigIMhqgAB76ODD5PDxoZIFL1kQzv1yeDOulo0NhE0uvr'
+        'XSDOu/BT1Nt7r7/r7d3akpQaWhB4vKQpK+cnyu1TQwKdmovZL1dln/3BGLfh8XcvXbx4cae3t3co'
+        'pBhzGAgoTh4psV/DQeF+ylsNnL9/UGB7Y4vuUFICecDaanyBBn6N8gn4tI/RIlVPHlmxj0MUkhye'
+        'jKAiKXx+kUpBdwHeIjQpDV7TGGiQxZb2uXkUzublv6aewPYWFr3SmJenJ6y9+cx6VQFbIJH9BBLY'
+        'CaXK7qcw9X0YrnI/XpPJ5CW/AE5wd3PLjuHTybQBS5txCYCX+zPyxwDvUySh68kDAyIrAoWUTAF4'
+        'dDBXOmwHgHQKWoD9Umy2dCYagYgr8A+Mnc+9cmjDDMy0tLRop6Sk/NrU1LRVXVkPavcEheU8jkan'
+        'LYGlBvZ1dOwYPnuO3GvtMHqHbggmCvBIGNhhNMfSQ4u05egK0BRrbL7g+wgG7KOiBYAnA3gygDtP'
+        'ZyG+le34QES0/Z3i4p0bAhzkaS+6uLhkg0kuPgw0pZkqwS2/X4IEuQFKsT+KRCKdicLrb7b4+V7u'
+        'NzNdug0pyRJAkBL6SMKAJFhuvgrVybC5yl9jZdJgHwGqI0O0he0AexFMecjQGLU5OvPEOTm/W3do'
+        'paWl2qGhoSzwa5P3M8cHgcM+EK+x4uzt7Yvi4+N/B5F5h6IDkr9t8kruuzyO72d8c7O5OfBZMhxZ'
+        'qVhNCh+HoS1Rj4CP01OYLgXvo6AlOuyjLQcMgoJmWAaIZ2omFYaGpKL2/qfWFVxVVdUhGxub5m9K'
+        'Nx7UlutUmbW1dWVqaupbQqFQ53RM/J7U1JS3zpzPeIHLrd02nZv9Wr+v17lxtqlERsHwqPLgoIB2'
+        'GMzyEwCHI6ue3GxxZJWC2hDeBlDxdmy+kwwa6reyGp3N+vxj1MtfvwGZpKQkumrKoR4Y1tqMjIzE'
+        'YWFhrJ6enm1xsXE/9HR2jzE/at5j4+qQezL11PuIx9Oezc74YNjaniehssH8FAkwrl8XaRjcp8vg'
+        'ABZJUVVIQZFLND3FdspheSTGVccYm73Y7xuUKSutfHFdoDU3Nx+ws7PLUY2IDwsOqw2nLeDX2kBt'
+        'vwTT3wX+0ptFg+SZygBfT1s4am1+DSHRNtRY/8Kw27GiWZoxkpLockDYPBfoh+XwMERE0pfncNjX'
+        'ScFcF+gYHpgqNmO5H9RHswwm6rVz6R1JS/8dmh7QbP8aOG5tqEM/BKUMqfqoRzFV3CAi154/f/7N'
+        'a9eu7XVyckqHXA7RIb0gSGDGBFU8MTZwAA307eX7BVyYYBpDhGXIwWFYCzTs3/QVgQKrjaSIsDiv'
+        'W6AT8tREigMJoS+Hd5cGibGZ9bwoJsbzTtkNzU68aW1txcrgADTJt/FvSpVicBcuXHgzPz9/r6Oj'
+        'YwYFnDkDwLHJTETXI6bGhcIDaIj/dJ8/57NRiI6LBKQdJHD+BPZx+l8lxGTySooipUIQAZ+2iHtW'
+        '6MvBhMAKpKIxQyNZn6935cilnAMaBff5558fhAh4SbUDUhklHwUcmCoG90ZeXt4+AHeODJGRDmmF'
+        'EcUAMfRoCnAjvU/1BwRkjwG4BSpVkYYQKtBWKonlRsXpCChP3ijyhqMtfj8N7qHTxnJs6vLFn2sU'
+        'XExMzNtWVlbtkOXLfZTSX6n3s601JVlW3BuguH1gqhkERaE4JokB5grghkbk4Ab8ArLEBmwoqaiK'
+        'OlVufuSVhkEiAqIo8Sk0PQVAUC+cnDyFWcIBA9ocmDDP1GhhJiONqlFw4N/+CBc7rh4QHtZclQkw'
+        'BpeTk/PGlStX9jk7O2dQ8A8CORuNDLUrQZ8cGhc9g4Z7dov8A85NycERckd/LziS3NfJe0nk4I4o'
+        'oixZoUhcfi2BqUpBoRIw3SEjAzQaHcnR6DyRqKgoKovFmlc1z0dJRZSfgSBTl5ubu6w4xwwCLo6B'
+        '91GZ6LAeZWJ0fOIZJBrcLfQPzBg3MAJThfKKAsU+RU+edijMlaRYY6XJ1aZ3j+li0NLltgCfmTA0'
+        'QMMcTgIa6d6hMXCRkZF2SrNU7zJ6WB+HTfzo0aP1oLg3CwoK9jg62KdQIWGlg2lRoGhnGBgLRkdn'
+        '9iCBYK/Q2+/8BNMALWDzIx2RR9Ul2lfgHtRkoEDcFgHcFIuFhry8LqK+Ns0FiPDwcH/13g/V9rCq'
+        'Y7PZXeA33+Nyuds93d0tWTTcn0dBJBpx18nNPQ2Pv6JbVYeGXdwKpwHmorwuPaJQEXXt4JQN+7nb'
+        'kM8JXF1LUGuD5hLh47Codn9/G3A4wICpzgYGBnpfv35955XL+fuT4uLobm7O8cFhwR6ZOVmvorZW'
+        '3Zm0ZP1xS+vhecjxpBS9FecvozwcNCW4aSYL8Z1dbqHmupc1Bg4K+7B/FDiVADEI3/tXgUCwc7mP'
+        'T2e5y3rbzPmsP/Z5uJaOG7AWcQ+wFPf2EvrL5kf6eirygCaFIDED4ATOLjWouf5lTSouTH1YTzmC'
+        '9bDwVHuAzc3NO8ENWFZVVckHjFF//47RrKxP+48da+KZmS7M0KnyqLiAx1fl3eZkeW/Io4CbpjOR'
+        '0Nn1lkbBYcUpSyxVeGsBttoxqiNekBdO+QT4MwaHhraM5lx8n+vg2slnssGZM9BdPBgNacYC9Yjc'
+        'ySv63x4BHBw/wwDFObncRNz6jWGq94O12nGqw4XKNZlClvlyAjg9rR26oqQ0gmflMD5Lg0gKGf8S'
+        'rk0BGh5XkJsoifzQ0OQ+DhR3GyvOzf0mamteH1NVXrRqevKgtlrZpfwOCBZSH1/fwM4mru5IXAJl'
+        '2NJufJHGRDIS7t3AaoNCXd4lTl7uWnqE4ADll5jOQDxnrLiGH2hScSfUe0MeBGq1BFmt21wOjqAQ'
+        '0kA//8BeACdKjqfwbSzH79KXSyyAh9WChwtl8rEGfUV3EkV/zdAwaAnkfpMGLNTvCuDa6n+gyTwu'
+        'VH1E/kFB4X6VhTpYKLdkwQCO18zV5Z+JJzodLCZmWBRFHUrC/olAEioNwBGKkoo4/FVdulZwdKgc'
+        'WEzEc3OrRK2NhzRZOfwJsv0euOh5UJ5MfdDlYYODqmIJMkUW6O0b1N/YrNubHEftcLScmDakyQdp'
+        '5ODIy+AoxHIdemQZCPmrpqxfl+eY4Ci6COaJ55hMM2myQTZLwrO0EAuPh7gjYb/mZpZ3dXVtv3Hj'
+        'xs9DQkJsLC0trxsbGwsB3OJqylKNvKoKvd/gNB5/8PX2DezhtuqKEpOoPFvbiTsM+nK+pkhe5wEC'
+        'HnyWg9OHepWEu8UJeQBZgO2LUJLheSaLFBpAZqAZ8GdjRmzpgBl7ku/iUN0RFhYykJ390d3m5vWZ'
+        'njoJyWlJScn3g4KCPvD09PRxcHCowOMHAEGmbsbqYxOqAJVjqvKRfHjt5esd1NHK1R1KTiT67W0g'
+        'qhIrFQLO4+ZpiiYfsceFPqEIGHNggjMsKppk0tEok4lEbBMp38xylufi1iEMCowThAQQ05npby0C'
+        'MCQWa/6e1czMzH3R0dHvg+LeKi4u3j02NqZTXl6+PTk5+dmsrKx3ExIS2F5eXgkmJibVAEMEUPA0'
+        'L5lyaoQyGqsDXE5HkE+Ad1Bne62uICWO1OVoPTYNOZwUF/bynl0qmgcFzhjQ0SSLQGLwf2N0smzE'
+        'gL40aGY4323BnuiwNW/rO+ZxZSo+3mMm67O/iC/l/WSmqGg3am/Xqayo2BkVfvzVmPCw95NPJ72g'
+        'UXAAzZTFYk0DGKGLi0ukh4cH6cKFCz/t6OjYf/v27ZX+rZGRkafPnj37X7a2to5wbDKUVdegOqgH'
+        '/8iDwn4GIEpVyy5FpKZ9GRDga9nb3rxVdO7MH9rcnHsFhoZoClKSGSoLTTGNwOxMZUPm5vODNpZj'
+        'Aw42nQJn18I2J5ekVj9vz5GMJD1J2fW3UQd3HxII8C1IWmNDg3uKir54Izgk+C9OLs4+FhZHG6lU'
+        'ypSnl0d8Z2fzTo2mI8oSCy5YigekAUiLtbV1TnBwsHN+fv57w8PDKyc0NTWlw+PxnoIi/hCo8Y2w'
+        'sLDfgHnrw7HmUNx7BAQEhHl7e6e7urrm4mI/MTHxZZFIpHWnvGQ/Ly3ZvJ3jlzfI4VwaDwxKER8P'
+        'jxiPiPIajYkxGU+K/1ScnPCe5PylV9DNhn1IJNJF0j65CS5IJFvrqit+nhgXbermYpdqamJQY8hm'
+        'imgM6l0S+EEynYasbG1qunl9BzUGDi48Qt3pLyew2Lctwet5CwuLDj8/v3OQuhjB8b8/efIkHlN4'
+        'sba2dn9fX98ugLm1s7NTu7q6WufatWtb0tPTt8IxW+GYLQBZMZlnZERrtLRIZ6qmYvftuuIdd8pL'
+        't0muXtkiq6rUWRANbRkSCna2tLXtvXKl4PlT8Yk/joyKfS86Oo4aEhIWa2tj38iiMyYZBLHIooGb'
+        'gKBCp1MQAYGFCu6CTKMjY7OjzXAuz2sc3Gpz3dRzMzBpKZjpBERfLgSPq/b29mecnJyijx075nDi'
+        'xIkj4C9/C0p859atWz+CaP08mPdT09PTO2dmZnaB2e+A97v6BoUHWjtbXy6rKns952LO+7Fxpz7y'
+        '9g8wdXR1DbBzdo6zdbS/dNTavN74qOkQi214hwAroEFEZREMZADmzYLGoDIRjYotBM4Noixu1la2'
+        'zfxe/nOaBBe5Gjj1OlR9zq/Sj+GoC/5tHkx8AvtJUGe3mZlZK/i+Rhsbm5sODo6V9o5O5TYO9kVW'
+        '9jZFAKXSxNy0zszcpMXYhM03NDQYZTCZswSNtkChU5dIND2ZPuMworD0EQEBg8oAXwkBhE5jIAYN'
+        'oEGtyyQUjUGB4AQpCh2araVtq6BHoFFTjfqmSkGZXqwGThWoqjKVQ41UKKfIYFL6kG7oQbpBgqSV'
+        'oOPvIxAB76nQmACGxaDKu9exCZJp+ojCJMFxJNhPBlAENLq80ZfVRYWinsBrvA13yRN0AGfTxuvh'
+        'ac5UociPfJhxBVUV3u/9yjR+cNoEgwIgAAoTKwd+APmFwmvwT3TI1ZiwnwlwmTS8BugAkKDCfgBv'
+        'AEpig1kaABgWVfEDEUwaIkF+p2dAwJqQ/zg0qD6sraxbe3p6Nga41Xo/lFBU9+F8brXuJYXqsPrw'
+        'NAgo/MkM8FXgp+gGcBwTgAIIFhzLhIvHSgSgBgwmYgJcJvg0hRni72aBybLgRwDfxsR/H/4mAMNq'
+        'pNIUQcLS2rKlt7f3eU2mIxEPozZ1Vakr7mtdTHL10BQwqNgnsUBtAAJMjQK+iwwKIgAgTWnyAJhO'
+        'wVAYctMkwByxWRJycLANmgFsM4TvNIBGYLOHZrFRwa2lM/PBjb7SHnaMA0O854dT86tWVlbcDWOq'
+        'T0pbBtcM4A5ugtvo4HA68k8CrmkT3JME7lFnYG4qbo3d4ps+bnkJCQmJfNQZ5hupWVtbN0Eed1CT'
+        'eVz4/XpDngRgyvO1s7Or6e/v19w0r4iICA/1AZgnCZzyXJ2dnQuFQuEeTXads/HTG1QHXp4kcMrz'
+        '9PLyypqdndXV5FRWfI/DrPr9WE+aj4NEPkSjD50Cxf3C0tKyX/UBBY8663w9fVxSUhJLo6NcaWlp'
+        '38d3+qnfpPukKA3/wOBqvszMzPyFRsHV1dXtcXJyisPPCFHtMnqSzNTBweEWKE6zDxSFEK7F4XA+'
+        'YTKZY9/2BpH1aHDOEh8fH+v6+nrN33pZXFz8koWFRemDpnJtxGZmZtYTHh7+q3W5P39yclIHEmF3'
+        '9ZRkowUB5WOJVH5gqa2tbXZJSclzWuu11NTUvGZubi58lNnmGjRLpPoALAMDg9HTp0//v9Z6LlAg'
+        'bwVfFwgntfBt7pB+nImu6qx2DNDT0zOdy+XuWVdwHR0dWqmpqW9CsVyOB5k3as6mTJuMjY0FiYmJ'
+        'v9TaCAuPx9t66tSpI2w2e3gjllZKteHZVf7+/s7Xr1/fobVRlsrKyqfhpMI3qp/DE4Hc3NzOXbhw'
+        '4aUN9y8I4KSedXd3z8JPI1zrI4IehzmqdzrgaWhWVlaVBQUFrw8NDW28R9IKBAJtKP5/CqXYVTwf'
+        'eLWH7D2upl76qQSpJYBWk5CQ8J9aG3kRCoV4ntu7jo6OJSQS6auZ5MrnJj3G2hP/jZWJO8vP3YRE'
+        'lwvQPigrK9v4D3zv6+vTysvLewV8SpahoeE0vgBlWfa4FadSN8/Z2dkVfvHFF28WFhZqPTGLWCzW'
+        'vnbt2qGAgABcWdzWRPRUqZO/dHZ2jsvOzn5D60ldoKzZfeLECTr4mVrVZ5Q8pv61RahiuqEMNImP'
+        'jz/wxP8DH9zDCqXZS1BhOEAC2gYlz/xqc+XWOvij/iwAWC8YGRl1eXl5HQcX8Tr42X+uh7njx9sm'
+        'Jyf/CvI9DwgeFXDBc6vB+qYpYKpJLfwAd6FiqfP29g6JjY39TVNT026tf9ZldnZWu6GhQTciIuI5'
+        'MOH3fX19j1tYWNQDCPw0avwMui+h3cUqgkx/EeDgJsFPeMU3AMP2UVBch4uLyxkwxw/hRzh448aN'
+        'Xfi56FrftYXP5z9dXFz8TkZGxl8jIyPZEFDcjh07FgrJdAQACoe13/Hjx83S0tI+gij5bm9v7zPf'
+        '+f/qsYo/xKrcMjIysn16eloX2naJRLJl8z+1bS6by+byLZe/Ax0TUMk4YphjAAAAAElFTkSuQmCC'
+    ),
+    ('middle', 48): (
+        'iVBORw0KGgoAAAANSUhEUgAAAB0AAAAwCAYAAADtoXHnAAAGfUlEQVR42uVYaUxUVxQGayPamFZE'
+        '24JNF7SSGjWp+qMkrWnT9oc0dokmbZw3b5iBWRjGEXHYg6yyyT4CQ0RWh11btmETFwhoy2JwQLA6'
+        'QKHEagrW1rYW4fW7KNMHMpuCf/qSkzd33jvnO/s991lZWXCN6XRLb15otr1SWv76pdyCN3+sqLGf'
+        '6OmzYUZHrRblaqqq2lRfWOjZkptHtRec/LJTXbinM69w38VctU9ztlrYU3/BbsFBmdu3rZlbt6xH'
+        'OtpsO06Vbvn+ZMH2vgbN+js3+pcNn7+4+rKmac3iWPvdt6ursjL3tJeXfKStPP3Buezju8/l58m6'
+        '6uttrRbz6u9se/5sXu6OhrT0nZdKSzbcGx1dQrywqKDdF8+/0NNU73SrrdWhuVC97fKZxhWLAtTR'
+        '0WFdVlZmc+LEia3BwcHfREVFbevr67MOCwtzxvqr7OzszXi+rLe3d2EAVSrVBn9//0iRSKTjcrmT'
+        'IEYoFP5QV1e3ViKR9HE4HIam6Qfkt6+v7+H09PQ3ngZsZUBAgK+rq+ttAgTBDEVRDPktFou1Go3G'
+        '3tPT8wZZs2hKIBCM+vn5CWG9jaWADlKpVEOEELA5ghlYpa2urrbHO7oZRdgEnkkoVKBWq83L6mPH'
+        'jq1zd3fvYAl4TCgsvVJVVfUqQOdaOstqhOE85BlvGsXFxSshqIENOBeUrBHfaVAPD4/rRkCn392/'
+        'f39pTU2NYVeThJlxF7nPBaQo3Dk8RiyRlJ1pbFwplcnPcik+w+dAOcog8CTkes8LmJmZuZHH492Z'
+        'j1GvAMhDJq/Lzz7+ysjpcru0dNVrQk95O4e8Qxu22M3N7WZ+fr7DLEBSc4cOHVLOFz82Qam/oo9E'
+        'vdefkBjaq/Adux4X7xEXFbtLQPMnaCN8hCA/bHh4+D9QFL0tkmNkxipD1qIcxrNVGeuH/INq/+AK'
+        'mAFfvxplfOI7IoHwHs2ljcaWZDzKaAU7Y9/HgymuCW3d3ARjOVkqx9FA39oJKDHk462JT050ooXu'
+        'vxty74z34KV/EhISNupBfXx85KYAH8XmIai/onYCnWhIoahVJqdudOe73aUNeIgNjo4l0IMqFAol'
+        'ZQYTAc3MSHPUBQXWjPEEzDX/gIrkpEQnIV9wl2eCnxDKMVoPiiAXUWYwEReFHj78Rb8y1eVqeGjJ'
+        'gCrDOSg0RMzhPezJpkgmkynZoCXmMBESuYt0UbFHPhwfuvpcRFT0LoGb+Jd9tCtDcWmLQYvNAkWy'
+        'fM2jGXeRsK2prsFOKpb1UMhimuIxtHmWpupBvb29Z7nXmKv38ShGLBJqNRVV9p4SqY40DJpLTZOx'
+        'fHgEmsK2NI7sizNgxpoEzeWg4Yu0FdWVDmKZeJDicYx2I/a26OXlFaAHbWlpWRYdHe0CTYqQoaPG'
+        'apYDALFIoq2prMTWJtbRWE+7FzQP2APsWD9hm8uNi4v7tLW1dSm7TrdhN6BSU1NXYedfFxER8Rle'
+        'jMZu0g7G30D3Z6YGojEEtWMTX4sS6HtoPXEx/QDZ/Teej4OvFfzB4eHhH2dkZNinpKTYHThwgI+h'
+        'YCs7pmrCDGE3Ieg0lPCIj4/fotVqlzc3N685evTodkwDe1Hc8oMHD0ZgLnLp7u5egvte8Ibhfyme'
+        '705MTNza1NS0Gs9WYI56F/97AbwW3vuVyIdhyezmUMZOIkIYU+5BiQG5XF6NWKRBqBwucoHgHaGh'
+        'oW+HhISsj4yMdFIqlc5Q8HM8V8AaFQSfAcjPsPrPebJ3ViKVG2ry03FkJRmEkcY/SYjP50+RNVtZ'
+        'YwkFhVLY7i01VWMzQueSuU3lEeisOi22hHk+b1gMiuQofFJQCy1NYYOq/zeg+c8CFCWTzAZNsTQT'
+        'LSXSf9F4Itl1KnkWlqKBcPWgGJicUeSTpkbQpykryL+PdrpBD4qmbItzx8higRLCEaQTB6rlelA0'
+        '9iXoscpFBJ1CCAMHBgZmHyvS0tI2ocnfZZ9DnzZx2MeKrKyslx87y8Ba0g6PAHBqISxmTSET2OIk'
+        'DMMYPAyvwvjfslCAhBC24qKiIuOncmQyORRfMTUrmQE4hQmisaCg4CXTX8bghtjY2LeQbc3E1U8S'
+        'X/BMovucQp5Y9hUNGq7CxBAz3wRgjLCxj2Pc8c7JybF5oi8sXV1d1jExMZsBng6XD5JTtQG3k6nv'
+        'GhIxJikpyXFwcHBhvqDBVXbo0Z8EBQXJcI8j8w4BCQwMlGK9s6Sk5EVzZf0LJhKY2xgFox4AAAAA'
+        'SUVORK5CYII='
+    ),
+    ('middle', 72): (
+        'iVBORw0KGgoAAAANSUhEUgAAACwAAABICAYAAACN4RdNAAAM5klEQVR42uWaCVDTVx7HBaGgtnbR'
+        'Wm1161FbtrvuzPZabXdnD7vtTmfanXZ3262S5J+EU1RAbrlUXFEBOUYEBATBSAJCiggBuS+5L7lJ'
+        'SQEFZASpbalaBP77fWn+GELABEHpbGbeJPnn5f0/7/d+53v/RYv+n179/f26RRLJmrykpLfLRaLP'
+        'mpPEVnWiBOfKOIFXjUDo1ZwgtmuIT9xRK7rwTkd+/oo7HR26TxS4ubbKKF0kss5NTHQsOh//2ZWY'
+        'mD9Uxsa9XhMvfOOqKOHNmrPCP1fGCtnl50TH807HHq9Jlnw02H9T74kB0zS9iO7vXzzlGk3rouko'
+        'Xx+sqF9bk5Kxbeh6v+ETV426oiLD9LiYT8uTE1yqxYl+NQnCoNoLCUHVyYlH8mOjTa9mpP9mqFOm'
+        'u2B0+WppiUFOkuh9SWT4rwD8UnuW5MWWtJR1uZHhxoWxZz8qEiW4tpaULFtwRliTk6lbeF6g35iW'
+        'tqRVkmFYmZSo111VpUMPDCxGW3heozbv8vaypES3ouho10rBefuyBJFT2cWU3y1YN1dbmL20vThv'
+        '2Q9NDQbD9fWGVxKERsXi5IWlCk1NTXrJycnP+Pn5rfb3998cEhLyLOMtcG2Fi4vL2qCgoOfFYvEz'
+        '6Lv4iYHKZLIlAoFgu5eX12F7e/vLe/fulVlaWg46ODiI+vr6DLKzs1eT62ZmZjdtbGykTk5O6QcP'
+        'HvTAf7beuHHjqccGmpGRsdbHx8fS2dm5gs1m/8hiscY5HA7NNFNT0578/PxXLl68+CaB5fF4tImJ'
+        'ifw39B/j8/l3MKnio0ePUujz3LyB5uTkLPP19f0cUqzgcrl3lCEBQlMUJW8A6gWwcUpKytvm5uYD'
+        '5Hf0n+hD3hXXhiH5HIC/X1lZOXcS7+jo0Dl58uTz+/fvD4PEvmfAlIGZ7+QdfXoLCgqMv/zyy60M'
+        'MDMp1f+Qa1iRQQ8PD+eoqKjlA3Ph+s6cOfO6nZ1dEZZeLil1wMoQAJgAtrCwGFDXT3V1MO4o9D1R'
+        'JBJtmH1i09ysExgY+Aak1IJBx5UGn/bmSsCvJiGD0wSY/IcIA2OPon95aGioMVZV67RRJyIi4rXd'
+        'u3c3YtAJoyIGpIGEewC8GcBvYbI3NQFWUpcxW1vbgtjY2LXELWr8EgqFqxwdHTOIdSurgSYSxqR6'
+        '8vLyNAZmYJmxibRhL7FpaWnLNYLt6urSP3ToUICykZDPjA6rg5S/szEpDo/m8niNhYWFazIkkl+b'
+        'WVhd41B8mmJxab4JPANbPTAjEOYeaCPw2fbw1w8PNIhKf8Oy3lBn2TNJic3m0qZmltL/+vjsvHXr'
+        'lk5jXZ2+p/d/bTmmFj0cNp82w2QoNkuj8Qg43OfX0dHRb80IW15evhihNIP8gVEBFR2bIhlGZcwt'
+        'rfoDT4b89WZDlUHvJfG66xcurJbV1xscDQ424ZhZDu8kIFyORsCKVRuDu4vEik+fR8fFxf2FBAXG'
+        '0Ssv+UOsfHy/6/7A61LpEmlMtHXDYe/r9Z4HpH3x5z/MlGQu9XT3SobKjD9sLNUGjtupqalb1MLm'
+        '5uYauru7C4gLU/YE06mFirGMBJ8I2EGXVa5q8/Iu7jO3pvtMrelWD6+s8dbWZUE+x/eas3mjPBal'
+        'sYQZKYPpSH19/dQ6EPqyDgnMNU1nrzwhisMZiQgP/TddUrL66/1uJd9DX3/g8Gmps1MlfbXWKNA/'
+        'wJzL5Y9yOFyNbYKBRtCqDAsLe3YKMHwfMbZRTQ1NeXnxeSQiIvSfdEXxmk4355J7FIf+kUPRUif7'
+        'CvpqtdGxwBP8nXzefRMupdXYitzku4CAgE1TgI8dO+alKayaGyiAi9Z0uTmV/Mhh0/cwFoDLCfCJ'
+        'oEAui8u9z+awtQYm9nTixAkL1cimv2/fvvPaAjMDEx2OiAj7lC4tWtPp6njlHtzXXfjcrxwdq+i6'
+        '2pVBAcEsHpt7n8diaWt0cvVAnhE6PDz8wFtAqY2gvwU/+VPtoQlweHjYJ2PlJWu+cnMtvY0bfYOA'
+        '0eLiApWoXxEcEGTCBzDfZHYrCJ8s6ezsXDoBfPny5XWI4fWM/9UWGO2+z7Ej/PGOtuXNPj4XW82t'
+        '6Har3WNSP//Tw53SJQePHHLjUOwxnpbCYISHlLW4pqbGaAIYvm4jEp0Wxjq1sWT5d7hCJwfHTNE5'
+        'wfJbmZIN3bFRnh3R4bZDOVnPxYsS1u3eZ9e4A/rL1lKyDDBykisVFRUrJ4BRqmwCcKu2g02yZop/'
+        '74CHl+954bmX6H6pHj0k042Oi9vs6uZxlkXxR024fNqEQ80aGFXJykkS3rNnT6u2OjwpQaK4tAl0'
+        '2cbBLr6jR2pQeqV0lY3tPgnFNR9lIZeQJ0GPAFxdXb1iikpM52cfNiDp+wXyhB18LsnWuq/k529K'
+        'S05908LUCumlKWBN5dkcdxY6LM9TzM1LqqqqHgCjnCESblYOt8qfNRnchPtTM+Xxekuy81+9mJD8'
+        'tqWpxQBF8QBMUk+EcDZrVl6CGB0k/MDokGxvtLKyapmuYNSskRDNQmTiyqvmpOSkbWYWZoNsHibP'
+        'RaNY8j7aBg5FqlkMo3sAjJLmaQcHh4SdO3dOgp2pHFIPzCahtC+vMN9YJE58l2/JB7AJYMmYlKJp'
+        'l0uQ7whqES0tLZO3AsrKypafPn36XwBPwox6lTdINNJnijR4Cx7K/NwCY3FS4jYLc/4gxWWR5Ajq'
+        'gGqEGJ8G0LjfKPS228nJSRAZGfkx8vSpm+B9fX06MplMLz09/Wk/Pz9j5BZWNjY2ScTdISm6TVI9'
+        'VclPJPjkOsWR6yqfb9qTn5u7WYyazgI1HUUpJoxQzVWTrSlWdAQrM4CquR7SjD9+/DjL19d3U3Fx'
+        '8ZLe3l797u7uSbv5i4qKivQg2V0oIM+htN+Ozkbo/NS1a9cMBQLBJldX1/eQ/bvCMPNw8x6022h3'
+        'SIRj8me54f1UtHaUlpauS0lJ2UJWiiksmfyWJEqA+wGfv0GTISXIcHNz2+3p6fkujH8tQrBBVlaW'
+        'IRhWoX0CgxPi/jwI80EugQr1JWtr6wbFjEeIx0DVHO3t7c3Ozs5+eWhoSJfZkWxsbFyJQPM6VuBT'
+        'VLd2zs7OAWixyFuzIJ38AwcO7MNq6dbW1i4DxEFStmNp08h4eD+M/1gjXfwwOTn5t8hhfsEwtLW1'
+        '6ZPqAsXnLvRLAI+MqAaZLCQ/OTRDGptI4FDRV6LDI2i3IYUqLy+vYMDsCA0N3QrglxsaGox6enr0'
+        'YAyLUdbrnz171jAiIsLw0qVLE5WuRCLRw7Ul8fHxBjk5OfqYrO7AwIB+U1PTiszMzFcAvh0rR2Fi'
+        '4VC9eqzwt2TVVHJtOTAEYKTshzcDWDqlklC4FSbVQ7uHJeqHQXRAArVQozRMItDf398uODj4P9D9'
+        'DyChbWi/R9t65MiRP+L6R6dOnaIA54xrYViFXKhKPcaQwTa+wZj31Rm3chwgwAjNk4ExQ+l0FTJT'
+        'eitX0cx3pd1I4tKIkydbTsTKx/B5nFxj9jOY/soRUhMPhPFKADwp0r0M4PaZgJkbqfZRra7V5SPT'
+        'QWkaoLAiU4Dl2dpMwDNvorDVXmNWYTbheEZgsVi8ETrZ8ijA02V6D/t9tsAbANw8G2AtK5O5AYZK'
+        'zDvwnKqEArjpZwOMwLH+ZwUMCa/ftWvXQgaeHJoR10ku0bjQQJUCx+RIl5GR8QKAqxeidBVFaD5y'
+        'lwdHCETcyCVyZ7ORMp+NOfeAhC+RVHcCmJwl2Nvbn1lIoMo1HZKsYNVHchYhk3JZKNJlQBknEBQU'
+        'xJ5SIkVFRW1HujeizXbVfEuZNGR8t5G+bpwCHBYW9iIMr1vTovNxSRr5c2F0dPQz6s44DPBjLDqN'
+        'LxRgcpyLAsGFVDVqj2vDw8PfA+zwkwZm7g93NogYYTztsRdK6qdgkbnM2dvsd4FmZ2CMkSnc2Riq'
+        '6TBNTkL/jj8OPC5dJrDk0F215EJp9RV097WHAqenp+ujFPcnJfbj9AjK+2mYwLC3t7cFdFdX04c6'
+        'NiDyFTyOUK2qEvg8BoFFikSi5Vo9MxEaGroFPrBrvtVCWW/JLpKNjU0JsscXtH4ipby8nDzr8w5S'
+        'uzbVwR9lEuoqbsU2wRgK4WyhULgeajn7x219fX3/BPWoIo9wPWoxqfoECuONyONkiAEpcKvGc/GM'
+        'sA6xVri7FNzk/lzqteJZorsuLi4BkOwLi+by1d7evhSWu8fKykrGYrEeyY0xxmVra1sJN/qPKZnY'
+        'nD3YXFene+rUqfXu7u5e0LerSJbuMufBmh6kw5C/g4oVYfK7YmJiVnd1dc0PrMpzQYsFAsEvPT09'
+        'PyZn1ABpg++8gQl8SyYBp0/2gEcAd5dshgO4F60B7ioEoO+lpqauamxsnH/Q6QwT5cuziYmJW0JC'
+        'Qj5AsvIFdJLn6upKHT58+HN4mvfT0tJea25uXjoX9/sfb0GhDHhJ4s4AAAAASUVORK5CYII='
+    ),
+    ('middle', 96): (
+        'iVBORw0KGgoAAAANSUhEUgAAADsAAABgCAYAAACjbAqHAAAUNElEQVR42u1cCVQUV7oOW0w0iRlN'
+        'TM6bJL4sk8mm5sXkJDNJ5mV7L2aSM2aScQL03jSyC8oeUFwgsggIKIuoYZcdQZAQdkEW2fcdUQQR'
+        'xA1FFKXed9u+vrJplm5wFDN9zj1VXXWr7v/df/9vVT300L9/M/8xDKN2+cyZeafLy589k3/kDyd+'
+        'yVxZG5fwcWlo+OeklYVHfdaZlrHyfFHpSzebWhcxPT1acw5kX1+fWm1Z2XOZiYlr0sLD7NICA32P'
+        'BO8LKA+P8CuPiPQrC48Mqow6EFQVFR1cFXJgX8HuPftzdwftOhYZZd2el/f2cHv7/DkDtvZYsXp+'
+        'etpXSaGhjkUpKeLm/PyP6jJ+XVp+IHrRsbCwheURUQuro2MW1hyIWdiUmPZMV0b+ivb07DUFP0e5'
+        'pfvuCS2JSNzWnF/y2tm+frW5IL4PMefPazC9vRoKz0G8Ze3Oc+3d6hfK61+qSkpf3XykdMW57j61'
+        'OSfWl090LDhVVfxac1b6l+UJMdySyAjD0vAww/KYA+L23MyveqpKXx860bGQGRxUm9NG6nRb22Mx'
+        'QYGbE3btDM4N+9mnPDHOpf7QQYcGtNqD8S5HQvYHJ3ntiMzYE+TZnJfz+Y1r19TntEVuLCteNthe'
+        '97jC8+Xlav2lpUtK4uO5OdExVoNtbfMeJHdE9Fkd+qyFdofYMgMDWg8EyM7GykdK01I+yQ0LNU33'
+        '9bXL8PXbmBMcbFaWEPf348XFzxAJeGA4WnvsyOKKrPTvmvIyv+ktKvzT2ZKS904XFPy58ECk8a/h'
+        'YaKGgoInfwtR1kMPFFfJr6ur62HSHihQHR0daocPH344IiLid0lJSe+EhIToeXp6+tjZ2aVYWlqm'
+        '7969e12vzDA1NjY+4u7uvhXHUx0dHWO9vb09Q0NDeQcPHlwRhkgrKytL8/Tp0/cf1+vr69UBcsme'
+        'PXs+3b59+09WVlZla9euvSAQCG7yeDyGNvw/jb4vkWvS0tK+FolEF3R0dBgOhyNt+H/T2Ni439bW'
+        'Nt/Dw8MmICDgw4yMjMVtbW33B+impqZFgYGB34N7IRYWFm0geJQQTgHy+fzbTSgUDmdnZ39GrgMH'
+        'tQF+BP3JJEjB0n5kXyKRjJiZmTXivoFBQUFfQxIevZfZjXpCQsI71tbWIQBxioAkhMo4KN1yudzb'
+        '+wQUzhOwn8vA6uL/CJ0Ucp70J/cg15B92b2uAfhxFxcXj8TExJf+5UD379//LMTM1cTE5CQIuikW'
+        'i29zEsBvA6TAyTEZ+OGCggIp2OTkZB6uG9HT07vdjwKlk0a2ZBLIvq6u7qipqWkNxtWPj49/4q6D'
+        'bG9v1/Tx8VmxcePGAyD8BgVCmjyhZJ+ClomwVIxzcnKkYMElPhFjykV2X/a96D49j8m5aGNjszU8'
+        'PPzFgYEB9bulm5rQnf9dv359Hoi+pogbkzVZn+G8vLzPKFhwbWQ619JGJoVwGu0SAEfht7y7u3t2'
+        'ATc0NGi4ubl9CAvbQThKOUG3hGtU36YCm5+f/ym5J/SdqyxY0oj1JqIPI3bd0NCw1N/ffyUkbnas'
+        'Ncy+FqztX42MjE5QcWQDlRmeKbnL4ux/k/vGxcXpKgtWflLJPix2WXBw8MoZizQsroafn98n5ubm'
+        'pcQQsX0mGZgCnQos5T4Bm5ub+xcZZ7VVEWNqH1gTcAOByaHIyMi3VA49SdyKSOgFBweHFAwyKnP6'
+        'tznLNkTUYk4GViYNxEBJwcKiKs1Z9rikES8gk7CrmzZtCkpJSXlaJbB1dXXzoKfB8sEB2acBAJ1l'
+        '6loUEskDUB6RACnYfoB9l9w/JTl5tVAsucwXkHOYRC4khYt78QBqCs5SyaIMIOegx1dcXV0tW1pa'
+        'lM+LYem+MDAwuMgebDLuyXHw/30tF9zgkChJfNnKxjp4cHBQmhDUVVX93sLKNoMj0LvG50sYoY6Q'
+        'MeCLGREAEMDKGC0adSHUPIUw9F2lgBYXFz+H+DZNW1t7nMhONBg7iGD7WS44KzEwHnBwcvopOi7m'
+        'RfY4wSFhK8zt7IO5EoPLPIGeVAr4Av6tpiRYMsEE8LZt2wLB3cenBbSkpEQDmYoxxOK8PEB5x68I'
+        'MAV5W8TF4stO25y3pf+asfBqS61Wb0ric91JCctPxcc9019dpZGcmbnUfuu2KG2u4DoHos4RgnAB'
+        'T2mwlDZI4ynEA98ipZzaWMXGxr4CrmbiwjEar1KAU1lceXEmMw2XVVVRUfEK09en1RUfs6bRa0dZ'
+        '9ZYt/U0eO7LOpaa8c0t/D31uZGB8UsAXqsRVNn3YJ9Y5CtnSM5MCbW5u1vTy8uJhdgapMWCDmEpn'
+        '2caMXufkuDECeqrJVNU+X7PdvbDZbD3Trm/MNJqYMy07PKOY9vb5XW1tjzs7OOUIdRAO8jCmCjrL'
+        'VjdMcOfOnTu/QHQ1MXfh+55wdnaOwEVj7HiUhmlT6S07Y6Fpnq+nl7fUlRUUvdW6cUt9D4zRFaEB'
+        '0y82ZBp/dGhh6uufJ+e9nV1j9ThCgIVl5glU4i6lGe361q1bHYuKiiYuzYaEhLy6YcOGk1NxcCpr'
+        'zA4+/Hy8PaVgjxYua7Gzq7koFDM3dPnMRYGYqbfa0MHUVEjTNldXtwiuAG6FiDJ/xmAZe3v7QiQt'
+        'T03mblZDhK9PFecqBdbP210KtqRwWau9dc1lSAjD4TGXoSINVhZtFKyzu2uoDo7pCiEZAtVEmO3z'
+        'gaPf29v7lQnBBgQEuKgCcqKB7wBbemR5249WNVdEQobhcgBWAM5atDI15VJ35OLhGqItEjC6Ar7S'
+        'YOXHlQUaN/bu3as74VIFQq5faUAw62BLCpa32VlWXwEQRpfDDKFfo+WGVspZN3ePvTwSPfG4M55s'
+        'EkYSDkNvQ+VXC6W/3t7eJ01NTZtU1deJEgI/v51uUrBFR5a32lrWDsGHjunqMpegmw2Wlp1MVdUf'
+        'yHkP1x1BAg64woEXUJIGtiWm/p3sI4EpGRoa0lKUs/5RX1+/dzouRhmwvr4+P5H73ywuWNFoZ113'
+        'DmJ8jctjzsJQ1Vhbd1Cwnm47/IUAq6erPFj2uNRlki04fOLUqVNLxoFF6vURkvPBmQCVL6uQ5u7h'
+        '5tXNdD80Vl3xasPmzVXH9YjbMWA6JQZM3eYtpczx1mebmmrVt7hsDeOBQAkxMrNEA0k8ampqXh0H'
+        'FgH0t5iJi+ySpiqNnWCTrbW19S9VdRWLmIGBBU3+/i7VNja99dbWQzX2dm19MTECpq1NI68g701j'
+        'C9M6XT7Ghs4KZ2gkWcnB2bKyshXjwCYnJ68BJy7OxEBRnWEnBGuhGoG+u9ccP35c/XplxaKeuEjt'
+        'jpCg9afiolaNNDY8Ul9fP3+7xw47vkRvSJsPd0Wu5/NmDWxpaenbisD+EwRemm4BbaJAnIovPSbi'
+        'C29YrlufHxMW8XlnU6MWc6FDk+lt1WLOdahVV1fPC967T8fI2KyZIxCNccV6jA6RiFnk7IRgwZVL'
+        'iir5ylrEO4JzqXUUjRkYGfZ6+nra91669WAJiJjvumPHDslao7MCoWSMyxMzAMzwBCQZEMwaWCQh'
+        '48EeOnRoDZzxRXaWo4phkE8GONhqA7A2/KtAT9RVVV26lIyXk5XzqVCgd5Yk7gQoD00k1JMmAYLZ'
+        '4+xAeXm5Qp39B9HZiUSSp4LvI41ERD+IAVosNVyXj+bkfkzGS41P1hbzJCMCPgAKJDBMQmkCIIRb'
+        'UqVSMYGhHDh27NiycWBTUlK+p9aYbU1VjZNvzy7AaotwLyTlAi5v+Ghm3ifS8WISORK+eETIR2gn'
+        'uFWjEsAwiWCNBSoGFfIFBh0dHcLZt8aBjY6Ollpj+So/Xd5QVZd5AtKIhSfXc4bzcnI+u5VOxvNx'
+        '3xE+JoEnvNWHz6dN9YCGXWrF/wHYhvFgU1NTv0GH8/KAqA7LJ/JKEcEnvpOA5Q7n5OVJ13piE+NE'
+        'fLHgGleE+4t4UrA8MiEC1YMJ6jZpTg2a+2CgXhsHtrCwcLGVlVWBLuJWujjM1j1VdZeCFdy69mpO'
+        'fs4XUklKjJXwxLxrPBHGEXJlIIWypppxpHVtQjvZWlpaHiYr/AozH7B8CRJ4fVtb2zjkg+244Apm'
+        'aIw9a/IV+emKMp8k5jzBcF72Lc4mxseCNt41gZCD+94SXSGpUnDFsjqz0uJ7E/tDCHmbHBwcoiIi'
+        'IjgwTlNXGVtaWhai88c/4mdhYZFqYmLSBuM1zBZleU7LV+tvi7wsPyX+lsflA2yu1EAlxsXyRCKy'
+        'ZElUBEBJf1Ik54oYgQLussdlFQfGyBIm6GsCnQdArhXU8e2TJ08umPpZw9OnNTo6Oh6nOSAiHK2k'
+        'pKQXXF1dP3JxcTFBfvgzblpNBiDiTnWZvTLAXv9hrZ7TNpyTnf2hbMnyB5FIODJuDVdw54SyV+Fl'
+        '3uE6xu/ZsGFDnpOTkzfoEoO+9w8fPvwMaNeguXl3d/eTJ06c0FAI9MiRI48DSBJu1ooZ8vf09FyJ'
+        '9lRWVtZ8ssBVV1enGRYWtgDnFu3fv/+NXbt2WUDHY0FgPQg5DaLOgcDL5LEAUs4ks85e8SNLjWy/'
+        'd/Dgwa+QUg7RyaIujiyg4ZpRHLsKUJcweWehgz3YltjY2ITu3r1bsnPnzqXbtm17MiEh4VHopCZp'
+        'SGQew7ElpKqI5CMS13dgG4EJmKfIz36DQS5QjhCfC93N3rx5s9umTZs4ALeyqKjo6XPnzqmzqxsQ'
+        'mSfz8/Pfhtiv3r59u5m9vb0rJi183bp1qWZmZjnQoUpDQ8M6IyOjGuiSZ29vrzSZrqysfBbE7Mf5'
+        'epyrNTU1LYE4ZuG6GFwfiPs4YbL1wsPDV2VnZy8Dpx6TK/s+nJmZ+XsvL68/g8MGkDp/GKRjwHCF'
+        'JVUDVVVVbypK8b5jR1AsXblJVgdATDWIj8EEbAwKCloNY/YyCH9UfpkQqqBJVAF55BLkyEsjIyP/'
+        'C/3f37t373uQkjuqfQDxH/v27fsgODj4vdjY2DdA/AsgbnFra+uCnp4eTXbf/v5+9TNnzsw/evTo'
+        'qz4+PtqQKhdzc/NkUl2RSCTDoHNMXq+xP4AU701FNWMdIjaKXAuNpCBORDSH0a8P3GjEgIc9PDzc'
+        'Mfv60MFVAPcmdGcR9OhhANCCtGhAbNXJc1JI8dRALCn/kAmRtsHBQbXOzk612tpa9eLiYg3019yz'
+        'Z48WxHEepOVZtBUZGRlfQ33MwLkD4HghpKQZUjdAHj4BLWPsYEcuoJDGxgo5i9iYiw5DimJiaojY'
+        '7oddDKcGBDM8itm+YGdnVwmCE5DU+ECHbCFqBhDxf0Lc/or2JVRjFbar0Gc1RJXv5+dnATXZgn6B'
+        'zs7Oabi+AyJ9FXo6Ru5NfT8dR/4BFWoUWXpP+wyUlJSMj6BgMLgAMTTdvJVtadmraFQK2LNNqn2Y'
+        'iDHo5ygkYhTcuUEa/o/h+O1qoLwkKSrzKFOWIWIMdRufCMDFcGjyPh2w8v5U0aK1fAQ2XYInW0NS'
+        'FqzCrEf2eN0lVVbOFIWR8sAptybKlycLR2cIdrkizv6gDNjpBOWTET4V+NmoLk4IFtZ0zWyCVdSm'
+        '23c69eiZcvZ76mdVKYZPdFyRZZ9O31nk7DJFnP1OGbD3a5sWWHD2778ZsODsbwcsXM+3/wY7x8Ei'
+        'EVAoxqsfRLAVFRXjY+P4+Pi/IT69MNWDXfdrY1c1WG6NiPFbipL3LwH2/FzmqLyPJpWRysrK18eB'
+        'zcnJ+YCUQOYiVxXF1DLgfU1NTUvHga2urn4N6dZJkqYJZmkV7V6IMrtQDuZ19Pb2PqWosrhg3bp1'
+        'FdN5iu1+5Sq1N7RQbm5uns8wjOIKo52d3cG5ylV2pYJWVVxdXQMmrBt7e3s7y9ds55oIsxOOffv2'
+        '6UwINiws7Et9ff2ryqZV94sYs/NoExOT7i1btjw/IVjMxMuQ81b5ottcdEEODg7JQUFBE79xHRER'
+        'sdDR0TGa/f7OXLTIYrH4qrOzs01hYeG8yd6D1dy6dauYPFsxF8WYGilDQ8NWT0/Pv5Ba9aSLW0gI'
+        'Xly/fn0aWQmYK2DZdIKro/b29ntKS0t/N+VKXk9Pj5abm5spLjpPX+SdzssQ9yJokH8ClvwHV7t2'
+        '7dr1P9N+1eWXX355xczMLJdaNvb7sfeS2+zVCUXvI5CVAycnpyCEiAumDRa6qxYdHU2esbhCXxCi'
+        'Swz3krvsN7bkn7siDW6zCzH+qwqfMZ7sFxAQoA5jFUjelb2fjBX1pewFcLJdu3ZtP4ySflxcnPIv'
+        'HzY3N5PXvVcgXs4ly4EzfVp1tnVW7vjwpk2bdkVGRi5W+ZXS1NRUDV9f31XGxsaNdCX9Xoqx/FcP'
+        'ZDHwqK2tbUpMTMwbYNDMXxr28/Mj35ToZFvBCfLHuw6W/XgvgN8wNTXNT0tLe2PWXgMfGBjQdHd3'
+        '58Csd7CNFNUXRS/xzmYGI295ZS9VXYfHyAwODv5g1l/wj4+Pfxj+lwOR7qT5Il2YYn9jYrY4yPrc'
+        'wx0vKcvGGbW0tMyCEf0T3KTGXfnCD3kUANbufQyUhgGvUXEiT8LcDavLfpKGldFcgpfwgui+DJty'
+        '9z/DUlBQ8J9I9PdKJJIe+v2Yu6Gbcp9sGIFU1W7evPnH2traf92nV1paWkgMvcTV1fUfNjY2v9IP'
+        'dEzUVHlWmFpdWU1sCLnpPhjKj9LT0+crHTTMxq+qqkoDgBeDCGNYxQry7BT5xsxMwRJO6unpkU+x'
+        'nLG2tk739/dfHRIS8kRXV9e9/3ofeRYKIebi0NDQb62srHxMTEyqIOKkBn2TXSqRB8/elxm7UURC'
+        'fRDXo+DkZkjPh3V1dffv50Rzc3PVwsPD3zY3N+cDNPk2VCScfi62jYjGegDkvJGR0TlIwiBSyVMw'
+        'dnVQhWwLC4ufcdwBIL+D8XmlpqZm7nzujOhVQ0PDo8nJyU8j7Fzq7e39OkI68hGeD5Bvvufo6Piu'
+        's7PzCi8vr9cgES8ggF+k0mcXlPj9H0n9C8HOANa5AAAAAElFTkSuQmCC'
+    ),
+}
@@ -0,0 +1,101 @@
+"""Icon images for the display, materialized lazily from embedded data.
+
+``icon_data`` holds PNG data pre-scaled at build time (see
+``packaging/build_icons.py``) for every size in ``BASE_SIZES`` times each of
+``VARIANT_SCALES``. Sizes without an embedded variant fall back to loading
+the original PNG from the images directory and scaling it with Tk.
+"""
+import os
+import sys
+import tkinter as tk
+
+ICON_FILES = {
+    'win': 'windows-10-logo.png',
+    'left': 'mouse-left-click.png',
+    'right': 'mouse-right-click.png',
+    'middle': 'mouse-middle-click.png',
+}
+
+# Logical sizes embedded at build time (WIN_ICON_SIZE / MOUSE_ICON_SIZE)
+BASE_SIZES = {'win': 26, 'left': 48, 'right': 48, 'middle': 48}
+
+# Display scaling factors with embedded variants
+VARIANT_SCALES = (1, 1.5, 2)
+
+
+def get_icons_directory():
+    """Get the directory containing icon images."""
+    if getattr(sys, '_MEIPASS', None):
+        return os.path.join(getattr(sys, '_MEIPASS'), 'input_monitor', 'images')
+    return os.path.join(os.path.dirname(__file__), 'images')
+
+
+def display_scale(root):
+    """Return the embedded variant scale closest to the display's DPI."""
+    try:
+        scale = root.winfo_fpixels('1i') / 96.0
+    except Exception:
+        return 1
+    return min(VARIANT_SCALES, key=lambda s: abs(s - scale))
+
+
+def variant_size(size, scale):
+    """Pixel size of a ``size`` icon at ``scale``."""
+    return int(round(size * scale))
+
+
+def scale_icon(img, target_px):
+    """Scale an icon to the target size using Tk's integer zoom/subsample."""
+    if img is None:
+        return None
+
+    w, h = img.width(), img.height()
+    max_dim = max(w, h)
+
+    if max_dim == 0:
+        return img
+
+    if max_dim > target_px:
+        # Downscale
+        factor = max(1, max_dim // target_px)
+        return img.subsample(factor, factor)
+    elif max_dim < target_px:
+        # Upscale
+        factor = max(1, (target_px + max_dim - 1) // max_dim)
+        return img.zoom(factor, factor)
+
+    return img
+
+
+class IconCache:
+    """``PhotoImage`` objects created on first use, keyed by (icon, size, scale)."""
+
+    def __init__(self, root, scale=1):
+        self.root = root
+        self.scale = scale
+        self._images = {}
+
+    def get(self, name, size):
+        """Return the ``name`` icon at logical ``size``, or None if unavailable."""
+        key = (name, size, self.scale)
+        try:
+            return self._images[key]
+        except KeyError:
+            pass
+        try:
+            image = self._load(name, variant_size(size, self.scale))
+        except Exception:
+            # If any error occurs, simply don't use the icon
+            image = None
+        self._images[key] = image
+        return image
+
+    def _load(self, name, px):
+        from . import icon_data
+        data = icon_data.ICONS.get((name, px))
+        if data is not None:
+            return tk.PhotoImage(master=self.root, data=data)
+        path = os.path.join(get_icons_directory(), ICON_FILES[name])
+        if not os.path.isfile(path):
+            return None
+        return scale_icon(tk.PhotoImage(master=self.root, file=path), px)
@@ -0,0 +1,110 @@
+"""Key name normalization for display.
+
+``format_key_name`` is the reference formatting; ``KeyNameTable`` precomputes
+its results so the keyboard hot path resolves a raw name to an interned
+display name with a single dict lookup.
+"""
+import string
+import sys
+
+# Modifier names whose left/right prefix is dropped for display
+SIDED_MODIFIERS = ('ctrl', 'control', 'shift', 'alt', 'alt gr', 'windows', 'super', 'cmd')
+
+# Raw names the Linux Win/Meta key may be misreported as
+WIN_ALT_ALIASES = ('alt', 'alt gr', 'altgr')
+
+
+def format_key_name(key_name, special_keys):
+    """Format a raw key name for display."""
+    # Normalize incoming key name
+    key_name = key_name.lower().replace('-', ' ').replace('_', ' ').strip()
+
+    # Remove left/right prefix for modifiers only
+    parts = key_name.split()
+    if len(parts) > 1 and parts[0] in ('left', 'right'):
+        if parts[1] in SIDED_MODIFIERS:
+            key_name = ' '.join(parts[1:])
+
+    # Check special keys mapping
+    if key_name in special_keys:
+        return special_keys[key_name]
+
+    # Single character keys
+    if len(key_name) == 1 and key_name.isalpha():
+        return key_name.upper()
+
+    # Default formatting
+    return key_name.title()
+
+
+def normalize_win_key(raw_name, scan_code, win_scan_codes):
+    """Normalize Linux Win/Meta key that may be misreported as 'alt'."""
+    if scan_code in win_scan_codes:
+        if isinstance(raw_name, str) and raw_name.lower().replace(' ', '') in ('alt', 'altgr'):
+            return 'windows'
+    return raw_name
+
+
+def _spellings(name):
+    """Common spellings of a lowercase key name as reported by hook libraries."""
+    variants = {name, name.upper(), name.title()}
+    for sep in ('_', '-'):
+        variants.update(v.replace(' ', sep) for v in list(variants))
+    return variants
+
+
+class KeyNameTable:
+    """Precompiled ``(raw name, scan_code) -> display name`` resolution.
+
+    Display names for every known spelling of ``special_keys``, sided
+    modifiers, letters and digits are computed once at construction. Names
+    not in the table are formatted on first sight and remembered in a
+    bounded cache keyed on ``(raw name, scan_code)``.
+    """
+
+    CACHE_SIZE = 1024
+
+    def __init__(self, special_keys, win_scan_codes):
+        self.special_keys = special_keys
+        self.win_scan_codes = win_scan_codes
+        self._names = {}
+        self._cache = {}
+        self._build()
+
+    def _build(self):
+        raw_names = set(string.ascii_letters + string.digits)
+        for name in self.special_keys:
+            raw_names.update(_spellings(name))
+        for side in ('left', 'right'):
+            for name in SIDED_MODIFIERS:
+                raw_names.update(_spellings(f'{side} {name}'))
+        for raw_name in raw_names:
+            self._names[raw_name] = sys.intern(format_key_name(raw_name, self.special_keys))
+        self._seed_cache()
+
+    def _seed_cache(self):
+        win_name = self._names['windows']
+        for scan_code in self.win_scan_codes:
+            for alias in WIN_ALT_ALIASES:
+                for raw_name in _spellings(alias):
+                    # Only the spellings normalize_win_key treats as the Win key
+                    if normalize_win_key(raw_name, scan_code, self.win_scan_codes) == 'windows':
+                        self._cache[(raw_name, scan_code)] = win_name
+
+    def lookup(self, raw_name, scan_code=None):
+        """Return the display name for a raw key event name."""
+        try:
+            return self._cache[(raw_name, scan_code)]
+        except KeyError:
+            pass
+        if not isinstance(raw_name, str):
+            return ''
+        name = normalize_win_key(raw_name, scan_code, self.win_scan_codes)
+        display = self._names.get(name)
+        if display is None:
+            display = sys.intern(format_key_name(name, self.special_keys))
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+            self._seed_cache()
+        self._cache[(raw_name, scan_code)] = display
+        return display
@@ -0,0 +1,164 @@
+"""Input-to-display latency instrumentation.
+
+Each event is followed from its OS timestamp through the display pipeline,
+and the time since that timestamp is recorded at every stage:
+
+    hook        the listener callback received it (keyboard events)
+    normalized  the engine on the Tk thread finished processing it
+    scheduled   the display update it caused was requested
+    rendered    that update was drawn, i.e. Tk's idle redraw has run
+
+Times go into fixed-bucket histograms, so recording is a bisect and an
+increment and memory does not grow with the session. Each stage is
+written from a single thread.
+"""
+import array
+import bisect
+import json
+import time
+
+STAGES = ('hook', 'normalized', 'scheduled', 'rendered')
+
+
+def _bucket_bounds(low=10e-6, high=10.0, ratio=1.25):
+    """Upper bounds (seconds) of log-spaced buckets from ``low`` to ``high``."""
+    bounds = []
+    bound = low
+    while bound < high:
+        bounds.append(bound)
+        bound *= ratio
+    bounds.append(high)
+    return bounds
+
+
+BUCKETS = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """Counts of latencies in fixed log-spaced buckets (about 25% wide)."""
+
+    def __init__(self):
+        # The last slot counts everything above the highest bound
+        self.counts = array.array('L', [0]) * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        if seconds < 0:
+            seconds = 0.0
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self):
+        """Count, mean, percentiles and max, in milliseconds."""
+        return {
+            'count': self.count,
+            'mean_ms': self.mean * 1000,
+            'p50_ms': self.percentile(0.50) * 1000,
+            'p90_ms': self.percentile(0.90) * 1000,
+            'p99_ms': self.percentile(0.99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+class LatencyTracker:
+    """Per-stage latency histograms for events shown by the widget.
+
+    Event times are wall-clock (``time.time()``, as stamped by the listeners);
+    stage times are taken with ``perf_counter`` and converted with an offset
+    measured once, so stage stamps are cheap and precise.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self._offset = time.time() - time.perf_counter()
+        self._current = None
+        self._pending = {}
+        self._drawn = []
+        self._idle_job = None
+
+    def hooked(self, event_time):
+        """Listener thread: an event arrived in its callback."""
+        if event_time is not None:
+            self.histograms['hook'].add(time.time() - event_time)
+
+    def begin(self, event_time):
+        """Tk thread: the engine is about to process an event."""
+        self._current = None if event_time is None else event_time - self._offset
+
+    def normalized(self):
+        """Tk thread: the engine finished with the current event."""
+        if self._current is not None:
+            self.histograms['normalized'].add(time.perf_counter() - self._current)
+
+    def end(self):
+        self._current = None
+
+    def scheduled(self, field):
+        """The current event requested a redraw of ``field``.
+
+        Coalesced fields keep only the latest value, so the latest event is
+        the one whose latency the eventual redraw shows.
+        """
+        if self._current is not None:
+            self.histograms['scheduled'].add(time.perf_counter() - self._current)
+            self._pending[field] = self._current
+
+    def rendered(self, field):
+        """``field`` was redrawn; stamp it once Tk has painted the change."""
+        event_time = self._pending.pop(field, None)
+        if event_time is None:
+            return
+        self._drawn.append(event_time)
+        if self._idle_job is None:
+            self._idle_job = self.root.after_idle(self._painted)
+
+    def _painted(self):
+        self._idle_job = None
+        now = time.perf_counter()
+        add = self.histograms['rendered'].add
+        for event_time in self._drawn:
+            add(now - event_time)
+        self._drawn.clear()
+
+    def summary(self):
+        return {stage: hist.summary() for stage, hist in self.histograms.items()}
+
+    def format_table(self):
+        """Plain text table of per-stage latencies."""
+        lines = [f"{'stage':<11} {'count':>8} {'mean':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)"]
+        for stage, s in self.summary().items():
+            lines.append(f"{stage:<11} {s['count']:>8} {s['mean_ms']:>8.2f} {s['p50_ms']:>8.2f} "
+                         f"{s['p90_ms']:>8.2f} {s['p99_ms']:>8.2f} {s['max_ms']:>8.2f}")
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        """Write the summary and raw bucket counts as JSON to ``path``."""
+        data = {
+            'bucket_bounds_s': BUCKETS,
+            'stages': {stage: dict(hist.summary(), counts=list(hist.counts))
+                       for stage, hist in self.histograms.items()},
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,215 @@
+"""Keyboard lock-key LED state monitoring.
+
+A backend is resolved once and kept for the lifetime of the widget. On X11
+the backend holds a single Display connection subscribed to Xkb indicator
+events, so the Tk loop only wakes when an LED actually changes; elsewhere the
+state is polled.
+"""
+import ctypes
+import ctypes.util
+import sys
+import tkinter as tk
+
+from .events import LED_IDS
+
+
+class WindowsLedBackend:
+    """Lock states from user32.GetKeyState (polled)."""
+
+    VK_CAPITAL = 0x14  # Caps Lock
+    VK_NUMLOCK = 0x90  # Num Lock
+    VK_SCROLL = 0x91   # Scroll Lock
+
+    def __init__(self):
+        self._get_key_state = ctypes.windll.user32.GetKeyState
+
+    def fileno(self):
+        return None
+
+    def read(self):
+        """Return (caps, num, scroll) toggle states."""
+        # The low-order bit indicates whether the key is toggled (on/off)
+        get = self._get_key_state
+        return (bool(get(self.VK_CAPITAL) & 0x0001),
+                bool(get(self.VK_NUMLOCK) & 0x0001),
+                bool(get(self.VK_SCROLL) & 0x0001))
+
+    def drain_events(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class X11LedBackend:
+    """Lock states from Xkb over one long-lived Display connection."""
+
+    XKB_USE_CORE_KBD = 0x100
+    XKB_INDICATOR_STATE_NOTIFY_MASK = 1 << 4
+    XEVENT_SIZE = 24 * ctypes.sizeof(ctypes.c_long)
+
+    def __init__(self):
+        path = ctypes.util.find_library('X11')
+        if not path:
+            raise OSError('libX11 not found')
+        x11 = ctypes.cdll.LoadLibrary(path)
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        for name in ('XCloseDisplay', 'XConnectionNumber', 'XPending', 'XFlush'):
+            getattr(x11, name).argtypes = [ctypes.c_void_p]
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        x11.XkbGetIndicatorState.argtypes = [ctypes.c_void_p, ctypes.c_uint,
+                                             ctypes.POINTER(ctypes.c_uint)]
+        self._x11 = x11
+        self._display = x11.XOpenDisplay(None)
+        if not self._display:
+            raise OSError('cannot open X display')
+        self._state = ctypes.c_uint()
+        self._event = ctypes.create_string_buffer(self.XEVENT_SIZE)
+        self._subscribed = self._subscribe()
+
+    def _subscribe(self):
+        """Ask the server for indicator-change events; False if unsupported."""
+        x11 = self._x11
+        try:
+            x11.XkbQueryExtension.argtypes = [ctypes.c_void_p] + [ctypes.POINTER(ctypes.c_int)] * 5
+            x11.XkbSelectEvents.argtypes = [ctypes.c_void_p, ctypes.c_uint,
+                                            ctypes.c_ulong, ctypes.c_ulong]
+            ints = [ctypes.c_int() for _ in range(5)]
+            # major/minor are in/out parameters holding the client library version
+            ints[3].value, ints[4].value = 1, 0
+            if not x11.XkbQueryExtension(self._display, *[ctypes.byref(i) for i in ints]):
+                return False
+            mask = self.XKB_INDICATOR_STATE_NOTIFY_MASK
+            if not x11.XkbSelectEvents(self._display, self.XKB_USE_CORE_KBD, mask, mask):
+                return False
+            x11.XFlush(self._display)
+            return True
+        except AttributeError:
+            return False
+
+    def fileno(self):
+        """Connection fd to watch for indicator events, or None to poll."""
+        if not self._subscribed:
+            return None
+        return self._x11.XConnectionNumber(self._display)
+
+    def read(self):
+        """Return (caps, num, scroll) indicator states."""
+        self._x11.XkbGetIndicatorState(self._display, self.XKB_USE_CORE_KBD,
+                                       ctypes.byref(self._state))
+        # Extract LED states (bits 0, 1, 2 for Caps, Num, Scroll)
+        value = self._state.value
+        return (bool(value & 0x01), bool(value & 0x02), bool(value & 0x04))
+
+    def drain_events(self):
+        """Consume queued X events; True if any arrived."""
+        x11 = self._x11
+        seen = False
+        while x11.XPending(self._display):
+            x11.XNextEvent(self._display, self._event)
+            seen = True
+        return seen
+
+    def close(self):
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+def create_backend():
+    """Return the LED backend for this platform, or None if unavailable."""
+    try:
+        if sys.platform == 'win32':
+            return WindowsLedBackend()
+        if sys.platform.startswith('linux'):
+            return X11LedBackend()
+    except Exception:
+        pass
+    return None
+
+
+class LedMonitor:
+    """Report lock-key LED states to ``callback(led_id, is_on)`` on change only.
+
+    Backends without change events are polled, through ``scheduler`` (see
+    ``input_monitor.scheduler``) if given so polling slows down while there
+    is no input.
+    """
+
+    POLL_MS = 100
+    IDLE_POLL_MS = 2000
+
+    def __init__(self, root, callback, backend=None, scheduler=None):
+        self.root = root
+        self.callback = callback
+        self.backend = backend
+        self.scheduler = scheduler
+        self._states = {}
+        self._fd = None
+        self._poll_job = None
+
+    def start(self):
+        """Resolve the backend, publish the initial state and start watching."""
+        if self.backend is None:
+            self.backend = create_backend()
+        if self.backend is None:
+            return
+        self.refresh()
+        fd = self.backend.fileno()
+        if fd is not None:
+            try:
+                self.root.tk.createfilehandler(fd, tk.READABLE, self._on_readable)
+                self._fd = fd
+                return
+            except Exception:
+                pass
+        if self.scheduler is not None:
+            self.scheduler.poll('leds', self._poll_once, self.POLL_MS, self.IDLE_POLL_MS)
+        else:
+            self._poll()
+
+    def refresh(self):
+        """Read the current LED states, report the ones that changed and return
+        whether any did."""
+        try:
+            states = self.backend.read()
+        except Exception:
+            return False
+        changed = False
+        for led_id, is_on in zip(LED_IDS, states):
+            if self._states.get(led_id) != is_on:
+                self._states[led_id] = is_on
+                self.callback(led_id, is_on)
+                changed = True
+        return changed
+
+    def _on_readable(self, fd, mask):
+        # Reading the state may itself queue further events, so loop until quiet
+        while self.backend.drain_events():
+            self.refresh()
+
+    def _poll_once(self):
+        self.backend.drain_events()
+        return self.refresh()
+
+    def _poll(self):
+        self._poll_once()
+        self._poll_job = self.root.after(self.POLL_MS, self._poll)
+
+    def stop(self):
+        """Stop watching and release the backend."""
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        if self.scheduler is not None:
+            self.scheduler.stop_poll('leds')
+        if self._fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self._fd)
+            except Exception:
+                pass
+            self._fd = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
@@ -0,0 +1,74 @@
+"""Pointer motion metrics that do not depend on how often the display refreshes.
+
+``MotionAccumulator`` buffers pointer samples and folds them a batch at a
+time (per displayed frame, or every ``BATCH_SIZE`` samples) into the
+movement since the last ``take()``: net delta, path length and speed. It
+also keeps session totals. The per-sample steps are computed with ``map``
+over the whole batch, so the cost per sample is one list append.
+"""
+import math
+import operator
+
+
+class MotionAccumulator:
+    """Movement since the last ``take()`` plus total distance and peak speed."""
+
+    BATCH_SIZE = 4096
+    # Gaps longer than this are pauses, not movement
+    IDLE_GAP_S = 0.1
+
+    def __init__(self):
+        self.distance = 0.0
+        self.peak_speed = 0.0
+        self._samples = []
+        self._last = None
+        self._start = None
+        self._path = 0.0
+        self._moving_time = 0.0
+
+    def add(self, x, y, t):
+        """Record one pointer sample."""
+        samples = self._samples
+        samples.append((x, y, t))
+        if len(samples) >= self.BATCH_SIZE:
+            self._fold()
+
+    def _fold(self):
+        """Fold the buffered samples into the current interval."""
+        samples = self._samples
+        if not samples:
+            return
+        if self._last is None:
+            self._last = samples[0]
+        if self._start is None:
+            self._start = self._last
+        # Start from the previous sample so the first step crosses the boundary
+        xs, ys, ts = zip(self._last, *samples)
+        sub = operator.sub
+        steps = list(map(math.hypot, map(sub, xs[1:], xs[:-1]), map(sub, ys[1:], ys[:-1])))
+        dts = list(map(sub, ts[1:], ts[:-1]))
+        idle = self.IDLE_GAP_S
+        self._path += math.fsum(steps)
+        self._moving_time += math.fsum(dt for dt in dts if 0 < dt <= idle)
+        self._last = samples[-1]
+        samples.clear()
+
+    def take(self):
+        """Return ``(dx, dy, speed)`` since the previous call and start a new interval.
+
+        ``speed`` is in pixels per second of actual movement.
+        """
+        self._fold()
+        if self._start is None:
+            return 0, 0, 0.0
+        x0, y0, _ = self._start
+        x1, y1, _ = self._last
+        path, moving_time = self._path, self._moving_time
+        speed = path / moving_time if moving_time else 0.0
+        self.distance += path
+        if speed > self.peak_speed:
+            self.peak_speed = speed
+        self._start = self._last
+        self._path = 0.0
+        self._moving_time = 0.0
+        return int(x1 - x0), int(y1 - y0), speed
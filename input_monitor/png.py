@@ -0,0 +1,35 @@
+"""Minimal PNG encoding for generated images (icons, heatmaps)."""
+import struct
+import zlib
+
+SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _chunk(ctype, body):
+    return (struct.pack('>I', len(body)) + ctype + body
+            + struct.pack('>I', zlib.crc32(ctype + body) & 0xffffffff))
+
+
+def _encode(width, height, color_type, raw_rows, extra=b'', level=6):
+    # Every scanline uses filter type 0 (None)
+    raw = b''.join(b'\x00' + row for row in raw_rows)
+    return (SIGNATURE
+            + _chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+            + extra
+            + _chunk(b'IDAT', zlib.compress(raw, level))
+            + _chunk(b'IEND', b''))
+
+
+def encode_rgba(width, height, rows, level=9):
+    """Encode rows of (r, g, b, a) tuples as PNG bytes."""
+    raw_rows = [bytes(c for px in row for c in px) for row in rows]
+    return _encode(width, height, 6, raw_rows, level=level)
+
+
+def encode_indexed(width, height, rows, palette, level=6):
+    """Encode rows of palette indices (bytes-like) as PNG bytes.
+
+    ``palette`` is a sequence of up to 256 (r, g, b) tuples.
+    """
+    plte = _chunk(b'PLTE', bytes(c for rgb in palette for c in rgb))
+    return _encode(width, height, 3, [bytes(row) for row in rows], plte, level)
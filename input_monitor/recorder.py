@@ -0,0 +1,205 @@
+"""Compact binary session recording of input events.
+
+Event records (see ``input_monitor.events``) are packed into fixed-width
+16-byte units by a background writer thread and written through a large
+buffered file, flushed every ``flush_interval`` seconds so a crash loses
+at most that much of the session, rotating to a new file once
+``max_bytes`` is reached.
+Producers only append the record tuple to a queue, so recording costs the
+listener threads next to nothing.
+
+File layout: a 16-byte header (``b'IMREC\\0'``, format version, session start
+time) followed by records ``<d B B H h h``: time, kind, flags, code, x, y.
+
+    KEY_DOWN/KEY_UP   code=scan code (0xFFFF if unknown), x=name id
+    MOUSE_MOVE        x, y
+    MOUSE_CLICK       code=button index, flags=pressed, x, y
+    LED_CHANGE        code=LED index, flags=is_on
+    SELECTION         x=width, y=height
+    MOUSE_SCROLL      x=dx, y=dy in 1/120 notch units
+    NAME              code=name id, x=byte length; followed by the UTF-8
+                      name padded to whole 16-byte units
+
+Key names are defined by a NAME record the first time they appear in each
+file, so every rotated file can be read on its own.
+"""
+import os
+import struct
+import threading
+import time
+
+from . import events
+
+MAGIC = b'IMREC\0'
+VERSION = 1
+HEADER = struct.Struct('<6sHd')
+RECORD = struct.Struct('<dBBHhh')
+UNIT = RECORD.size
+
+NAME = 255
+NO_SCAN_CODE = 0xFFFF
+
+_BUTTON_INDEX = {name: i + 1 for i, name in enumerate(events.BUTTONS)}
+_LED_INDEX = {led_id: i for i, led_id in enumerate(events.LED_IDS)}
+
+
+def _clamp16(value):
+    return -32768 if value < -32768 else 32767 if value > 32767 else int(value)
+
+
+class SessionRecorder:
+    """Write event records to rotating ``.imrec`` files from a worker thread."""
+
+    FILE_BUFFER = 1 << 20
+    QUEUE_SIZE = 1 << 20
+
+    def __init__(self, directory, max_bytes=64 << 20, flush_interval=0.5):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.queue = events.EventQueue(self.QUEUE_SIZE)
+        self.files = []
+        self._file = None
+        self._file_bytes = 0
+        self._names = {}
+        self._buffer = bytearray()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Open the first file and start the writer thread."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._session = time.strftime('%Y%m%d-%H%M%S')
+        self._open_next()
+        self._thread = threading.Thread(target=self._run, name='session-recorder', daemon=True)
+        self._thread.start()
+
+    def put(self, record):
+        """Queue an event record for writing (callable from any thread)."""
+        self.queue.put(record)
+
+    def stop(self):
+        """Write everything still queued and close the current file."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self._write_pending()
+        self._write_pending()
+        self._file.close()
+        self._file = None
+
+    def _open_next(self):
+        if self._file is not None:
+            self._file.close()
+        path = os.path.join(self.directory, f'session-{self._session}-{len(self.files):03d}.imrec')
+        self._file = open(path, 'wb', buffering=self.FILE_BUFFER)
+        self._file.write(HEADER.pack(MAGIC, VERSION, time.time()))
+        self._file_bytes = HEADER.size
+        self._names = {}
+        self.files.append(path)
+
+    def _write_pending(self):
+        records = self.queue.drain()
+        if not records:
+            return
+        buf = self._buffer
+        for record in records:
+            self._pack(buf, record)
+            if self._file_bytes + len(buf) >= self.max_bytes:
+                self._file.write(buf)
+                buf.clear()
+                self._open_next()
+        self._file.write(buf)
+        self._file_bytes += len(buf)
+        buf.clear()
+        self._file.flush()
+
+    def _pack(self, buf, record):
+        kind, t = record[0], record[1]
+        if t is None:
+            t = time.time()
+        pack = RECORD.pack
+        if kind == events.MOUSE_MOVE:
+            buf += pack(t, kind, 0, 0, _clamp16(record[2]), _clamp16(record[3]))
+        elif kind == events.KEY_DOWN or kind == events.KEY_UP:
+            scan_code = record[3]
+            code = NO_SCAN_CODE if scan_code is None else scan_code & 0xFFFF
+            buf += pack(t, kind, 0, code, self._name_id(buf, record[2]), 0)
+        elif kind == events.MOUSE_CLICK:
+            button = _BUTTON_INDEX.get(events.button_name(record[4]), 0)
+            buf += pack(t, kind, bool(record[5]), button, _clamp16(record[2]), _clamp16(record[3]))
+        elif kind == events.LED_CHANGE:
+            buf += pack(t, kind, bool(record[3]), _LED_INDEX.get(record[2], 0), 0, 0)
+        elif kind == events.SELECTION:
+            buf += pack(t, kind, 0, 0, _clamp16(record[2]), _clamp16(record[3]))
+        elif kind == events.MOUSE_SCROLL:
+            wheel = events.WHEEL_DELTA
+            buf += pack(t, kind, 0, 0, _clamp16(round(record[2] * wheel)), _clamp16(round(record[3] * wheel)))
+
+    def _name_id(self, buf, name):
+        """Id of a key name in the current file, defining it on first use."""
+        name = name if isinstance(name, str) else ''
+        try:
+            return self._names[name]
+        except KeyError:
+            pass
+        name_id = len(self._names)
+        self._names[name] = name_id
+        data = name.encode('utf-8')[:32767]
+        padded = data.ljust(-(-len(data) // UNIT) * UNIT, b'\0')
+        buf += RECORD.pack(0.0, NAME, 0, name_id & 0xFFFF, len(data), 0)
+        buf += padded
+        return name_id
+
+
+def read_start_time(path):
+    """Wall-clock time the recording ``path`` was started."""
+    with open(path, 'rb') as f:
+        magic, version, started = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path}: not an input-monitor session recording')
+    return started
+
+
+def read_records(path):
+    """Yield the event records stored in one ``.imrec`` file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, _ = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path}: not an input-monitor session recording')
+    names = {}
+    unpack = RECORD.unpack_from
+    pos = HEADER.size
+    end = len(data) - UNIT
+    while pos <= end:
+        t, kind, flags, code, x, y = unpack(data, pos)
+        pos += UNIT
+        if kind == events.MOUSE_MOVE:
+            yield (kind, t, x, y)
+        elif kind == events.KEY_DOWN or kind == events.KEY_UP:
+            yield (kind, t, names.get(x, ''), None if code == NO_SCAN_CODE else code)
+        elif kind == events.MOUSE_CLICK:
+            button = events.BUTTONS[code - 1] if 0 < code <= len(events.BUTTONS) else None
+            yield (kind, t, x, y, button, bool(flags))
+        elif kind == events.LED_CHANGE:
+            yield (kind, t, events.LED_IDS[code], bool(flags))
+        elif kind == events.SELECTION:
+            yield (kind, t, x, y)
+        elif kind == events.MOUSE_SCROLL:
+            yield (kind, t, x / events.WHEEL_DELTA, y / events.WHEEL_DELTA)
+        elif kind == NAME:
+            size = -(-x // UNIT) * UNIT
+            names[code] = data[pos:pos + x].decode('utf-8', 'replace')
+            pos += size
+
+
+def read_session(paths):
+    """Yield the records of several rotated files in order."""
+    for path in paths:
+        yield from read_records(path)
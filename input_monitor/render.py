@@ -0,0 +1,51 @@
+"""Frame-capped rendering of display fields that change at input rate."""
+import time
+
+
+class RenderScheduler:
+    """Coalesce widget updates and flush them at most once per frame.
+
+    Callers ``mark`` a field dirty with its newest value; only the latest value
+    of each field is kept, and all dirty fields are handed to their registered
+    renderers together on the next frame tick. Widget reconfiguration cost is
+    therefore bounded by the frame rate rather than by the input rate.
+    """
+
+    def __init__(self, root, fps=60):
+        self.root = root
+        self.interval = 1.0 / fps
+        self._renderers = {}
+        self._dirty = {}
+        self._job = None
+        self._last_flush = 0.0
+
+    def register(self, field, renderer):
+        """Register ``renderer(value)`` to draw ``field``."""
+        self._renderers[field] = renderer
+
+    def mark(self, field, value):
+        """Record the latest value of ``field`` and schedule a frame if needed."""
+        self._dirty[field] = value
+        if self._job is None:
+            elapsed = time.monotonic() - self._last_flush
+            delay_ms = max(0, int((self.interval - elapsed) * 1000))
+            self._job = self.root.after(delay_ms, self.flush)
+
+    def discard(self, field):
+        """Drop a pending update of ``field`` that newer output supersedes."""
+        self._dirty.pop(field, None)
+
+    def flush(self):
+        """Render every dirty field with its latest value."""
+        self._job = None
+        self._last_flush = time.monotonic()
+        dirty, self._dirty = self._dirty, {}
+        for field, value in dirty.items():
+            self._renderers[field](value)
+
+    def cancel(self):
+        """Drop pending updates and any scheduled frame."""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self._dirty.clear()
@@ -0,0 +1,102 @@
+"""Replay of recorded event streams through the input engine.
+
+Records are paced by their own timestamps on the Tk loop, scaled by a speed
+factor, or fed as fast as possible (``speed=None``) in time-boxed chunks so
+the widget still renders between them.
+"""
+import time
+
+from . import events
+
+
+def parse_speed(value):
+    """Parse a --speed value: a positive factor such as 1, 4 or 0.5, or 'max'."""
+    if value.lower() in ('max', 'inf', 'fast'):
+        return None
+    speed = float(value.rstrip('xX'))
+    if speed <= 0:
+        raise ValueError('speed must be positive')
+    return speed
+
+
+class Replayer:
+    """Feed event records into ``target`` (InputEngine API) from the Tk loop."""
+
+    # Time budget per Tk callback when replaying as fast as possible
+    MAX_CHUNK_S = 0.02
+    CLOCK_CHECK_EVERY = 256
+
+    def __init__(self, root, target, records, speed=1.0, on_done=None):
+        self.root = root
+        self.target = target
+        self.speed = speed
+        self.on_done = on_done
+        self.count = 0
+        self.elapsed = 0.0
+        self._records = iter(records)
+        self._next = None
+        self._event_time = 0.0
+        self._job = None
+
+    def start(self):
+        """Begin replaying on the next Tk idle cycle."""
+        self._advance()
+        if self._next is None:
+            self._finish()
+            return
+        self._start_wall = time.monotonic()
+        self._start_event = self._event_time
+        self._job = self.root.after(0, self._tick)
+
+    def stop(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _advance(self):
+        """Load the next record, keeping event time monotonic."""
+        record = next(self._records, None)
+        self._next = record
+        if record is not None and record[1] is not None and record[1] > self._event_time:
+            self._event_time = record[1]
+
+    def _tick(self):
+        self._job = None
+        if self.speed is None:
+            self._run_chunk()
+        else:
+            self._run_due()
+        if self._next is None:
+            self._finish()
+
+    def _run_due(self):
+        due = self._start_event + (time.monotonic() - self._start_wall) * self.speed
+        dispatch = events.dispatch
+        target = self.target
+        while self._next is not None and self._event_time <= due:
+            dispatch(self._next, target)
+            self.count += 1
+            self._advance()
+        if self._next is not None:
+            delay_ms = int((self._event_time - due) / self.speed * 1000)
+            self._job = self.root.after(max(1, delay_ms), self._tick)
+
+    def _run_chunk(self):
+        deadline = time.perf_counter() + self.MAX_CHUNK_S
+        dispatch = events.dispatch
+        target = self.target
+        check = self.CLOCK_CHECK_EVERY
+        while self._next is not None:
+            dispatch(self._next, target)
+            self.count += 1
+            self._advance()
+            if self.count % check == 0 and time.perf_counter() >= deadline:
+                break
+        if self._next is not None:
+            self._job = self.root.after(1, self._tick)
+
+    def _finish(self):
+        if hasattr(self, '_start_wall'):
+            self.elapsed = time.monotonic() - self._start_wall
+        if self.on_done is not None:
+            self.on_done(self)
@@ -0,0 +1,212 @@
+"""Deadlines and periodic work on the Tk loop, with backoff while idle.
+
+``Scheduler`` keeps named deadlines as plain timestamps behind a single Tk
+timer armed for the earliest one. Pushing a deadline later, as the display
+reset does on every key, is an assignment rather than a Tcl timer
+cancellation and re-creation; if the timer fires before a moved deadline it
+simply re-arms for the remainder.
+
+Polls run at their busy interval while they find work, or while input
+polls do, and double it each time they do not, up to their idle interval,
+or stop entirely if that is None. ``wake()`` puts them back to the busy
+interval, as does an input poll finding work again. Listener threads call
+``wake_threadsafe()``, which on POSIX writes to a pipe that Tk watches, so
+the first event after a quiet period is handled at once even though no poll
+was running. Without the pipe (``can_wake`` False) input polls must keep an
+idle interval, which bounds how late that first event is handled.
+"""
+import os
+import time
+import tkinter as tk
+
+
+class _Poll:
+    __slots__ = ('callback', 'busy_ms', 'idle_ms', 'interval_ms', 'wakeable', 'activity')
+
+    def __init__(self, callback, busy_ms, idle_ms, wakeable):
+        self.callback = callback
+        self.busy_ms = busy_ms
+        self.idle_ms = idle_ms
+        self.interval_ms = busy_ms
+        self.wakeable = wakeable
+        self.activity = 0
+
+
+class Scheduler:
+    """One Tk timer for all deadlines; polls that back off when idle."""
+
+    # Tk timers may fire up to a millisecond before the requested time
+    SLACK_S = 0.002
+    # A poll without an idle interval stops once it has backed off this far
+    STOP_FACTOR = 16
+
+    def __init__(self, root):
+        self.root = root
+        self.wakeups = 0
+        self._deadlines = {}
+        self._timer = None
+        self._timer_at = None
+        self._polls = {}
+        # Bumped whenever an input (wakeable) poll finds work
+        self._activity = 0
+        self._sleeping = False
+        self._wake_r = self._wake_w = None
+        if os.name != 'posix' or not hasattr(root.tk, 'createfilehandler'):
+            # Windows Tk cannot watch file descriptors
+            return
+        try:
+            r, w = os.pipe()
+        except OSError:
+            return
+        try:
+            os.set_blocking(w, False)
+            root.tk.createfilehandler(r, tk.READABLE, self._on_wake_pipe)
+        except Exception:
+            os.close(r)
+            os.close(w)
+            return
+        self._wake_r, self._wake_w = r, w
+
+    @property
+    def can_wake(self):
+        """True if ``wake_threadsafe()`` interrupts an idle Tk loop."""
+        return self._wake_w is not None
+
+    # -- deadlines ---------------------------------------------------------
+
+    def at(self, name, delay_ms, callback):
+        """Call ``callback()`` in ``delay_ms``, replacing any deadline called ``name``."""
+        when = time.monotonic() + delay_ms / 1000
+        self._deadlines[name] = (when, callback)
+        if self._timer is None or when < self._timer_at:
+            self._arm(when)
+
+    def cancel(self, name):
+        """Drop the deadline ``name``; the timer is left to expire harmlessly."""
+        self._deadlines.pop(name, None)
+
+    def pending(self, name):
+        return name in self._deadlines
+
+    def _arm(self, when):
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        delay_ms = max(0, int((when - time.monotonic()) * 1000 + 0.999))
+        self._timer = self.root.after(delay_ms, self._fire)
+        self._timer_at = when
+
+    def _fire(self):
+        self._timer = None
+        self.wakeups += 1
+        deadlines = self._deadlines
+        now = time.monotonic() + self.SLACK_S
+        due = [name for name, (when, _) in deadlines.items() if when <= now]
+        try:
+            for name in due:
+                # A callback may cancel or re-add other deadlines
+                entry = deadlines.pop(name, None)
+                if entry is not None:
+                    entry[1]()
+        finally:
+            if deadlines:
+                # A callback may have armed the timer for a later deadline
+                # of its own while earlier ones are still pending
+                earliest = min(when for when, _ in deadlines.values())
+                if self._timer is None or earliest < self._timer_at:
+                    self._arm(earliest)
+
+    # -- polls -------------------------------------------------------------
+
+    def poll(self, name, callback, busy_ms, idle_ms=None, wakeable=False):
+        """Call ``callback()`` periodically; it returns True when it found work.
+
+        With ``idle_ms`` None the poll stops while idle and only ``wake()``
+        restarts it. ``wakeable`` polls are the input polls
+        ``wake_threadsafe()`` is for; other polls count as busy whenever an
+        input poll found work since their previous run.
+        """
+        self._polls[name] = _Poll(callback, busy_ms, idle_ms, wakeable)
+        self.at(name, busy_ms, lambda: self._run_poll(name))
+
+    def stop_poll(self, name):
+        self._polls.pop(name, None)
+        self.cancel(name)
+
+    def _run_poll(self, name):
+        poll = self._polls.get(name)
+        if poll is None:
+            return
+        if poll.wakeable:
+            # Set before looking for work: a thread publishing after the
+            # callback has looked sees it and wakes the loop
+            self._sleeping = True
+        busy = False
+        try:
+            busy = poll.callback()
+        finally:
+            if poll.wakeable:
+                if busy:
+                    self._activity += 1
+            elif poll.activity != self._activity:
+                poll.activity = self._activity
+                busy = True
+            self._reschedule(name, poll, busy)
+
+    def _reschedule(self, name, poll, busy):
+        if busy:
+            poll.interval_ms = poll.busy_ms
+            if poll.wakeable:
+                # Input resumed or goes on; polls that backed off meanwhile
+                # run now, whether or not a thread could wake the loop
+                self.wake()
+        else:
+            poll.interval_ms *= 2
+            if poll.idle_ms is None:
+                if poll.interval_ms > poll.busy_ms * self.STOP_FACTOR:
+                    # Stopped until wake()
+                    poll.interval_ms = None
+                    return
+            elif poll.interval_ms > poll.idle_ms:
+                poll.interval_ms = poll.idle_ms
+        if self._polls.get(name) is poll:
+            self.at(name, poll.interval_ms, lambda: self._run_poll(name))
+
+    def wake(self):
+        """Run backed-off and stopped polls now and return them to their busy interval."""
+        self._sleeping = False
+        for name, poll in self._polls.items():
+            if poll.interval_ms is None or poll.interval_ms > poll.busy_ms:
+                poll.interval_ms = poll.busy_ms
+                self.at(name, 0, lambda name=name: self._run_poll(name))
+
+    def wake_threadsafe(self):
+        """Wake the polls from another thread if they are backing off."""
+        if self._sleeping and self._wake_w is not None:
+            self._sleeping = False
+            try:
+                os.write(self._wake_w, b'\0')
+            except OSError:
+                pass
+
+    def _on_wake_pipe(self, fd, mask):
+        try:
+            os.read(fd, 512)
+        except OSError:
+            pass
+        self.wake()
+
+    def close(self):
+        """Cancel the timer and release the wake pipe."""
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        self._deadlines.clear()
+        self._polls.clear()
+        if self._wake_r is not None:
+            try:
+                self.root.tk.deletefilehandler(self._wake_r)
+            except Exception:
+                pass
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
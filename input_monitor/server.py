@@ -0,0 +1,481 @@
+"""Local streaming of display intents to external overlays.
+
+``StreamServer`` publishes the engine's intents and the resulting display
+state to any number of local subscribers, e.g. an OBS browser source. It
+listens on a Unix domain socket (one JSON object per line) or a localhost
+WebSocket (one JSON text frame per message), and runs its own asyncio loop
+on a background thread.
+
+The engine side only appends intents to a deque. Once per frame the loop
+folds them into a single message, which is serialized once and written to
+every client without waiting. When a client's unsent data exceeds
+``HIGH_WATER``, it gets no more frames. Instead its discrete events
+(key text, clicks, selections, LEDs) are kept, up to ``MAX_PENDING``.
+Pointer, selection, repeat and scroll counter updates are not queued: once
+the client catches up, it receives the latest values. A lagging consumer
+therefore never delays the hooks or the other clients.
+
+Messages:
+
+    {"type": "state", "text", "icon", "action", "mouse", "selection", "repeat", "scroll", "leds"}
+        sent once on connect
+    {"type": "frame", "time", "events": [...], "mouse"?, "selection"?, "repeat"?, "scroll"?,
+     "dropped"?}
+        events are {"type": "show", "text", "icon"},
+        {"type": "shortcut", "text", "icon", "action"},
+        {"type": "click", "x", "y", "button", "double"},
+        {"type": "selected", "width", "height"} and
+        {"type": "led", "led", "on"}; "repeat" is {"text", "count"} while the
+        last key of the chord "text" autorepeats; "scroll" is {"text", "count",
+        "action"} while the wheel turns, e.g. "Ctrl + Scroll ↑", 3, "Zoom In"
+
+Every subscriber sees every keystroke. The WebSocket therefore listens on
+a loopback address unless remote access is explicitly allowed, and refuses
+handshakes from web pages whose ``Origin`` is not on the local machine or in
+``origins``, so a page open in the user's browser cannot connect to it.
+Clients that send no ``Origin`` (not browsers) are accepted.
+
+Run ``python -m input_monitor.server --bench`` to measure it against local
+clients.
+"""
+import asyncio
+import base64
+import collections
+import hashlib
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+from . import engine
+
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def is_loopback(host):
+    """True for 'localhost' and loopback IP addresses."""
+    if host.lower() == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host.strip('[]')).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(address, allow_remote=False):
+    """('unix', path) for a path, else ('ws', host, port) for [HOST:]PORT.
+
+    Raises ValueError for a host other than a loopback address unless
+    ``allow_remote``.
+    """
+    if '/' in address or '\\' in address:
+        return ('unix', address)
+    host, _, port = address.rpartition(':')
+    host = host.strip('[]') or '127.0.0.1'
+    if not allow_remote and not is_loopback(host):
+        raise ValueError(f'{host} is not a loopback address; anyone who can reach it '
+                         f'would see every keystroke')
+    return ('ws', host, int(port))
+
+
+def _local_origin(origin):
+    """True for an http(s) page served from this machine."""
+    try:
+        parts = urlsplit(origin)
+        return parts.scheme in ('http', 'https') and is_loopback(parts.hostname or '')
+    except ValueError:
+        return False
+
+
+def _ws_frame(payload):
+    """An unmasked, final WebSocket text frame."""
+    size = len(payload)
+    if size < 126:
+        header = bytes((0x81, size))
+    elif size < 1 << 16:
+        header = bytes((0x81, 126)) + size.to_bytes(2, 'big')
+    else:
+        header = bytes((0x81, 127)) + size.to_bytes(8, 'big')
+    return header + payload
+
+
+def _line(payload):
+    return payload + b'\n'
+
+
+class _Client:
+    __slots__ = ('writer', 'encode', 'pending', 'dropped', 'lagging')
+
+    def __init__(self, writer, encode):
+        self.writer = writer
+        self.encode = encode
+        self.pending = []
+        self.dropped = 0
+        self.lagging = False
+
+    def backlog(self):
+        return self.writer.transport.get_write_buffer_size()
+
+    def send(self, payload):
+        self.writer.write(self.encode(payload))
+
+
+class StreamServer:
+    """Serve display intents to local subscribers, batched per frame."""
+
+    FPS = 60
+    HIGH_WATER = 256 << 10
+    MAX_PENDING = 1024
+    INCOMING_SIZE = 1 << 16
+
+    def __init__(self, address, fps=None, origins=(), allow_remote=False):
+        self.address = parse_address(address, allow_remote)
+        # Web page origins allowed besides those on this machine
+        self.origins = {origin.rstrip('/').lower() for origin in origins}
+        self.interval = 1.0 / (fps or self.FPS)
+        self.state = {'text': None, 'icon': None, 'action': None, 'mouse': None, 'selection': None, 'repeat': None,
+                      'scroll': None, 'leds': {}}
+        self.frames = 0
+        self._incoming = collections.deque(maxlen=self.INCOMING_SIZE)
+        self._clients = set()
+        self._handlers = set()
+        self._loop = None
+        self._thread = None
+        self._stopping = None
+        self._wake = None
+        # Set while the frame loop waits for input instead of ticking
+        self._idle = False
+        self._ready = threading.Event()
+        self._error = None
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    def attach(self, input_engine):
+        """Subscribe to ``input_engine`` intents."""
+        input_engine.subscribe(self.publish)
+        return self
+
+    def publish(self, intent):
+        """Queue an intent for the next frame (callable from any thread)."""
+        self._incoming.append(intent)
+        if self._idle:
+            self._idle = False
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def start(self):
+        """Start listening on a background thread; raises OSError on failure."""
+        self._thread = threading.Thread(target=self._run, name='stream-server', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._set_stopping)
+        self._thread.join()
+        self._thread = None
+
+    def _set_stopping(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._serve())
+        finally:
+            self._loop.close()
+
+    async def _serve(self):
+        self._stopping = asyncio.Event()
+        self._wake = asyncio.Event()
+        try:
+            if self.address[0] == 'unix':
+                server = await asyncio.start_unix_server(self._on_line_client, self.address[1])
+            else:
+                server = await asyncio.start_server(self._on_ws_client, self.address[1], self.address[2])
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        next_frame = time.monotonic()
+        try:
+            while not self._stopping.is_set():
+                next_frame += self.interval
+                delay = next_frame - time.monotonic()
+                if delay < 0:
+                    # Fell behind; don't try to catch up with a burst of frames
+                    next_frame = time.monotonic()
+                    delay = 0
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._frame()
+                if not self._incoming:
+                    # Nothing to send: sleep until publish() instead of
+                    # ticking. It checks _idle after queueing, so look at the
+                    # queue again once _idle is set.
+                    self._idle = True
+                    if not self._incoming:
+                        await self._wake.wait()
+                    self._idle = False
+                    self._wake.clear()
+                    # The first frame after a quiet period goes out at once
+                    next_frame = max(next_frame, time.monotonic() - self.interval)
+        finally:
+            server.close()
+            # Abort rather than close: a stalled client would never take the
+            # rest of its buffer. The handlers then read EOF and finish.
+            for client in list(self._clients):
+                client.writer.transport.abort()
+            if self._handlers:
+                await asyncio.wait(list(self._handlers))
+            await server.wait_closed()
+            if self.address[0] == 'unix':
+                try:
+                    os.unlink(self.address[1])
+                except OSError:
+                    pass
+
+    def _frame(self):
+        """Fold queued intents into one message and write it to every client."""
+        incoming = self._incoming
+        if not incoming:
+            return
+        state = self.state
+        items = []
+        mouse = selection = repeat = scroll = None
+        for _ in range(len(incoming)):
+            intent = incoming.popleft()
+            kind = intent[0]
+            if kind == engine.MOUSE:
+                mouse = intent[1:]
+            elif kind == engine.SHOW:
+                state['text'], state['icon'], state['action'] = intent[1], intent[2], None
+                state['repeat'] = repeat = state['scroll'] = scroll = None
+                items.append({'type': 'show', 'text': intent[1], 'icon': intent[2]})
+            elif kind == engine.SHORTCUT:
+                state['text'], state['icon'], state['action'] = intent[1], intent[2], intent[3]
+                state['repeat'] = repeat = state['scroll'] = scroll = None
+                items.append({'type': 'shortcut', 'text': intent[1], 'icon': intent[2],
+                              'action': intent[3]})
+            elif kind == engine.SELECTION:
+                selection = intent[1:]
+            elif kind == engine.REPEAT:
+                repeat = state['repeat'] = {'text': intent[1], 'count': intent[3]}
+            elif kind == engine.SCROLL:
+                scroll = intent
+            elif kind == engine.CLICK:
+                items.append({'type': 'click', 'x': intent[1], 'y': intent[2],
+                              'button': intent[3], 'double': intent[4]})
+            elif kind == engine.SELECTED:
+                items.append({'type': 'selected', 'width': intent[1], 'height': intent[2]})
+            elif kind == engine.LED:
+                state['leds'][intent[1]] = intent[2]
+                items.append({'type': 'led', 'led': intent[1], 'on': intent[2]})
+        if mouse is not None:
+            state['mouse'] = dict(zip(('x', 'y', 'dx', 'dy'), mouse))
+        if selection is not None:
+            state['selection'] = dict(zip(('width', 'height'), selection))
+        if scroll is not None:
+            scroll = state['scroll'] = {'text': scroll[1], 'count': scroll[2], 'action': scroll[3]}
+        self.frames += 1
+
+        now = time.time()
+        shared = None
+        for client in self._clients:
+            if client.backlog() > self.HIGH_WATER:
+                self._hold(client, items)
+                continue
+            if client.lagging:
+                client.send(self._encode(now, client.pending + items, state['mouse'], state['selection'],
+                                         state['repeat'], state['scroll'], client.dropped))
+                client.pending = []
+                client.dropped = 0
+                client.lagging = False
+                continue
+            if shared is None:
+                shared = self._encode(now, items,
+                                      state['mouse'] if mouse is not None else None,
+                                      state['selection'] if selection is not None else None,
+                                      repeat, scroll)
+            client.send(shared)
+
+    def _hold(self, client, items):
+        """Keep a lagging client's discrete events, dropping the oldest."""
+        client.lagging = True
+        pending = client.pending
+        pending.extend(items)
+        excess = len(pending) - self.MAX_PENDING
+        if excess > 0:
+            del pending[:excess]
+            client.dropped += excess
+
+    @staticmethod
+    def _encode(now, items, mouse, selection, repeat=None, scroll=None, dropped=0):
+        message = {'type': 'frame', 'time': now, 'events': items}
+        if mouse is not None:
+            message['mouse'] = mouse
+        if selection is not None:
+            message['selection'] = selection
+        if repeat is not None:
+            message['repeat'] = repeat
+        if scroll is not None:
+            message['scroll'] = scroll
+        if dropped:
+            message['dropped'] = dropped
+        return json.dumps(message, separators=(',', ':')).encode('utf-8')
+
+    def _snapshot(self):
+        message = dict(type='state', **self.state)
+        return json.dumps(message, separators=(',', ':')).encode('utf-8')
+
+    async def _on_line_client(self, reader, writer):
+        await self._serve_client(reader, writer, _line, None)
+
+    async def _on_ws_client(self, reader, writer):
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        key = origin = None
+        for line in request.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            name = name.strip().lower()
+            if name == b'sec-websocket-key':
+                key = value.strip()
+            elif name == b'origin':
+                origin = value.strip().decode('latin-1').rstrip('/').lower()
+        if key is None:
+            writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n')
+            writer.close()
+            return
+        if origin is not None and origin not in self.origins and not _local_origin(origin):
+            # A web page from elsewhere; it must not be able to log keystrokes
+            writer.write(b'HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n')
+            writer.close()
+            return
+        accept = base64.b64encode(hashlib.sha1(key + WS_GUID).digest())
+        writer.write(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        await self._serve_client(reader, writer, _ws_frame, self._ws_closed)
+
+    @staticmethod
+    def _ws_closed(data):
+        # Client frames are ignored, apart from a close frame (opcode 8)
+        return len(data) > 0 and data[0] & 0x0F == 0x8
+
+    async def _serve_client(self, reader, writer, encode, closed):
+        client = _Client(writer, encode)
+        client.send(self._snapshot())
+        self._clients.add(client)
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data or (closed is not None and closed(data)):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(client)
+            self._handlers.discard(task)
+            writer.close()
+
+
+# ---------------------------------------------------------------------------
+# Benchmark against local clients
+
+def _read_client(sock, counts, index):
+    received = 0
+    buffer = b''
+    while True:
+        data = sock.recv(1 << 16)
+        if not data:
+            break
+        buffer += data
+        lines = buffer.split(b'\n')
+        buffer = lines.pop()
+        received += len(lines)
+    counts[index] = received
+
+
+def bench(count=200000, clients=8, scenario='mixed'):
+    """Feed a synthetic stream through an engine attached to a server with
+    ``clients`` reading subscribers and one that never reads."""
+    import tempfile
+
+    from . import bench as benchmarks, events
+    from .engine import InputEngine
+
+    path = os.path.join(tempfile.mkdtemp(), 'input-monitor.sock')
+    server = StreamServer(path)
+    server.start()
+    counts = [0] * clients
+    readers = []
+    for i in range(clients):
+        sock = socket.socket(socket.AF_UNIX)
+        sock.connect(path)
+        thread = threading.Thread(target=_read_client, args=(sock, counts, i), daemon=True)
+        thread.start()
+        readers.append((sock, thread))
+    stalled = socket.socket(socket.AF_UNIX)
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect(path)
+    while server.client_count < clients + 1:
+        time.sleep(0.01)
+
+    input_engine = InputEngine()
+    server.attach(input_engine)
+    records = list(benchmarks.generate(scenario, count))
+    dispatch = events.dispatch
+    start = time.perf_counter()
+    for record in records:
+        dispatch(record, input_engine)
+    elapsed = time.perf_counter() - start
+    time.sleep(10 * server.interval)
+    lagging = [c for c in list(server._clients) if c.lagging]
+    dropped = sum(c.dropped for c in lagging)
+    server.stop()
+    for sock, thread in readers:
+        thread.join(1.0)
+        sock.close()
+    stalled.close()
+    return {
+        'events': count,
+        'events_per_s': count / elapsed,
+        'engine_us_per_event': elapsed / count * 1e6,
+        'frames': server.frames,
+        'messages_per_client': min(counts),
+        'lagging_clients': len(lagging),
+        'lagging_dropped': dropped,
+    }
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m input_monitor.server',
+                                     description='Benchmark the event streaming server.')
+    parser.add_argument('--bench', action='store_true', help='run the benchmark (default)')
+    parser.add_argument('-n', '--count', type=int, default=200000, help='events to feed')
+    parser.add_argument('-c', '--clients', type=int, default=8, help='reading clients')
+    args = parser.parse_args(argv)
+    for key, value in bench(args.count, args.clients).items():
+        print(f'{key:<20} {value:,.1f}' if isinstance(value, float) else f'{key:<20} {value:,}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""Shortcut catalogs and the matcher that names the action behind a chord.
+
+A catalog is a JSON object mapping key sequences to action names, either at
+the top level or under a ``"shortcuts"`` key::
+
+    {"name": "VS Code", "shortcuts": {
+        "Ctrl+Shift+P": "Show Command Palette",
+        "Ctrl+K Ctrl+C": "Add Line Comment"}}
+
+Steps of a sequence are separated by whitespace and keys within a step by
+``+``. Key names are normalized like live key events (``ctrl``, ``Control``
+and ``lctrl`` are all ``Ctrl``), so catalogs written for different tools
+match the same input. Names containing spaces are written without them or
+with ``_``/``-`` (``PageDown``, ``page_down``).
+
+All loaded catalogs are compiled into one trie: a list of dicts mapping a
+normalized chord to the index of the next node, plus the action of each
+node. Matching a key press is therefore a single dict lookup. The compiled
+trie is cached with ``marshal``, keyed on the catalog files' paths, sizes and
+modification times. Restarts with unchanged keymaps skip parsing and
+compilation.
+
+``python -m input_monitor.shortcuts FILE...`` compiles catalogs and reports
+load times.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+
+from . import keys
+from .version import VERSION
+
+CACHE_FORMAT = 1
+
+# Modifier order of normalized chords, whatever order they were pressed in
+MODIFIER_ORDER = ('Ctrl', 'Alt', 'Shift', 'Win')
+
+# Compact spellings used by keymap files -> names format_key_name knows
+ALIASES = {
+    'control': 'ctrl', 'option': 'alt', 'opt': 'alt', 'win': 'windows',
+    'escape': 'esc', 'return': 'enter', 'del': 'delete', 'ins': 'insert',
+    'pageup': 'page up', 'pgup': 'page up', 'pagedown': 'page down', 'pgdn': 'page down',
+    'printscreen': 'print screen', 'prtsc': 'print screen',
+    'capslock': 'caps lock', 'numlock': 'num lock', 'bksp': 'backspace',
+    'arrowup': 'up', 'arrowdown': 'down', 'arrowleft': 'left', 'arrowright': 'right',
+}
+
+
+def chord_key(modifiers, key):
+    """Normalized chord for display-name ``key`` pressed with ``modifiers``."""
+    return '+'.join([m for m in MODIFIER_ORDER if m in modifiers] + [key])
+
+
+def parse_sequence(spec, special_keys):
+    """Normalized chords of a sequence such as ``"Ctrl+K Ctrl+C"``."""
+    chords = []
+    for step in spec.split():
+        tokens = step.split('+')
+        if tokens[-1] == '' and len(tokens) > 1:
+            # "Ctrl++" or "+": the key itself is '+'
+            tokens = tokens[:-2] + ['+']
+        names = []
+        for token in tokens:
+            token = ALIASES.get(token.lower(), token)
+            names.append(keys.format_key_name(token, special_keys))
+        chords.append(chord_key(names[:-1], names[-1]))
+    return chords
+
+
+def read_catalog(path):
+    """Return the ``{sequence: action}`` mapping of a catalog file."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get('shortcuts'), dict):
+        data = data['shortcuts']
+    if not isinstance(data, dict):
+        raise ValueError(f'{path}: expected a JSON object of shortcuts')
+    return data
+
+
+def compile_catalogs(paths, special_keys):
+    """Build ``(nodes, actions)`` from catalog files; later files win."""
+    nodes = [{}]
+    actions = [None]
+    for path in paths:
+        for spec, action in read_catalog(path).items():
+            node = 0
+            for chord in parse_sequence(spec, special_keys):
+                child = nodes[node].get(chord)
+                if child is None:
+                    child = nodes[node][chord] = len(nodes)
+                    nodes.append({})
+                    actions.append(None)
+                node = child
+            if node:
+                actions[node] = str(action)
+    return nodes, actions
+
+
+def default_cache_dir():
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'input-monitor')
+
+
+def _cache_path(paths, cache_dir):
+    key = [CACHE_FORMAT, VERSION]
+    for path in paths:
+        st = os.stat(path)
+        key.append((os.path.abspath(path), st.st_size, st.st_mtime_ns))
+    digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f'shortcuts-{digest}.bin')
+
+
+def load_catalogs(paths, special_keys, cache_dir=None):
+    """Compiled ``(nodes, actions)`` for ``paths``, from the cache when fresh."""
+    cache_dir = cache_dir or default_cache_dir()
+    cache = _cache_path(paths, cache_dir)
+    try:
+        with open(cache, 'rb') as f:
+            # One read; marshal.load() on a file reads in small pieces
+            data = marshal.loads(f.read())
+        if data[0] == CACHE_FORMAT:
+            return data[1], data[2]
+    except (OSError, EOFError, ValueError, TypeError, IndexError):
+        pass
+    nodes, actions = compile_catalogs(paths, special_keys)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f'{cache}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(marshal.dumps((CACHE_FORMAT, nodes, actions)))
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return nodes, actions
+
+
+class ShortcutMatcher:
+    """Walk the shortcut trie one chord at a time.
+
+    A partial sequence is abandoned when the next chord arrives more than
+    ``timeout`` seconds later, or does not continue it (the chord is then
+    matched from the start).
+    """
+
+    TIMEOUT = 1.5
+
+    chord_key = staticmethod(chord_key)
+
+    def __init__(self, nodes, actions, timeout=None):
+        self.nodes = nodes
+        self.actions = actions
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+        self.max_depth = self._max_depth()
+        self._node = 0
+        self._depth = 0
+        self._last = 0.0
+
+    def __len__(self):
+        return sum(action is not None for action in self.actions)
+
+    def _max_depth(self):
+        depth = 0
+        level = [0]
+        while level:
+            level = [child for node in level for child in self.nodes[node].values()]
+            depth += bool(level)
+        return depth
+
+    def feed(self, chord, event_time):
+        """Advance by one chord; return ``(action, steps)`` on a match, else None."""
+        node, depth = self._node, self._depth
+        if node and event_time - self._last > self.timeout:
+            node, depth = 0, 0
+        self._last = event_time
+        nodes = self.nodes
+        child = nodes[node].get(chord)
+        if child is None and node:
+            node, depth = 0, 0
+            child = nodes[0].get(chord)
+        if child is None:
+            self._node, self._depth = 0, 0
+            return None
+        depth += 1
+        if nodes[child]:
+            # Longer sequences continue from here
+            self._node, self._depth = child, depth
+        else:
+            self._node, self._depth = 0, 0
+        action = self.actions[child]
+        return None if action is None else (action, depth)
+
+    def reset(self):
+        self._node, self._depth = 0, 0
+
+
+def main(argv=None):
+    import argparse
+    from .engine import InputEngine
+    parser = argparse.ArgumentParser(prog='python -m input_monitor.shortcuts',
+                                     description='Compile shortcut catalogs and report load times.')
+    parser.add_argument('files', nargs='+', metavar='FILE')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    nodes, actions = compile_catalogs(args.files, InputEngine.SPECIAL_KEYS)
+    compiled = time.perf_counter() - start
+    load_catalogs(args.files, InputEngine.SPECIAL_KEYS)
+    start = time.perf_counter()
+    load_catalogs(args.files, InputEngine.SPECIAL_KEYS)
+    cached = time.perf_counter() - start
+    matcher = ShortcutMatcher(nodes, actions)
+    print(f'{len(matcher):,} shortcuts, {len(nodes):,} trie nodes, sequences up to {matcher.max_depth} steps')
+    print(f'parse + compile {compiled * 1000:.1f} ms, cached load {cached * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Startup phase timing for ``--profile-startup``.
+
+Times are measured from the first import of this module, which
+``input_monitor.app`` does before anything else, so interpreter start-up
+(and unpacking of a frozen build) is not included. Phases may be marked from
+any thread.
+"""
+import sys
+import threading
+import time
+
+STARTED = time.perf_counter()
+
+
+class StartupProfile:
+    """Named marks in the order they were reached."""
+
+    def __init__(self, started=STARTED):
+        self.started = started
+        self.marks = []
+        self._reported = False
+
+    def mark(self, phase):
+        # list.append is atomic, so background threads can mark phases too
+        self.marks.append((phase, time.perf_counter(), threading.current_thread().name))
+
+    def elapsed(self, phase):
+        """Milliseconds from start to ``phase``, or None if not reached."""
+        for name, t, _ in self.marks:
+            if name == phase:
+                return (t - self.started) * 1000
+        return None
+
+    def format_table(self):
+        lines = [f"{'phase':<24}{'at ms':>9}{'+ms':>9}  thread"]
+        previous = self.started
+        for phase, t, thread in sorted(self.marks, key=lambda mark: mark[1]):
+            lines.append(f"{phase:<24}{(t - self.started) * 1000:>9.1f}{(t - previous) * 1000:>9.1f}  {thread}")
+            previous = t
+        return '\n'.join(lines)
+
+    def report(self, file=None):
+        """Print the table once; later calls do nothing."""
+        if self._reported:
+            return
+        self._reported = True
+        print(self.format_table(), file=file or sys.stderr)
@@ -0,0 +1,188 @@
+"""
+Generate input_monitor/icon_data.py with pre-scaled icon images.
+
+Each icon in input_monitor.icons.ICON_FILES is decoded, resampled with an
+area-average filter to every size in BASE_SIZES x VARIANT_SCALES (longest
+side equal to the target size, aspect ratio kept) and embedded as base64 PNG
+data. Only the standard library is used, so this runs on any build machine.
+
+Usage (from the repo root):
+
+    python packaging/build_icons.py
+"""
+import base64
+import os
+import struct
+import sys
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from input_monitor.icons import BASE_SIZES, ICON_FILES, VARIANT_SCALES, variant_size  # noqa: E402
+from input_monitor.png import SIGNATURE as PNG_SIGNATURE, encode_rgba  # noqa: E402
+
+OUTPUT = os.path.join(ROOT, 'input_monitor', 'icon_data.py')
+IMAGES_DIR = os.path.join(ROOT, 'input_monitor', 'images')
+
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    if pb <= pc:
+        return b
+    return c
+
+
+def read_png(path):
+    """Decode an 8-bit, non-interlaced PNG into (width, height, RGBA rows)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError(f'{path}: not a PNG file')
+    pos = 8
+    idat = []
+    palette = trns = None
+    while pos < len(data):
+        length, ctype = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if ctype == b'IHDR':
+            width, height, depth, color, _, _, interlace = struct.unpack('>IIBBBBB', body)
+        elif ctype == b'PLTE':
+            palette = [tuple(body[i:i + 3]) for i in range(0, len(body), 3)]
+        elif ctype == b'tRNS':
+            trns = body
+        elif ctype == b'IDAT':
+            idat.append(body)
+        elif ctype == b'IEND':
+            break
+    if depth != 8 or interlace or color not in CHANNELS:
+        raise ValueError(f'{path}: unsupported PNG format')
+
+    bpp = CHANNELS[color]
+    stride = width * bpp
+    raw = zlib.decompress(b''.join(idat))
+    prev = bytearray(stride)
+    rows = []
+    for y in range(height):
+        offset = y * (stride + 1)
+        filter_type = raw[offset]
+        line = bytearray(raw[offset + 1:offset + 1 + stride])
+        for i in range(stride):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            if filter_type == 1:
+                line[i] = (line[i] + a) & 0xff
+            elif filter_type == 2:
+                line[i] = (line[i] + b) & 0xff
+            elif filter_type == 3:
+                line[i] = (line[i] + ((a + b) >> 1)) & 0xff
+            elif filter_type == 4:
+                line[i] = (line[i] + _paeth(a, b, c)) & 0xff
+        prev = line
+        rows.append(_to_rgba(line, color, palette, trns))
+    return width, height, rows
+
+
+def _to_rgba(line, color, palette, trns):
+    if color == 6:
+        return [tuple(line[i:i + 4]) for i in range(0, len(line), 4)]
+    if color == 2:
+        return [tuple(line[i:i + 3]) + (255,) for i in range(0, len(line), 3)]
+    if color == 4:
+        return [(g, g, g, a) for g, a in zip(line[0::2], line[1::2])]
+    if color == 0:
+        return [(g, g, g, 255) for g in line]
+    alphas = trns or b''
+    return [palette[i] + (alphas[i] if i < len(alphas) else 255,) for i in line]
+
+
+def _weights(src, dst):
+    """Area-average contributions: for each output index, [(src index, weight)]."""
+    ratio = src / dst
+    result = []
+    for i in range(dst):
+        start, end = i * ratio, (i + 1) * ratio
+        j = int(start)
+        taps = []
+        while j < end and j < src:
+            overlap = min(end, j + 1) - max(start, j)
+            if overlap > 0:
+                taps.append((j, overlap / ratio))
+            j += 1
+        result.append(taps)
+    return result
+
+
+def resample(width, height, rows, out_w, out_h):
+    """Area-average resample RGBA rows, weighting colors by alpha."""
+    # Premultiply so transparent pixels don't bleed their color into edges
+    pre = [[(r * a, g * a, b * a, a) for r, g, b, a in row] for row in rows]
+    x_taps = _weights(width, out_w)
+    horiz = []
+    for row in pre:
+        out = []
+        for taps in x_taps:
+            acc = [0.0, 0.0, 0.0, 0.0]
+            for j, w in taps:
+                px = row[j]
+                for k in range(4):
+                    acc[k] += px[k] * w
+            out.append(acc)
+        horiz.append(out)
+    result = []
+    for taps in _weights(height, out_h):
+        out = []
+        for x in range(out_w):
+            acc = [0.0, 0.0, 0.0, 0.0]
+            for j, w in taps:
+                px = horiz[j][x]
+                for k in range(4):
+                    acc[k] += px[k] * w
+            alpha = acc[3]
+            if alpha > 0:
+                out.append(tuple(min(255, int(round(c / alpha))) for c in acc[:3])
+                           + (min(255, int(round(alpha))),))
+            else:
+                out.append((0, 0, 0, 0))
+        result.append(out)
+    return result
+
+
+def build():
+    entries = []
+    for name, filename in ICON_FILES.items():
+        width, height, rows = read_png(os.path.join(IMAGES_DIR, filename))
+        for scale in VARIANT_SCALES:
+            px = variant_size(BASE_SIZES[name], scale)
+            # Longest side is exactly px; the other keeps the aspect ratio
+            factor = px / max(width, height)
+            out_w = max(1, int(round(width * factor)))
+            out_h = max(1, int(round(height * factor)))
+            png = encode_rgba(out_w, out_h, resample(width, height, rows, out_w, out_h))
+            entries.append(((name, px), base64.b64encode(png).decode('ascii')))
+
+    lines = [
+        '"""Pre-scaled icon images. Generated by packaging/build_icons.py; do not edit."""',
+        '',
+        'ICONS = {',
+    ]
+    for key, data in entries:
+        lines.append(f'    {key!r}: (')
+        for i in range(0, len(data), 76):
+            lines.append(f'        {data[i:i + 76]!r}')
+        lines.append('    ),')
+    lines.append('}')
+    with open(OUTPUT, 'w', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    print(f'Wrote {len(entries)} icons to {OUTPUT}')
+
+
+if __name__ == '__main__':
+    build()
@@ -21,6 +21,9 @@ IF NOT EXIST "input_monitor\__main__.py" IF NOT EXIST "packaging\windows\entry_p
 	EXIT /B 1
 )
 
+REM Regenerate the pre-scaled icon data embedded in the package
+py -3 packaging\build_icons.py
+
 REM Build onefile, windowed GUI with no console. Add icon if present.
 REM Ensure images are included by adding them as PyInstaller data entries
 SET ADD_DATA=--add-data "input_monitor/images/mouse-left-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-middle-click.png;input_monitor/images" --add-data "input_monitor/images/mouse-right-click.png;input_monitor/images" --add-data "input_monitor/images/windows-10-logo.png;input_monitor/images"
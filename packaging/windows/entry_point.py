@@ -5,7 +5,11 @@ PyInstaller runs the script as __main__ (executed file), which makes relative
 imports fail. Use a small wrapper that imports the package via absolute import
 and launches it, so PyInstaller has a stable entry point.
 """
+import multiprocessing
+
 from input_monitor.app import main
 
 if __name__ == "__main__":
+    # Lets the frozen exe act as the hook child process (--backend process)
+    multiprocessing.freeze_support()
     main()
@@ -38,7 +38,8 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    # UPX-packed binaries are decompressed on every launch; startup matters more than size
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -50,7 +51,7 @@ coll = COLLECT(
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     name='input-monitor',
 )
@@ -0,0 +1,74 @@
+"""CaptionTrack cue timing."""
+from input_monitor import captions, engine
+
+
+class FakeEngine:
+    def __init__(self):
+        self.event_time = None
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+
+class FakeWriter:
+    def __init__(self):
+        self.cues = []
+
+    def put(self, start, end, text):
+        self.cues.append((round(start, 6), round(end, 6), text))
+
+    def close(self):
+        pass
+
+
+def _track(origin=100.0):
+    input_engine = FakeEngine()
+    writer = FakeWriter()
+    track = captions.CaptionTrack(writer, origin).attach(input_engine)
+
+    def emit(t, intent):
+        input_engine.event_time = origin + t
+        track.on_intent(intent)
+
+    return track, writer, emit
+
+
+def test_burst_under_min_cue_starts_with_its_text():
+    track, writer, emit = _track()
+    emit(0.0, (engine.SHOW, 'A', None))
+    emit(0.5, (engine.REPEAT, 'A', None, 2))
+    emit(0.52, (engine.REPEAT, 'A', None, 3))
+    track.close()
+    # "A ×2" was on screen for 20 ms: "A" lasts until "A ×3" appears
+    assert writer.cues == [
+        (0.0, 0.52, 'A'),
+        (0.52, 0.52 + captions.RESET_DELAY_S, 'A ×3'),
+    ]
+
+
+def test_partial_chord_after_reset_is_dropped():
+    track, writer, emit = _track()
+    emit(0.0, (engine.SHOW, 'Ctrl + ...', None))
+    emit(0.03, (engine.SHOW, 'Ctrl + C', None))
+    track.close()
+    assert writer.cues == [(0.03, 0.03 + captions.RESET_DELAY_S, 'Ctrl + C')]
+
+
+def test_fast_stream_is_captioned_throughout():
+    track, writer, emit = _track()
+    emit(0.0, (engine.SHOW, 'A', None))
+    shown = {'A': 0.0}
+    for count in range(2, 32):
+        t = round(0.5 + (count - 2) / 30, 6)
+        shown[f'A ×{count}'] = t
+        emit(t, (engine.REPEAT, 'A', None, count))
+    track.close()
+    # Contiguous cues, each starting when its text appeared
+    for (_, end, _), (start, _, _) in zip(writer.cues, writer.cues[1:]):
+        assert end == start
+    for start, end, text in writer.cues:
+        assert start == shown[text]
+    assert writer.cues[0][2] == 'A'
+    assert writer.cues[-1][2] == 'A ×31'
+    assert len(writer.cues) >= 10
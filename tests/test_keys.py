@@ -0,0 +1,32 @@
+"""KeyNameTable against the reference formatting."""
+from input_monitor import keys
+from input_monitor.engine import InputEngine
+
+
+def _table():
+    return keys.KeyNameTable(InputEngine.SPECIAL_KEYS, InputEngine.WIN_SCAN_CODES)
+
+
+def _reference(raw_name, scan_code):
+    name = keys.normalize_win_key(raw_name, scan_code, InputEngine.WIN_SCAN_CODES)
+    return keys.format_key_name(name, InputEngine.SPECIAL_KEYS)
+
+
+def test_seeded_cache_matches_normalize_win_key():
+    table = _table()
+    raw_names = {raw_name for raw_name, _ in table._cache}
+    assert raw_names
+    for alias in keys.WIN_ALT_ALIASES:
+        raw_names.update(keys._spellings(alias))
+    for raw_name in raw_names:
+        for scan_code in sorted(InputEngine.WIN_SCAN_CODES) + [56, 100, None]:
+            assert table.lookup(raw_name, scan_code) == _reference(raw_name, scan_code), (raw_name, scan_code)
+
+
+def test_seeded_cache_survives_eviction():
+    table = _table()
+    for i in range(table.CACHE_SIZE + 1):
+        table.lookup(f'key{i}', i)
+    for raw_name in keys._spellings('alt gr'):
+        for scan_code in InputEngine.WIN_SCAN_CODES:
+            assert table.lookup(raw_name, scan_code) == _reference(raw_name, scan_code)
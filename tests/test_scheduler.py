@@ -0,0 +1,122 @@
+"""Scheduler backoff, driven by a fake Tk root on a simulated clock."""
+import heapq
+import types
+
+import pytest
+
+from input_monitor import leds, scheduler
+
+
+class FakeRoot:
+    """``after``/``after_cancel`` on a simulated clock, with no file handlers.
+
+    Like Tk on Windows, it cannot watch a wake pipe.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.tk = object()
+        self._jobs = []
+        self._cancelled = set()
+        self._ids = 0
+
+    def monotonic(self):
+        return self.now
+
+    def after(self, delay_ms, callback):
+        self._ids += 1
+        heapq.heappush(self._jobs, (self.now + delay_ms / 1000, self._ids, callback))
+        return self._ids
+
+    def after_cancel(self, job):
+        self._cancelled.add(job)
+
+    def run_until(self, t):
+        while self._jobs and self._jobs[0][0] <= t:
+            when, job, callback = heapq.heappop(self._jobs)
+            if job in self._cancelled:
+                continue
+            self.now = max(self.now, when)
+            callback()
+        self.now = t
+
+
+class FakeLedBackend:
+    def __init__(self, root):
+        self.root = root
+        self.caps = False
+        self.reads = 0
+
+    def fileno(self):
+        return None
+
+    def read(self):
+        self.reads += 1
+        return (self.caps, False, False)
+
+    def drain_events(self):
+        return False
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def root(monkeypatch):
+    root = FakeRoot()
+    monkeypatch.setattr(scheduler, 'time', types.SimpleNamespace(monotonic=root.monotonic))
+    return root
+
+
+@pytest.mark.parametrize('events_idle_ms', [120, 15])
+def test_led_follows_input_after_idle_without_wake_pipe(root, events_idle_ms):
+    sched = scheduler.Scheduler(root)
+    assert not sched.can_wake
+    queued = []
+
+    def process_events():
+        found = bool(queued)
+        queued.clear()
+        return found
+
+    sched.poll('events', process_events, 15, events_idle_ms, wakeable=True)
+    backend = FakeLedBackend(root)
+    changes = []
+    monitor = leds.LedMonitor(root, lambda led_id, is_on: changes.append((root.now, led_id, is_on)),
+                              backend, scheduler=sched)
+    monitor.start()
+    changes.clear()
+
+    # Quiet long enough for both polls to back off fully
+    root.run_until(30.0)
+    assert sched._polls['leds'].interval_ms == leds.LedMonitor.IDLE_POLL_MS
+    reads = backend.reads
+    root.run_until(40.0)
+    assert backend.reads - reads <= 10 / (leds.LedMonitor.IDLE_POLL_MS / 1000) + 1
+
+    # Caps Lock pressed: the key event is queued and the LED turns on
+    pressed = 40.05
+    root.run_until(pressed)
+    queued.append('caps lock')
+    backend.caps = True
+    root.run_until(pressed + 3.0)
+    assert len(changes) == 1
+    when, led_id, is_on = changes[0]
+    assert is_on
+    # Seen by the first events poll after the press, not the next LED poll
+    assert when - pressed <= events_idle_ms / 1000 + scheduler.Scheduler.SLACK_S
+
+
+def test_events_poll_backs_off_without_wake_pipe(root):
+    sched = scheduler.Scheduler(root)
+    runs = []
+
+    def process_events():
+        runs.append(root.now)
+        return False
+
+    sched.poll('events', process_events, 15, 120, wakeable=True)
+    root.run_until(10.0)
+    idle_runs = [t for t in runs if t >= 5.0]
+    # Every 120 ms once idle, not every 15 ms
+    assert len(idle_runs) <= 5.0 / 0.120 + 1